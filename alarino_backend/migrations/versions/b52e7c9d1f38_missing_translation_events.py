@@ -0,0 +1,78 @@
+"""add missing_translation_events and missing_translation_daily_counts
+
+Revision ID: b52e7c9d1f38
+Revises: f0e8d3a4c612
+Create Date: 2026-05-02
+
+Implements the "per-request telemetry" follow-up from the schema evolution
+plan (docs/plans/schema_evolution_plan.md, Out of Scope).
+
+missing_translation_events is an append-only log of translate() misses,
+written off the request thread. A rollup job
+(alarino_backend.data.rollup_missing_translations) periodically folds
+events into missing_translation_daily_counts and into the existing
+missing_translations counter, then deletes them. missing_translations
+keeps its role as the unique-per-tuple all-time counter.
+
+No backfill: per-day history starts when the events sink is enabled.
+
+REVERSIBILITY:
+    Fully reversible. Downgrade drops both tables. Counts already rolled
+    into missing_translations stay there; un-rolled events and the per-day
+    history are lost.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b52e7c9d1f38"
+down_revision = "f0e8d3a4c612"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "missing_translation_events",
+        sa.Column("ev_id", sa.Integer(), primary_key=True),
+        sa.Column("text", sa.String(length=200), nullable=False),
+        sa.Column("source_language", sa.String(length=3), nullable=False),
+        sa.Column("target_language", sa.String(length=3), nullable=False),
+        sa.Column("user_agent", sa.Text(), nullable=True),
+        sa.Column(
+            "requested_at",
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.CheckConstraint(
+            "source_language IN ('en', 'yo')",
+            name="ck_missing_translation_events_source_language_valid",
+        ),
+        sa.CheckConstraint(
+            "target_language IN ('en', 'yo')",
+            name="ck_missing_translation_events_target_language_valid",
+        ),
+    )
+
+    op.create_table(
+        "missing_translation_daily_counts",
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("text", sa.String(length=200), primary_key=True),
+        sa.Column("source_language", sa.String(length=3), primary_key=True),
+        sa.Column("target_language", sa.String(length=3), primary_key=True),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.CheckConstraint(
+            "source_language IN ('en', 'yo')",
+            name="ck_missing_translation_daily_counts_source_language_valid",
+        ),
+        sa.CheckConstraint(
+            "target_language IN ('en', 'yo')",
+            name="ck_missing_translation_daily_counts_target_language_valid",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("missing_translation_daily_counts")
+    op.drop_table("missing_translation_events")
@@ -0,0 +1,68 @@
+"""add search_documents for full-text search over proverbs and examples
+
+Revision ID: c3d9e1a7b25f
+Revises: b52e7c9d1f38
+Create Date: 2026-05-06
+
+One row per searchable text field (proverbs.yoruba_text/english_text,
+examples.example_source/example_target), holding the NFC text (``body``)
+and its diacritic-folded form (``folded``). See
+alarino_backend.full_text_search.
+
+    Postgres  regular table with a generated ``search_vector`` tsvector
+              (setweight A on body, B on folded, 'simple' config: no
+              stemming, which is wrong for Yoruba) and a GIN index on it.
+    SQLite    FTS5 virtual table with the unicode61 tokenizer and
+              remove_diacritics 0, for local dev databases.
+
+The folded form is computed in Python (no unaccent extension required), so
+this migration only creates the table. Backfill afterwards with:
+
+    python -m alarino_backend.data.rebuild_search_index
+
+REVERSIBILITY:
+    Fully reversible. Downgrade drops the table; it is derived data and
+    can be rebuilt at any time.
+"""
+from alembic import op
+
+
+revision = "c3d9e1a7b25f"
+down_revision = "b52e7c9d1f38"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            """
+            CREATE TABLE search_documents (
+                doc_type VARCHAR(16) NOT NULL,
+                doc_id INTEGER NOT NULL,
+                field VARCHAR(32) NOT NULL,
+                language VARCHAR(3),
+                body TEXT NOT NULL,
+                folded TEXT NOT NULL,
+                search_vector TSVECTOR GENERATED ALWAYS AS (
+                    setweight(to_tsvector('simple', body), 'A')
+                    || setweight(to_tsvector('simple', folded), 'B')
+                ) STORED,
+                PRIMARY KEY (doc_type, doc_id, field)
+            )
+            """
+        )
+        op.execute(
+            "CREATE INDEX ix_search_documents_search_vector "
+            "ON search_documents USING GIN (search_vector)"
+        )
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE search_documents USING fts5("
+            "doc_type UNINDEXED, doc_id UNINDEXED, field UNINDEXED, language UNINDEXED, "
+            "body, folded, tokenize = 'unicode61 remove_diacritics 0')"
+        )
+
+
+def downgrade():
+    op.execute("DROP TABLE IF EXISTS search_documents")
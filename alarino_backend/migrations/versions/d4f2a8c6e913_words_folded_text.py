@@ -0,0 +1,67 @@
+"""add words.folded_text for diacritic-insensitive lookup
+
+Revision ID: d4f2a8c6e913
+Revises: c3d9e1a7b25f
+Create Date: 2026-05-08
+
+translate() matches Word.text exactly (NFC), so "omo" misses "ọmọ" and the
+miss is recorded in missing_translations. folded_text holds the same text
+with every combining mark (tone marks, under-dots) removed and lowercased
+(alarino_backend.normalization.fold_diacritics), indexed together with
+language so a miss can be answered with the real forms in one read.
+
+The app keeps the column in step on every ORM and Core insert. The server
+default '' only covers raw SQL inserts; such rows are found by exact text
+until alarino_backend.data.backfill_folded_words re-folds them.
+
+Strategy:
+    1. Add folded_text NOT NULL DEFAULT ''.
+    2. Fold every existing words.text in Python and UPDATE in batches.
+    3. Create idx_words_language_folded_text (language, folded_text).
+
+REVERSIBILITY:
+    Fully reversible. Downgrade drops the index and the column; the value
+    is derived from text.
+"""
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d4f2a8c6e913"
+down_revision = "c3d9e1a7b25f"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _fold(text):
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return unicodedata.normalize("NFC", stripped)
+
+
+def upgrade():
+    op.add_column(
+        "words",
+        sa.Column("folded_text", sa.String(length=200), nullable=False, server_default=""),
+    )
+
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT w_id, text FROM words")).fetchall()
+    update = sa.text("UPDATE words SET folded_text = :folded_text WHERE w_id = :w_id")
+    for start in range(0, len(rows), BATCH_SIZE):
+        bind.execute(
+            update,
+            [{"w_id": w_id, "folded_text": _fold(text)} for w_id, text in rows[start:start + BATCH_SIZE]],
+        )
+
+    op.create_index("idx_words_language_folded_text", "words", ["language", "folded_text"])
+
+
+def downgrade():
+    op.drop_index("idx_words_language_folded_text", table_name="words")
+    with op.batch_alter_table("words", schema=None) as batch_op:
+        batch_op.drop_column("folded_text")
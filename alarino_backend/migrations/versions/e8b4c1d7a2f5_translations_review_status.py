@@ -0,0 +1,58 @@
+"""add translations.review_status for the LLM review queue
+
+Revision ID: e8b4c1d7a2f5
+Revises: d4f2a8c6e913
+Create Date: 2026-05-10
+
+/api/translate/llm answers are stored as provisional Translation rows
+(provenance "llm:<model>", confidence set) so the next lookup of the same
+word is served by /api/translate. review_status separates them from
+curated rows: 'approved' (every existing row, and the default) or
+'pending'. Admins promote pending rows to approved or reject them, which
+deletes the row.
+
+Strategy:
+    1. Add review_status NOT NULL DEFAULT 'approved' with a CHECK on the
+       two values.
+    2. Create idx_translations_pending, a partial index on created_at
+       WHERE review_status = 'pending', for the review queue listing.
+
+REVERSIBILITY:
+    Reversible, but downgrade cannot tell pending rows from curated ones
+    once the column is gone. It therefore deletes pending rows first, so
+    unreviewed LLM output does not silently become curated data.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e8b4c1d7a2f5"
+down_revision = "d4f2a8c6e913"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("translations", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("review_status", sa.String(length=10), nullable=False, server_default="approved")
+        )
+        batch_op.create_check_constraint(
+            "ck_translations_review_status_valid", "review_status IN ('approved', 'pending')"
+        )
+
+    op.create_index(
+        "idx_translations_pending",
+        "translations",
+        ["created_at"],
+        postgresql_where=sa.text("review_status = 'pending'"),
+        sqlite_where=sa.text("review_status = 'pending'"),
+    )
+
+
+def downgrade():
+    op.execute("DELETE FROM translations WHERE review_status = 'pending'")
+    op.drop_index("idx_translations_pending", table_name="translations")
+    with op.batch_alter_table("translations", schema=None) as batch_op:
+        batch_op.drop_constraint("ck_translations_review_status_valid", type_="check")
+        batch_op.drop_column("review_status")
@@ -0,0 +1,57 @@
+"""add bulk_upload_jobs for asynchronous bulk uploads
+
+Revision ID: f3a9d2c5b817
+Revises: e8b4c1d7a2f5
+Create Date: 2026-05-12
+
+A large /api/admin/bulk-upload used to run inside one HTTP request, which
+GUNICORN_TIMEOUT could kill before the single commit at the end. Every
+pair was then rolled back. With "async": true the upload is stored as a
+job row instead, and a background worker commits it chunk by chunk. The
+worker updates the row's counters as it goes, and
+GET /api/admin/jobs/<id> reads them.
+
+Strategy:
+    1. Create bulk_upload_jobs with a CHECK on status.
+
+REVERSIBILITY:
+    Fully reversible. Downgrade drops the table. Job history is lost, but
+    the words and translations the jobs wrote are kept.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f3a9d2c5b817"
+down_revision = "e8b4c1d7a2f5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "bulk_upload_jobs",
+        sa.Column("job_id", sa.String(length=32), nullable=False),
+        sa.Column("status", sa.String(length=10), nullable=False, server_default="queued"),
+        sa.Column("dry_run", sa.Boolean(), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("total_rows", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("processed_rows", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("successful_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("failed_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("translations_created", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("failed_pairs", sa.JSON(), nullable=False),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False, server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("job_id"),
+        sa.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name="ck_bulk_upload_jobs_status_valid",
+        ),
+    )
+
+
+def downgrade():
+    op.drop_table("bulk_upload_jobs")
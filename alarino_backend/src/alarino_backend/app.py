@@ -1,22 +1,42 @@
+import json
 import os
 from functools import wraps
 from typing import Any, Dict
 
 from dotenv import load_dotenv
-from flask import Blueprint, Flask, jsonify, request
+from flask import Blueprint, Flask, Response, jsonify, make_response, request, stream_with_context
 from flask_cors import CORS
 
+from alarino_backend.bulk_upload import open_csv_stream
+from alarino_backend.bulk_upload_jobs import bulk_upload_jobs
 from alarino_backend.flask_extensions import db, migrate
 from alarino_backend.languages import Language
-from alarino_backend.response import APIResponse
+from alarino_backend.lexicon_snapshot import lexicon_snapshot
+from alarino_backend.llm_cache import llm_translation_cache
+from alarino_backend.missing_translations import missing_translation_buffer, missing_translation_events
+from alarino_backend.proverbs import proverb_sampler
+from alarino_backend.response import APIResponse, StatsResponseData
 from alarino_backend.runtime import _daily_word_cache, get_allowed_origins, logger
+from alarino_backend.translation_cache import translation_cache
 from alarino_backend.translation_service import (
     bulk_upload_words,
+    get_bulk_upload_job,
+    get_missing_translations_report,
+    get_review_queue,
+    get_proverb_of_the_hour,
     get_random_proverb,
     get_sitemap_words,
     get_word_of_the_day,
+    review_llm_translations,
+    search_proverbs,
+    search_text,
+    stream_bulk_upload_words,
+    submit_bulk_upload_job,
+    suggest_words,
     translate,
+    translate_batch,
     translate_llm,
+    translate_phrase,
 )
 
 api_bp = Blueprint("api", __name__)
@@ -79,6 +99,35 @@ def get_translation(text: str, source_language: Language, target_language: Langu
     return jsonify(response), status
 
 
+@api_bp.route("/api/translate/batch", methods=["POST"])
+def get_batch_translation():
+    data: Dict[str, Any] | None = request.get_json(silent=True)
+    if not isinstance(data, dict) or not isinstance(data.get("items"), list):
+        return APIResponse.error("Invalid request body, 'items' must be a list.", 400).as_response()
+
+    logger.info("got batch translation request: \t%d items", len(data["items"]))
+    response, status = translate_batch(
+        db,
+        data["items"],
+        request.headers.get("User-Agent", "unknown"),
+    )
+    return jsonify(response), status
+
+
+@api_bp.route("/api/translate/phrase", methods=["POST"])
+@require_translation_params
+def get_phrase_translation(text: str, source_language: Language, target_language: Language):
+    logger.info("got phrase translation request: \t%s", text)
+    response, status = translate_phrase(
+        db,
+        text,
+        source_language,
+        target_language,
+        request.headers.get("User-Agent", "unknown"),
+    )
+    return jsonify(response), status
+
+
 @api_bp.route("/api/translate/llm", methods=["POST"])
 @require_translation_params
 def get_llm_translation(text: str, source_language: Language, target_language: Language):
@@ -91,12 +140,35 @@ def get_llm_translation(text: str, source_language: Language, target_language: L
     return jsonify(response), status
 
 
+@api_bp.route("/api/suggest", methods=["GET"])
+def suggest():
+    try:
+        language = Language(request.args.get("lang", Language.ENGLISH.value))
+    except ValueError:
+        return APIResponse.error("Unsupported language.", 400).as_response()
+    limit = request.args.get("limit", 10, type=int)
+    response, status = suggest_words(db, request.args.get("prefix", ""), language, limit)
+    return jsonify(response), status
+
+
 @api_bp.route("/api/daily-word", methods=["GET"])
 def word_of_day():
     logger.info("Word of the day request received")
 
     response, status = get_word_of_the_day(db, _daily_word_cache)
-    return jsonify(response), status
+    http_response = make_response(jsonify(response), status)
+    if status != 200:
+        return http_response
+
+    # The word only changes at midnight: let browsers and Caddy keep it until
+    # then and revalidate with If-None-Match.
+    today = _daily_word_cache.today()
+    entry = _daily_word_cache.get(today)
+    if entry is not None:
+        http_response.set_etag(_daily_word_cache.etag(today, entry))
+    http_response.cache_control.public = True
+    http_response.cache_control.max_age = _daily_word_cache.max_age()
+    return http_response.make_conditional(request)
 
 
 @api_bp.route("/api/proverb", methods=["GET"])
@@ -106,9 +178,58 @@ def get_proverb():
     return jsonify(response), status
 
 
+@api_bp.route("/api/proverb/hourly", methods=["GET"])
+def get_hourly_proverb():
+    logger.info("Proverb of the hour request received")
+    response, status = get_proverb_of_the_hour(db)
+    http_response = make_response(jsonify(response), status)
+    if status != 200:
+        return http_response
+
+    hourly = proverb_sampler.current()
+    if hourly is not None:
+        http_response.set_etag(proverb_sampler.etag(hourly))
+    http_response.cache_control.public = True
+    http_response.cache_control.max_age = proverb_sampler.max_age()
+    return http_response.make_conditional(request)
+
+
+@api_bp.route("/api/proverbs/search", methods=["GET"])
+def proverb_search():
+    q = request.args.get("q", "")
+    logger.info(f"Proverb search request received: {q}")
+    try:
+        language = Language(request.args.get("lang", Language.YORUBA.value))
+    except ValueError:
+        return APIResponse.error("Unsupported language.", 400).as_response()
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+    response, status = search_proverbs(db, q, language, page, per_page)
+    return jsonify(response), status
+
+
+@api_bp.route("/api/search", methods=["GET"])
+def text_search():
+    q = request.args.get("q", "")
+    logger.info(f"Search request received: {q}")
+    language = None
+    if request.args.get("lang"):
+        try:
+            language = Language(request.args["lang"])
+        except ValueError:
+            return APIResponse.error("Unsupported language.", 400).as_response()
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 20, type=int)
+    response, status = search_text(db, q, language, request.args.get("type") or None, page, per_page)
+    return jsonify(response), status
+
+
 @api_bp.route("/api/admin/bulk-upload", methods=["POST"])
 @admin_required
 def admin_bulk_upload():
+    if request.mimetype == "text/csv":
+        return _stream_bulk_upload()
+
     data: Dict[str, Any] | None = request.get_json()
     if not data or "text_input" not in data:
         return APIResponse.error("Invalid request body, 'text_input' is required.", 400).as_response()
@@ -116,7 +237,74 @@ def admin_bulk_upload():
     text_input = data["text_input"]
     dry_run = data.get("dry_run", True)
 
-    response, status = bulk_upload_words(db, text_input, dry_run)
+    if data.get("async"):
+        response, status = submit_bulk_upload_job(db, text_input, dry_run)
+    else:
+        response, status = bulk_upload_words(db, text_input, dry_run)
+    return jsonify(response), status
+
+
+def _stream_bulk_upload():
+    """``text/csv`` body (``Content-Encoding: gzip`` allowed), answered as
+    NDJSON records while it is read; ``?dry_run=false`` stores the pairs."""
+    if request.content_encoding not in (None, "", "identity", "gzip"):
+        return APIResponse.error("Unsupported Content-Encoding; send plain or gzip CSV.", 415).as_response()
+    dry_run = request.args.get("dry_run", "true").lower() not in ("0", "false", "no")
+    lines = open_csv_stream(request.stream, gzipped=request.content_encoding == "gzip")
+    records = stream_bulk_upload_words(db, lines, dry_run)
+    return Response(
+        stream_with_context(json.dumps(record, ensure_ascii=False) + "\n" for record in records),
+        mimetype="application/x-ndjson",
+    )
+
+
+@api_bp.route("/api/admin/jobs/<job_id>", methods=["GET"])
+@admin_required
+def admin_job_status(job_id: str):
+    response, status = get_bulk_upload_job(db, job_id)
+    return jsonify(response), status
+
+
+@api_bp.route("/api/admin/stats", methods=["GET"])
+@admin_required
+def admin_stats():
+    response_data = StatsResponseData(
+        translation_cache=translation_cache.stats(),
+        llm_cache=llm_translation_cache.stats(),
+        lexicon_snapshot=lexicon_snapshot.stats(),
+        missing_translations=missing_translation_buffer.stats(),
+        missing_translation_events=missing_translation_events.stats(),
+    )
+    response, status = APIResponse.success("Stats fetched successfully.", response_data).as_response()
+    return jsonify(response), status
+
+
+@api_bp.route("/api/admin/missing-translations", methods=["GET"])
+@admin_required
+def admin_missing_translations():
+    days = request.args.get("days", 7, type=int)
+    limit = request.args.get("limit", 50, type=int)
+    response, status = get_missing_translations_report(db, days, limit)
+    return jsonify(response), status
+
+
+@api_bp.route("/api/admin/review-queue", methods=["GET"])
+@admin_required
+def admin_review_queue():
+    page = request.args.get("page", 1, type=int)
+    per_page = request.args.get("per_page", 50, type=int)
+    response, status = get_review_queue(db, page, per_page)
+    return jsonify(response), status
+
+
+@api_bp.route("/api/admin/review-queue", methods=["POST"])
+@admin_required
+def admin_review_translations():
+    data: Dict[str, Any] | None = request.get_json(silent=True)
+    if not isinstance(data, dict) or "action" not in data or "ids" not in data:
+        return APIResponse.error("Invalid request body, 'action' and 'ids' are required.", 400).as_response()
+
+    response, status = review_llm_translations(db, data["ids"], data["action"])
     return jsonify(response), status
 
 
@@ -160,6 +348,10 @@ def create_app() -> Flask:
         import alarino_backend.db_models  # noqa: F401
 
     register_routes(app)
+    lexicon_snapshot.start(app)
+    missing_translation_buffer.start(app)
+    missing_translation_events.start(app)
+    bulk_upload_jobs.start(app)
     return app
 
 
@@ -0,0 +1,250 @@
+# bulk_upload.py
+"""Set-based engine behind /api/admin/bulk-upload.
+
+The payload is ``english,yoruba`` CSV, one translation pair per line. A
+JSON upload is parsed and validated in full before anything is written,
+then stored in chunks of ``BULK_CHUNK_SIZE`` pairs; a streamed ``text/csv``
+body (parse_bulk_lines over open_csv_stream) is read one chunk at a time. Each chunk takes a fixed number
+of statements, however many pairs it holds:
+
+1. one ``(language, text) IN (...)`` SELECT for the words that exist, and
+   one ``INSERT ... ON CONFLICT DO NOTHING RETURNING`` for the rest (a word
+   inserted concurrently by someone else is re-selected);
+2. one SELECT for the senses of every word, and one INSERT for the default
+   senses of words that have none;
+3. one ``INSERT ... ON CONFLICT (source_sense_id, target_sense_id) DO
+   NOTHING RETURNING`` for the translations, so pairs that already exist
+   are skipped by the unique constraint instead of being looked up first.
+
+The INSERTs are executed with a list of parameter sets, which SQLAlchemy's
+"insertmanyvalues" mode sends as multi-row VALUES batches from a statement
+compiled once; building one literal multi-row ``.values()`` would instead
+recompile (slowly, in Python) for every chunk.
+
+The result matches create_translation() row for row: an English → Yoruba
+Translation between the two words' default senses. A pair whose word
+already has several senses is reported as failed, like the
+AmbiguousSenseError create_translation() raises. The caller commits; words
+whose translations changed are recorded with lexicon_changes so caches are
+invalidated on commit.
+"""
+
+import csv
+import gzip
+import io
+from itertools import islice
+from typing import BinaryIO, Iterable, Iterator, NamedTuple, TextIO
+
+from sqlalchemy import tuple_
+
+from alarino_backend.data.seed_data_utils import is_valid_english_word, is_valid_yoruba_word
+from alarino_backend.db_models import Sense, Translation, Word
+from alarino_backend.flask_extensions import dialect_insert
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import record_word_changes
+from alarino_backend.normalization import fold_diacritics, normalize_word_text
+
+BULK_CHUNK_SIZE = 1000
+
+WordKey = tuple[str, str]
+
+
+class BulkPair(NamedTuple):
+    """One valid CSV row. ``index`` is its position among the non-empty
+    rows, used to report results in input order."""
+
+    index: int
+    line: str
+    english: str
+    yoruba: str
+
+    def as_dict(self) -> dict:
+        return {"english": self.english, "yoruba": self.yoruba}
+
+
+class BulkFailure(NamedTuple):
+    index: int
+    line: str
+    reason: str
+
+    def as_dict(self) -> dict:
+        return {"line": self.line, "reason": self.reason}
+
+
+def parse_row(index: int, row: list[str]) -> BulkPair | BulkFailure:
+    """Validate one CSV row the way add_word() would validate its words."""
+    line = ",".join(row)
+    if len(row) != 2:
+        return BulkFailure(index, line, "Invalid format: each line must contain exactly two values")
+
+    english, yoruba = [item.strip().lower() for item in row]
+    if not is_valid_english_word(english):
+        return BulkFailure(index, line, f"Invalid English word: '{english}'")
+    if not is_valid_yoruba_word(yoruba):
+        return BulkFailure(index, line, f"Invalid Yoruba word: '{yoruba}'")
+    return BulkPair(index, line, english, yoruba)
+
+
+def parse_bulk_upload(text_input: str) -> Iterator[BulkPair | BulkFailure]:
+    """Parse and validate every non-empty CSV row of ``text_input``."""
+    return parse_bulk_lines(io.StringIO(text_input))
+
+
+def parse_bulk_lines(lines: Iterable[str]) -> Iterator[BulkPair | BulkFailure]:
+    """Lazily parse and validate the non-empty CSV rows of ``lines``."""
+    rows = (row for row in csv.reader(lines) if row)
+    for index, row in enumerate(rows):
+        yield parse_row(index, row)
+
+
+def open_csv_stream(stream: BinaryIO, gzipped: bool = False) -> TextIO:
+    """Text view of an uploaded CSV body, decoded incrementally (a UTF-8
+    BOM, as spreadsheet exports write, is skipped)."""
+    if gzipped:
+        stream = gzip.GzipFile(fileobj=stream, mode="rb")
+    return io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+
+
+def chunked(items: Iterable, size: int) -> Iterator[list]:
+    """Lists of up to ``size`` items; ``items`` is consumed lazily."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _resolve_words(db, keys: set[WordKey]) -> dict[WordKey, int]:
+    """``{(language, text): w_id}`` for ``keys``, inserting missing words."""
+    if not keys:
+        return {}
+    word_ids = {
+        (language, text): w_id
+        for w_id, language, text in db.session.query(Word.w_id, Word.language, Word.text)
+        .filter(tuple_(Word.language, Word.text).in_(keys))
+    }
+    missing = keys - word_ids.keys()
+    if missing:
+        table = Word.__table__
+        stmt = (
+            dialect_insert(db.session)(table)
+            .on_conflict_do_nothing(index_elements=["language", "text"])
+            .returning(table.c.w_id, table.c.language, table.c.text)
+        )
+        rows = [
+            {"language": language, "text": text, "folded_text": fold_diacritics(text)}
+            for language, text in sorted(missing)
+        ]
+        for w_id, language, text in db.session.execute(stmt, rows):
+            word_ids[(language, text)] = w_id
+        raced = missing - word_ids.keys()
+        if raced:
+            # Inserted by a concurrent writer between the SELECT and ours.
+            word_ids.update(_resolve_words(db, raced))
+    return word_ids
+
+
+def _resolve_default_senses(db, word_ids: Iterable[int]) -> tuple[dict[int, int], set[int]]:
+    """``({w_id: sense_id}, ambiguous_w_ids)``: each word's only sense,
+    creating a default sense for words that have none. Words with several
+    senses are returned as ambiguous instead."""
+    word_ids = set(word_ids)
+    if not word_ids:
+        return {}, set()
+    senses_by_word: dict[int, list[int]] = {}
+    for word_id, sense_id in db.session.query(Sense.word_id, Sense.sense_id).filter(Sense.word_id.in_(word_ids)):
+        senses_by_word.setdefault(word_id, []).append(sense_id)
+
+    without_sense = sorted(word_ids - senses_by_word.keys())
+    if without_sense:
+        table = Sense.__table__
+        stmt = dialect_insert(db.session)(table).returning(table.c.word_id, table.c.sense_id)
+        for word_id, sense_id in db.session.execute(stmt, [{"word_id": word_id} for word_id in without_sense]):
+            senses_by_word[word_id] = [sense_id]
+
+    default_senses = {word_id: senses[0] for word_id, senses in senses_by_word.items() if len(senses) == 1}
+    return default_senses, word_ids - default_senses.keys()
+
+
+def store_pairs(db, pairs: list[BulkPair]) -> tuple[list[BulkFailure], int]:
+    """Write the words, default senses and translations for ``pairs`` in a
+    fixed number of statements; does not commit. Returns the pairs that
+    could not be stored and how many translations were created."""
+    failures = []
+    created = 0
+    for chunk in chunked(pairs, BULK_CHUNK_SIZE):
+        chunk_failures, chunk_created = _store_chunk(db, chunk)
+        failures.extend(chunk_failures)
+        created += chunk_created
+    return failures, created
+
+
+def _store_chunk(db, pairs: list[BulkPair]) -> tuple[list[BulkFailure], int]:
+    en, yo = Language.ENGLISH.value, Language.YORUBA.value
+    keyed = [
+        (pair, (en, normalize_word_text(pair.english)), (yo, normalize_word_text(pair.yoruba)))
+        for pair in pairs
+    ]
+    word_ids = _resolve_words(db, {key for _, english, yoruba in keyed for key in (english, yoruba)})
+    default_senses, ambiguous = _resolve_default_senses(db, word_ids.values())
+
+    failures = []
+    rows: dict[tuple[int, int], dict] = {}
+    words_by_sense_pair: dict[tuple[int, int], tuple[WordKey, WordKey]] = {}
+    for pair, english, yoruba in keyed:
+        source_id, target_id = word_ids[english], word_ids[yoruba]
+        unclear = [key for key, w_id in ((english, source_id), (yoruba, target_id)) if w_id in ambiguous]
+        if unclear:
+            words = ", ".join(f"{language}:{text!r}" for language, text in unclear)
+            failures.append(BulkFailure(
+                pair.index,
+                pair.line,
+                f"Ambiguous sense: {words} has several senses; cannot pick a default.",
+            ))
+            continue
+        sense_pair = (default_senses[source_id], default_senses[target_id])
+        rows[sense_pair] = {
+            "source_word_id": source_id,
+            "target_word_id": target_id,
+            "source_sense_id": sense_pair[0],
+            "target_sense_id": sense_pair[1],
+        }
+        words_by_sense_pair[sense_pair] = (english, yoruba)
+
+    if not rows:
+        return failures, 0
+    table = Translation.__table__
+    stmt = (
+        dialect_insert(db.session)(table)
+        .on_conflict_do_nothing(index_elements=["source_sense_id", "target_sense_id"])
+        .returning(table.c.source_sense_id, table.c.target_sense_id)
+    )
+    inserted = [tuple(row) for row in db.session.execute(stmt, list(rows.values()))]
+    record_word_changes(
+        db.session,
+        [key for sense_pair in inserted for key in words_by_sense_pair[sense_pair]],
+    )
+    return failures, len(inserted)
+
+
+def process_rows(
+    db, rows: list[BulkPair | BulkFailure], dry_run: bool
+) -> tuple[list[BulkPair], list[BulkFailure], int]:
+    """Store the valid pairs among parsed ``rows`` unless ``dry_run``
+    (without committing). Returns ``(stored_pairs, failures,
+    translations_created)``, both lists in input order."""
+    pairs = [row for row in rows if isinstance(row, BulkPair)]
+    failures = [row for row in rows if isinstance(row, BulkFailure)]
+    created = 0
+    if not dry_run:
+        store_failures, created = store_pairs(db, pairs)
+        failed_indexes = {failure.index for failure in store_failures}
+        pairs = [pair for pair in pairs if pair.index not in failed_indexes]
+        failures = sorted(failures + store_failures)
+    return pairs, failures, created
+
+
+def bulk_upload(db, text_input: str, dry_run: bool) -> tuple[list[dict], list[dict], int]:
+    """Validate ``text_input`` and, unless ``dry_run``, store its pairs
+    (without committing). Returns ``(successful_pairs, failed_pairs,
+    translations_created)`` with both lists in input order."""
+    pairs, failures, created = process_rows(db, list(parse_bulk_upload(text_input)), dry_run)
+    return [pair.as_dict() for pair in pairs], [failure.as_dict() for failure in failures], created
@@ -0,0 +1,164 @@
+# bulk_upload_jobs.py
+"""Background execution of /api/admin/bulk-upload jobs.
+
+submit() stores the payload as a BulkUploadJob row and hands its id to a
+per-worker pool of ``BULK_UPLOAD_WORKERS`` threads, then returns at once.
+A pool thread claims the job with a conditional UPDATE (queued → running),
+so a job runs exactly once even if several workers see it. It then
+processes the rows in chunks of BULK_CHUNK_SIZE. Each chunk's words and
+translations are committed together with the job's updated counters, so
+polls see steady progress. If the job dies, the chunks already committed
+stay, and re-submitting the same payload is safe because the inserts skip
+rows that exist.
+
+When the pool starts it also queues any job still ``queued`` in the
+database, for example one whose worker exited before picking it up. A job
+left ``running`` by a worker that died stays that way and must be
+re-submitted.
+
+With ``BULK_UPLOAD_BACKGROUND=0`` (tests) submit() runs the job inline
+before returning.
+"""
+
+import atexit
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Optional
+
+from alarino_backend.bulk_upload import BULK_CHUNK_SIZE, chunked, parse_bulk_upload, process_rows
+from alarino_backend.db_models import JOB_FAILED, JOB_QUEUED, JOB_RUNNING, JOB_SUCCEEDED, BulkUploadJob
+from alarino_backend.response import BulkUploadJobResponseData
+from alarino_backend.runtime import logger
+
+BULK_UPLOAD_WORKERS = int(os.getenv("BULK_UPLOAD_WORKERS", "2"))
+BULK_UPLOAD_BACKGROUND = os.getenv("BULK_UPLOAD_BACKGROUND", "1") == "1"
+BULK_UPLOAD_MAX_REPORTED_FAILURES = 1000
+
+
+def run_job(db, job_id: str) -> bool:
+    """Claim and run job ``job_id``. Returns False if it was not queued
+    (already claimed, finished or unknown)."""
+    claimed = (
+        BulkUploadJob.query.filter_by(job_id=job_id, status=JOB_QUEUED)
+        .update({"status": JOB_RUNNING, "started_at": datetime.now()}, synchronize_session=False)
+    )
+    db.session.commit()
+    if not claimed:
+        return False
+
+    job = db.session.get(BulkUploadJob, job_id)
+    try:
+        rows = list(parse_bulk_upload(job.payload))
+        job.total_rows = len(rows)
+        db.session.commit()
+        for chunk in chunked(rows, BULK_CHUNK_SIZE):
+            pairs, failures, created = process_rows(db, chunk, job.dry_run)
+            job.processed_rows += len(chunk)
+            job.successful_count += len(pairs)
+            job.failed_count += len(failures)
+            job.translations_created += created
+            room = BULK_UPLOAD_MAX_REPORTED_FAILURES - len(job.failed_pairs)
+            if failures and room > 0:
+                # Reassign: in-place changes to a JSON column aren't tracked.
+                job.failed_pairs = job.failed_pairs + [failure.as_dict() for failure in failures[:room]]
+            db.session.commit()
+        job.status = JOB_SUCCEEDED
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Bulk upload job {job_id} failed: {e}")
+        job = db.session.get(BulkUploadJob, job_id)
+        job.status = JOB_FAILED
+        job.error = str(e)
+    job.payload = ""
+    job.finished_at = datetime.now()
+    db.session.commit()
+    logger.info(
+        f"Bulk upload job {job_id} {job.status}: {job.processed_rows}/{job.total_rows} rows, "
+        f"{job.translations_created} new translations"
+    )
+    return True
+
+
+class BulkUploadJobRunner:
+    def __init__(self, workers: int = BULK_UPLOAD_WORKERS, background: bool = BULK_UPLOAD_BACKGROUND):
+        self.workers = workers
+        self.background = background
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._app = None
+        self._lock = threading.Lock()
+        self.submitted = 0
+
+    def start(self, app) -> None:
+        self._app = app
+        if not self.background or self._executor is not None:
+            return
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bulk-upload")
+        atexit.register(self.stop)
+        try:
+            with app.app_context():
+                from alarino_backend.flask_extensions import db
+
+                queued = [job_id for (job_id,) in db.session.query(BulkUploadJob.job_id).filter_by(status=JOB_QUEUED)]
+                db.session.remove()
+        except Exception as e:
+            # No table yet (fresh database before migrating): nothing to resume.
+            logger.warning(f"Could not resume queued bulk upload jobs: {e}")
+            return
+        for job_id in queued:
+            self._executor.submit(self._run_in_app_context, job_id)
+
+    def submit(self, db, payload: str, dry_run: bool) -> BulkUploadJob:
+        """Store a queued job for ``payload`` and schedule it."""
+        job = BulkUploadJob(job_id=uuid.uuid4().hex, dry_run=dry_run, payload=payload, failed_pairs=[])
+        db.session.add(job)
+        db.session.commit()
+        with self._lock:
+            self.submitted += 1
+        if self._executor is not None:
+            self._executor.submit(self._run_in_app_context, job.job_id)
+        else:
+            run_job(db, job.job_id)
+        return job
+
+    def _run_in_app_context(self, job_id: str) -> None:
+        from alarino_backend.flask_extensions import db
+
+        with self._app.app_context():
+            try:
+                run_job(db, job_id)
+            except Exception as e:
+                logger.error(f"Bulk upload job {job_id} could not be run: {e}")
+            finally:
+                db.session.remove()
+
+    def stop(self) -> None:
+        executor = self._executor
+        if executor is None:
+            return
+        self._executor = None
+        atexit.unregister(self.stop)
+        executor.shutdown(wait=True)
+
+
+def job_response_data(job: BulkUploadJob) -> BulkUploadJobResponseData:
+    return BulkUploadJobResponseData(
+        job_id=job.job_id,
+        status=job.status,
+        dry_run=job.dry_run,
+        total_rows=job.total_rows,
+        processed_rows=job.processed_rows,
+        successful_count=job.successful_count,
+        failed_count=job.failed_count,
+        translations_created=job.translations_created,
+        failed_pairs=list(job.failed_pairs),
+        error=job.error,
+        created_at=job.created_at.isoformat() if job.created_at else None,
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None,
+    )
+
+
+bulk_upload_jobs = BulkUploadJobRunner()
@@ -0,0 +1,398 @@
+"""Pluggable key/value cache backends shared by the translation and daily-word
+caches.
+
+Gunicorn runs ``GUNICORN_WORKERS`` separate processes, so an in-process dict
+is warmed independently in each one. ``ALARINO_CACHE_URL`` selects where
+cached values live instead:
+
+- ``memory://`` (default) — per-process LRU dict, bounded by ``max_entries``.
+- ``file:///dev/shm/alarino-cache`` — one small JSON file per key in a
+  directory shared by every worker. Under ``/dev/shm`` (tmpfs) the files
+  never touch disk, so this is a shared-memory cache that needs no extra
+  service; any other directory works too, just slower.
+- ``redis://[:password@]host[:port][/db]`` — any server that speaks the
+  Redis protocol (Redis, Valkey, KeyDB, ...). Spoken directly over a
+  socket so no client library is required.
+
+Values must be JSON-serializable; the shared backends store them as JSON
+and the in-process backend stores them as-is, so callers must not mutate
+what get() returns. Backend failures (server down, disk full) are logged
+and treated as misses — a cache outage must never fail a request.
+
+This module deliberately does not import alarino_backend.runtime, which
+builds the daily-word cache from it at import time.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+from urllib.parse import unquote, urlsplit
+
+logger: logging.Logger = logging.getLogger("alarino_backend")
+
+DEFAULT_CACHE_URL = "memory://"
+DEFAULT_SHARED_CACHE_DIR = "/dev/shm/alarino-cache"
+
+
+class CacheBackendError(Exception):
+    """Raised for protocol-level failures talking to a cache server."""
+
+
+class CacheBackend(ABC):
+    """A namespaced key/value store with optional per-key expiry."""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if absent or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> int:
+        """Remove ``keys``; returns how many were present."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every key in this backend's namespace."""
+
+    def stats(self) -> dict:
+        return {"backend": type(self).__name__, "namespace": self.namespace}
+
+
+class InProcessCacheBackend(CacheBackend):
+    """Per-process LRU dict with TTL. The default, and the right choice for
+    single-worker deployments and tests."""
+
+    def __init__(
+        self,
+        namespace: str = "",
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(namespace)
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple[Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= self._clock():
+                del self._entries[key]
+                self.evictions += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        if self.max_entries <= 0:
+            return
+        expires_at = self._clock() + ttl_seconds if ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, keys: Iterable[str]) -> int:
+        removed = 0
+        with self._lock:
+            for key in keys:
+                if self._entries.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                **super().stats(),
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self.evictions,
+            }
+
+
+class SharedFileCacheBackend(CacheBackend):
+    """One JSON file per key under ``directory/namespace``. Writes go to a
+    temp file and are renamed into place, so concurrent readers in other
+    workers see either the old value or the new one, never a torn write.
+    Expired files are removed when read and by a periodic sweep."""
+
+    SWEEP_EVERY_N_SETS = 500
+
+    def __init__(self, directory: str | Path, namespace: str = ""):
+        super().__init__(namespace)
+        self.directory = Path(directory) / (namespace or "default")
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._sets_since_sweep = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / (hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _read(self, path: Path) -> Optional[dict]:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable cache file {path}: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        path = self._path(key)
+        entry = self._read(path)
+        if entry is None or entry.get("key") != key:
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            path.unlink(missing_ok=True)
+            return None
+        return entry.get("value")
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        entry = {
+            "key": key,
+            "expires_at": time.time() + ttl_seconds if ttl_seconds is not None else None,
+            "value": value,
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {key!r}: {e}")
+            return
+
+        self._sets_since_sweep += 1
+        if self._sets_since_sweep >= self.SWEEP_EVERY_N_SETS:
+            self._sets_since_sweep = 0
+            self.sweep_expired()
+
+    def delete(self, keys: Iterable[str]) -> int:
+        removed = 0
+        for key in keys:
+            path = self._path(key)
+            if path.exists():
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def sweep_expired(self) -> int:
+        now = time.time()
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            entry = self._read(path)
+            if entry is not None and entry.get("expires_at") is not None and entry["expires_at"] <= now:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    def clear(self) -> None:
+        for path in self.directory.glob("*.json"):
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "directory": str(self.directory),
+            "size": sum(1 for _ in self.directory.glob("*.json")),
+        }
+
+
+def _encode_command(args: Iterable[Any]) -> bytes:
+    parts = []
+    args = [arg if isinstance(arg, bytes) else str(arg).encode("utf-8") for arg in args]
+    parts.append(f"*{len(args)}\r\n".encode())
+    for arg in args:
+        parts.append(f"${len(arg)}\r\n".encode())
+        parts.append(arg)
+        parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+def _read_reply(stream) -> Any:
+    line = stream.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("Connection closed by cache server")
+    prefix, payload = line[:1], line[1:-2]
+    if prefix == b"+":
+        return payload.decode("utf-8")
+    if prefix == b"-":
+        raise CacheBackendError(payload.decode("utf-8"))
+    if prefix == b":":
+        return int(payload)
+    if prefix == b"$":
+        length = int(payload)
+        if length < 0:
+            return None
+        data = stream.read(length + 2)
+        if len(data) != length + 2:
+            raise ConnectionError("Connection closed by cache server")
+        return data[:-2]
+    if prefix == b"*":
+        length = int(payload)
+        if length < 0:
+            return None
+        return [_read_reply(stream) for _ in range(length)]
+    raise CacheBackendError(f"Unexpected reply from cache server: {line!r}")
+
+
+class RedisCacheBackend(CacheBackend):
+    """Minimal Redis-protocol (RESP2) client: GET, SET PX, DEL and SCAN are
+    all a cache needs. One connection per backend, serialized by a lock and
+    re-established after any connection error."""
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        namespace: str = "",
+        timeout: float = 0.5,
+    ):
+        super().__init__(namespace)
+        self.host = host
+        self.port = port
+        self.db = db
+        self.password = password
+        self.timeout = timeout
+        self._prefix = f"alarino:{namespace}:" if namespace else "alarino:"
+        self._sock: Optional[socket.socket] = None
+        self._stream = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+        self._sock = sock
+        self._stream = sock.makefile("rb")
+        try:
+            if self.password:
+                self._send(["AUTH", self.password])
+            if self.db:
+                self._send(["SELECT", self.db])
+        except BaseException:
+            # Never keep a connection that is unauthenticated or on the
+            # wrong database; the next command reconnects.
+            self._close()
+            raise
+
+    def _close(self) -> None:
+        for closable in (self._stream, self._sock):
+            if closable is not None:
+                try:
+                    closable.close()
+                except OSError:
+                    pass
+        self._sock = None
+        self._stream = None
+
+    def _send(self, args: list) -> Any:
+        self._sock.sendall(_encode_command(args))
+        return _read_reply(self._stream)
+
+    def execute(self, *args: Any) -> Any:
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                return self._send(list(args))
+            except (OSError, ConnectionError):
+                self._close()
+                raise
+
+    def _safe_execute(self, *args: Any) -> Any:
+        try:
+            return self.execute(*args)
+        except (OSError, ConnectionError, CacheBackendError) as e:
+            logger.warning(f"Cache server {self.host}:{self.port} {args[0]} failed: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._safe_execute("GET", self._prefix + key)
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        payload = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        if ttl_seconds is not None:
+            self._safe_execute("SET", self._prefix + key, payload, "PX", max(1, int(ttl_seconds * 1000)))
+        else:
+            self._safe_execute("SET", self._prefix + key, payload)
+
+    def delete(self, keys: Iterable[str]) -> int:
+        keys = [self._prefix + key for key in keys]
+        if not keys:
+            return 0
+        return self._safe_execute("DEL", *keys) or 0
+
+    def clear(self) -> None:
+        cursor = b"0"
+        while True:
+            reply = self._safe_execute("SCAN", cursor, "MATCH", self._prefix + "*", "COUNT", 500)
+            if not reply:
+                return
+            cursor, keys = reply
+            if keys:
+                self._safe_execute("DEL", *keys)
+            if cursor in (b"0", "0"):
+                return
+
+    def stats(self) -> dict:
+        return {**super().stats(), "server": f"{self.host}:{self.port}/{self.db}"}
+
+
+def create_cache_backend(
+    namespace: str,
+    url: Optional[str] = None,
+    max_entries: int = 10000,
+) -> CacheBackend:
+    """Build the backend selected by ``url`` (default: ``ALARINO_CACHE_URL``).
+    ``max_entries`` bounds the in-process backend; shared backends are bounded
+    by the TTLs callers set."""
+    url = url or os.getenv("ALARINO_CACHE_URL", DEFAULT_CACHE_URL)
+    parts = urlsplit(url)
+    if parts.scheme == "memory":
+        return InProcessCacheBackend(namespace=namespace, max_entries=max_entries)
+    if parts.scheme == "file":
+        return SharedFileCacheBackend(unquote(parts.path) or DEFAULT_SHARED_CACHE_DIR, namespace=namespace)
+    if parts.scheme == "redis":
+        db_index = parts.path.lstrip("/")
+        return RedisCacheBackend(
+            host=parts.hostname or "localhost",
+            port=parts.port or 6379,
+            db=int(db_index) if db_index else 0,
+            password=unquote(parts.password) if parts.password else None,
+            namespace=namespace,
+        )
+    raise ValueError(f"Unsupported ALARINO_CACHE_URL scheme: {url!r}")
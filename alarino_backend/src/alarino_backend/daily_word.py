@@ -0,0 +1,193 @@
+# daily_word.py
+"""Candidate pool for the word of the day.
+
+Only translations whose Yoruba side is a single word are eligible (the
+feature spotlights individual words, not phrases). Rather than shuffling
+the whole translations table on every pick, DailyWordCandidatePool keeps
+the eligible translation ids in an array built by one id-only query, and
+picking is a random index into it. A second array tracks the ids that have
+never been a daily word, with an id → position map so marking one used is
+a constant-time swap-remove.
+
+schedule_daily_words() uses the pool to materialize DailyWord rows days
+ahead (see data/schedule_daily_words.py), so /api/daily-word normally only
+reads. Every insert is ON CONFLICT (date) DO NOTHING, which makes the
+request-time fallback and overlapping scheduler runs safe: whichever insert
+lands first owns the date and everyone else reads its row.
+
+The pool is rebuilt lazily when this worker commits a lexicon write (via
+lexicon_changes) or when max(translations.t_id) moves, which catches
+translations added by other workers. A picked id is re-read by primary key
+before it is returned, so a translation deleted since the build is simply
+discarded and another index drawn.
+"""
+
+import random
+import threading
+from datetime import date, timedelta
+from typing import Optional
+
+from sqlalchemy import String, and_, literal, or_
+from sqlalchemy.orm import aliased, joinedload
+
+from alarino_backend.db_models import REVIEW_APPROVED, DailyWord, Translation, Word
+from alarino_backend.flask_extensions import dialect_insert
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener
+
+
+def is_daily_word_candidate(translation: Translation) -> bool:
+    yoruba = Language.YORUBA.value
+    yo_word = (
+        translation.source_word
+        if translation.source_word.language == yoruba
+        else translation.target_word
+    )
+    return " " not in yo_word.text
+
+
+class DailyWordCandidatePool:
+    def __init__(self, rng: Optional[random.Random] = None):
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._ids: list[int] = []
+        self._unused: list[int] = []
+        self._unused_position: dict[int, int] = {}
+        self._max_t_id: Optional[int] = None
+        self._stale = True
+        self.builds = 0
+
+    def mark_stale(self, changes=None) -> None:
+        self._stale = True
+
+    def _build(self, db) -> None:
+        source = aliased(Word)
+        target = aliased(Word)
+        yoruba = Language.YORUBA.value
+        # A plain String literal: a bare " " would be bound through NFCWord
+        # and stripped to "".
+        has_space = literal("% %", String)
+        single_word_yoruba = or_(
+            and_(source.language == yoruba, ~source.text.like(has_space)),
+            and_(target.language == yoruba, ~target.text.like(has_space)),
+        )
+        ids = [
+            t_id
+            for (t_id,) in db.session.query(Translation.t_id)
+            .join(source, Translation.source_word_id == source.w_id)
+            .join(target, Translation.target_word_id == target.w_id)
+            .filter(single_word_yoruba, Translation.review_status == REVIEW_APPROVED)
+            .order_by(Translation.t_id)
+        ]
+        used = {t_id for (t_id,) in db.session.query(DailyWord.translation_id).distinct()}
+        self._ids = ids
+        self._unused = [t_id for t_id in ids if t_id not in used]
+        self._unused_position = {t_id: i for i, t_id in enumerate(self._unused)}
+        self.builds += 1
+
+    def _ensure_fresh(self, db) -> None:
+        max_t_id = db.session.query(db.func.max(Translation.t_id)).scalar()
+        if self._stale or max_t_id != self._max_t_id:
+            # Clear the flag first: a commit landing mid-build re-sets it.
+            self._stale = False
+            self._build(db)
+            self._max_t_id = max_t_id
+
+    def _remove_unused(self, t_id: int) -> None:
+        position = self._unused_position.pop(t_id, None)
+        if position is None:
+            return
+        last = self._unused.pop()
+        if last != t_id:
+            self._unused[position] = last
+            self._unused_position[last] = position
+
+    def _discard(self, t_id: int) -> None:
+        self._remove_unused(t_id)
+        if t_id in self._ids:
+            self._ids.remove(t_id)
+
+    def mark_used(self, t_id: int) -> None:
+        with self._lock:
+            self._remove_unused(t_id)
+
+    def pick(self, db, can_reuse: bool = True) -> Optional[Translation]:
+        """A uniformly random eligible Translation (never used as a daily
+        word unless ``can_reuse``), or None if there is none."""
+        with self._lock:
+            self._ensure_fresh(db)
+            while True:
+                candidates = self._ids if can_reuse else self._unused
+                if not candidates:
+                    return None
+                t_id = candidates[self._rng.randrange(len(candidates))]
+                translation = db.session.get(
+                    Translation,
+                    t_id,
+                    options=[joinedload(Translation.source_word), joinedload(Translation.target_word)],
+                )
+                if translation is None or not is_daily_word_candidate(translation):
+                    self._discard(t_id)
+                    continue
+                if not can_reuse and DailyWord.query.filter_by(translation_id=t_id).first():
+                    # Used by another worker since the build.
+                    self._remove_unused(t_id)
+                    continue
+                return translation
+
+    def stats(self) -> dict:
+        return {
+            "candidates": len(self._ids),
+            "unused": len(self._unused),
+            "builds": self.builds,
+        }
+
+
+daily_word_pool = DailyWordCandidatePool()
+
+
+def insert_daily_words(db, rows: list[dict]) -> list[date]:
+    """INSERT ``{translation_id, date}`` rows, skipping dates that already
+    have a daily word. Does not commit. Returns the dates actually inserted."""
+    if not rows:
+        return []
+    table = DailyWord.__table__
+    stmt = (
+        dialect_insert(db.session)(table)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=["date"])
+        .returning(table.c.date)
+    )
+    return [row.date for row in db.session.execute(stmt)]
+
+
+def schedule_daily_words(
+    db, days: int, start: Optional[date] = None, pool: Optional[DailyWordCandidatePool] = None
+) -> list[date]:
+    """Pick a daily word for every date in ``[start, start + days)`` that
+    doesn't have one yet and insert them all in one transaction. Prefers
+    translations never used before, falling back to reuse once those run
+    out. Returns the dates newly scheduled."""
+    pool = pool or daily_word_pool
+    start = start or date.today()
+    wanted = [start + timedelta(days=offset) for offset in range(days)]
+    scheduled = {
+        day for (day,) in db.session.query(DailyWord.date).filter(DailyWord.date.in_(wanted))
+    }
+
+    rows = []
+    for day in wanted:
+        if day in scheduled:
+            continue
+        translation = pool.pick(db, can_reuse=False) or pool.pick(db, can_reuse=True)
+        if translation is None:
+            break
+        pool.mark_used(translation.t_id)
+        rows.append({"translation_id": translation.t_id, "date": day})
+
+    inserted = insert_daily_words(db, rows)
+    db.session.commit()
+    return sorted(inserted)
+
+
+register_listener(daily_word_pool.mark_stale)
@@ -0,0 +1,71 @@
+# daily_word_cache.py
+"""Cache for the word of the day and the HTTP validators derived from it.
+
+The daily word changes once per local day, so the cache only ever holds
+today's entry (and tomorrow's, if it was resolved early); each entry expires
+at the end of its own day, so nothing accumulates. The ETag is derived from
+the date and translation id, and max-age counts down to the next local
+midnight, letting Caddy and browsers reuse the response until the word
+actually changes.
+"""
+
+import math
+from datetime import date, datetime, time, timedelta
+from typing import Callable, NamedTuple, Optional
+
+from alarino_backend.cache_backends import CacheBackend
+
+
+class DailyWordEntry(NamedTuple):
+    yoruba_word: str
+    english_word: str
+    translation_id: int
+
+
+def seconds_until_midnight(now: datetime) -> int:
+    """Whole seconds from ``now`` to the next local midnight, at least 1."""
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min, tzinfo=now.tzinfo)
+    return max(1, math.ceil((midnight - now).total_seconds()))
+
+
+class DailyWordCache:
+    def __init__(self, backend: CacheBackend, now: Callable[[], datetime] = datetime.now):
+        self.backend = backend
+        self._now = now
+
+    def today(self) -> date:
+        return self._now().date()
+
+    def _in_window(self, day: date) -> bool:
+        today = self.today()
+        return today <= day <= today + timedelta(days=1)
+
+    def get(self, day: date) -> Optional[DailyWordEntry]:
+        if not self._in_window(day):
+            return None
+        value = self.backend.get(day.isoformat())
+        if value is None:
+            return None
+        return DailyWordEntry(*value)
+
+    def set(self, day: date, entry: DailyWordEntry) -> None:
+        """Cache ``entry`` until the end of ``day``. Days other than today
+        and tomorrow are ignored."""
+        if not self._in_window(day):
+            return
+        end_of_day = datetime.combine(day + timedelta(days=1), time.min)
+        ttl_seconds = max(1.0, (end_of_day - self._now().replace(tzinfo=None)).total_seconds())
+        self.backend.set(day.isoformat(), list(entry), ttl_seconds)
+
+    @staticmethod
+    def etag(day: date, entry: DailyWordEntry) -> str:
+        return f"{day.isoformat()}-{entry.translation_id}"
+
+    def max_age(self) -> int:
+        return seconds_until_midnight(self._now())
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        return self.backend.stats()
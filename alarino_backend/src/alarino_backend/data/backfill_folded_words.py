@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# backfill_folded_words.py
+"""Recompute words.folded_text wherever it disagrees with
+fold_diacritics(text): rows inserted with raw SQL (which get the '' server
+default), or every row after a change to the folding rules. Safe to re-run.
+
+Usage:
+    python -m alarino_backend.data.backfill_folded_words
+"""
+from alarino_backend.db_models import Word
+from alarino_backend.normalization import fold_diacritics, normalize_word_text
+from alarino_backend.runtime import logger
+
+BATCH_SIZE = 1000
+
+
+def backfill() -> int:
+    from alarino_backend.flask_extensions import db
+
+    updates = [
+        {"w_id": w_id, "folded_text": folded}
+        for w_id, text, folded_text in db.session.query(Word.w_id, Word.text, Word.folded_text)
+        if (folded := fold_diacritics(normalize_word_text(text))) != folded_text
+    ]
+    for start in range(0, len(updates), BATCH_SIZE):
+        db.session.bulk_update_mappings(Word, updates[start:start + BATCH_SIZE])
+    db.session.commit()
+    logger.info(f"Re-folded {len(updates)} words")
+    return len(updates)
+
+
+if __name__ == "__main__":
+    from alarino_backend import create_app
+
+    app = create_app()
+    with app.app_context():
+        backfill()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# export_lexicon.py
+"""Export the lexicon to a versioned, memory-mappable binary artifact.
+
+Building a LexiconSnapshot from Postgres costs a few hundred milliseconds of
+queries per gunicorn worker on every boot. This script does it once and
+writes the snapshot's columns to a file; workers started with
+``LEXICON_SNAPSHOT_PATH`` pointing at it mmap the file and answer from it
+immediately, all sharing the same physical pages through the page cache.
+
+File layout (all integers little-endian, every section 8-byte aligned):
+
+    header   magic b"ALARINO\\0", format version (u32), section count (u32),
+             lexicon fingerprint (8 x i64)
+    table    per section: name (32 bytes, NUL-padded ASCII), array typecode
+             (1 byte), 7 bytes padding, byte offset (u64), item count (u64)
+    sections string_offsets (u32, n+1), string_data (utf-8 blob), then one
+             int column per LexiconSnapshot array field
+
+The fingerprint lets a worker check, with one cheap query, whether the
+artifact still matches the database; if not it rebuilds from SQL as usual.
+
+Usage:
+    python -m alarino_backend.data.export_lexicon [output_path]
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from pathlib import Path
+from typing import Sequence
+
+from alarino_backend.lexicon_snapshot import LexiconSnapshot, build_snapshot
+from alarino_backend.runtime import logger
+
+DATA_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT_PATH = DATA_DIR / "lexicon.bin"
+
+MAGIC = b"ALARINO\0"
+FORMAT_VERSION = 2
+FINGERPRINT_LENGTH = 8
+_HEADER = struct.Struct(f"<8sII{FINGERPRINT_LENGTH}q")
+_SECTION = struct.Struct("<32sc7xQQ")
+_ALIGNMENT = 8
+
+# LexiconSnapshot int columns, in file order, with their array typecodes.
+COLUMNS: tuple[tuple[str, str], ...] = (
+    ("word_language", "b"),
+    ("word_text", "i"),
+    ("word_db_id", "i"),
+    ("sense_db_id", "i"),
+    ("sense_label", "i"),
+    ("sense_definition", "i"),
+    ("sense_register", "i"),
+    ("sense_domain", "i"),
+    ("sense_part_of_speech", "i"),
+    ("edge_source_word", "i"),
+    ("edge_target_word", "i"),
+    ("edge_source_sense", "i"),
+    ("edge_target_sense", "i"),
+    ("edge_note", "i"),
+    ("edge_provenance", "i"),
+    ("edge_forward_examples", "i"),
+    ("edge_reverse_examples", "i"),
+    ("adjacency_offsets", "i"),
+    ("adjacency_edges", "i"),
+    ("example_source", "i"),
+    ("example_target", "i"),
+)
+
+
+class MappedStringTable(Sequence[str]):
+    """Read-only string column over an offsets array and a UTF-8 blob.
+    Strings are decoded on access; nothing is copied up front."""
+
+    def __init__(self, offsets: Sequence[int], data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+        return bytes(self._data[self._offsets[index]:self._offsets[index + 1]]).decode("utf-8")
+
+
+def _little_endian_bytes(values: array) -> bytes:
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_snapshot(snapshot: LexiconSnapshot, output_path: str | Path) -> None:
+    """Serialize ``snapshot`` to ``output_path``. Written to a temp file and
+    renamed into place so a worker starting mid-export never maps a
+    half-written file."""
+    if len(snapshot.fingerprint) != FINGERPRINT_LENGTH:
+        raise ValueError(f"Expected a {FINGERPRINT_LENGTH}-value fingerprint, got {snapshot.fingerprint!r}")
+
+    encoded = [s.encode("utf-8") for s in snapshot.strings]
+    string_offsets = array("I", [0])
+    for value in encoded:
+        string_offsets.append(string_offsets[-1] + len(value))
+    sections: list[tuple[str, str, int, bytes]] = [
+        ("string_offsets", "I", len(string_offsets), _little_endian_bytes(string_offsets)),
+        ("string_data", "B", string_offsets[-1], b"".join(encoded)),
+    ]
+    for name, typecode in COLUMNS:
+        values = array(typecode, getattr(snapshot, name))
+        sections.append((name, typecode, len(values), _little_endian_bytes(values)))
+
+    offset = _HEADER.size + _SECTION.size * len(sections)
+    table = []
+    for name, typecode, count, payload in sections:
+        offset += -offset % _ALIGNMENT
+        table.append(_SECTION.pack(name.encode("ascii"), typecode.encode("ascii"), offset, count))
+        offset += len(payload)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=output_path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), *snapshot.fingerprint))
+            f.write(b"".join(table))
+            for _, _, _, payload in sections:
+                f.write(b"\0" * (-f.tell() % _ALIGNMENT))
+                f.write(payload)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def load_snapshot(path: str | Path) -> LexiconSnapshot:
+    """Map the artifact at ``path`` read-only and return a LexiconSnapshot
+    whose columns are memoryviews straight into the mapping. Raises
+    ValueError if the file is not a lexicon artifact of this format version."""
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapping) < _HEADER.size:
+        raise ValueError(f"{path} is too short to be a lexicon artifact")
+    magic, version, section_count, *fingerprint = _HEADER.unpack_from(mapping, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path} is not a lexicon artifact")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path} has format version {version}, expected {FORMAT_VERSION}")
+
+    view = memoryview(mapping)
+    sections: dict[str, Sequence[int]] = {}
+    for i in range(section_count):
+        raw_name, raw_typecode, offset, count = _SECTION.unpack_from(mapping, _HEADER.size + i * _SECTION.size)
+        name = raw_name.rstrip(b"\0").decode("ascii")
+        typecode = raw_typecode.decode("ascii")
+        size = array(typecode).itemsize * count
+        if offset + size > len(mapping):
+            raise ValueError(f"{path} is truncated in section {name!r}")
+        if sys.byteorder == "big" and typecode not in ("b", "B"):
+            # Not zero-copy on big-endian hosts, but still portable.
+            column = array(typecode, view[offset:offset + size].tobytes())
+            column.byteswap()
+            sections[name] = column
+        else:
+            sections[name] = view[offset:offset + size].cast(typecode)
+
+    missing = {"string_offsets", "string_data", *(name for name, _ in COLUMNS)} - sections.keys()
+    if missing:
+        raise ValueError(f"{path} is missing sections {sorted(missing)}")
+
+    return LexiconSnapshot(
+        fingerprint=tuple(fingerprint),
+        strings=MappedStringTable(sections["string_offsets"], sections["string_data"]),
+        backing=mapping,
+        **{name: sections[name] for name, _ in COLUMNS},
+    )
+
+
+def export_lexicon(output_path: str | Path = DEFAULT_OUTPUT_PATH) -> LexiconSnapshot:
+    from alarino_backend.flask_extensions import db
+
+    snapshot = build_snapshot(db)
+    write_snapshot(snapshot, output_path)
+    logger.info(
+        f"Exported lexicon artifact to {output_path}: {snapshot.word_count} words, "
+        f"{snapshot.edge_count} translations, {Path(output_path).stat().st_size} bytes"
+    )
+    return snapshot
+
+
+if __name__ == "__main__":
+    from alarino_backend import create_app
+
+    parser = argparse.ArgumentParser(description="Export the lexicon to a memory-mappable binary artifact.")
+    parser.add_argument("output_path", nargs="?", default=str(DEFAULT_OUTPUT_PATH))
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        export_lexicon(args.output_path)
@@ -0,0 +1,187 @@
+# fast_seed.py
+"""Set-based loading of English → Yoruba translation pairs, for seeding.
+
+The per-entry path (add_word → create_translation) costs several SELECTs
+and a flush per word, which adds up to minutes for the full dataset.
+load_translation_pairs() instead takes pairs that are already normalized,
+validated and deduplicated in memory, and writes them in a fixed number
+of statements:
+
+1. the distinct words and the pairs go into two temporary staging tables,
+   with ``COPY ... FROM STDIN`` on Postgres and one executemany on SQLite;
+2. ``INSERT ... SELECT ... ON CONFLICT DO NOTHING`` merges the staged words
+   into ``words`` (folded_text included, so no backfill is needed);
+3. one INSERT ... SELECT gives every staged word without a sense its
+   default sense;
+4. one INSERT ... SELECT joins the staged pairs to both words' only sense
+   and inserts the translations, skipping sense pairs that exist.
+
+The result matches create_translation(): an approved Translation between
+the two words' default senses. Pairs whose word already has several
+senses are returned as ambiguous instead of being bound to an arbitrary
+sense. Every loaded word is recorded with record_word_changes(), so the
+caller's commit invalidates the caches and indexes built from them. The
+caller commits.
+"""
+
+import csv
+import io
+import time
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import Column, MetaData, String, Table, and_, exists, func, select, true
+
+from alarino_backend.db_models import Sense, Translation, Word
+from alarino_backend.flask_extensions import dialect_insert
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import record_word_changes
+from alarino_backend.normalization import fold_diacritics
+
+_staging = MetaData()
+_staged_words = Table(
+    "seed_staged_words",
+    _staging,
+    Column("language", String(3), nullable=False),
+    Column("text", String(200), nullable=False),
+    Column("folded_text", String(200), nullable=False),
+    prefixes=["TEMPORARY"],
+)
+_staged_pairs = Table(
+    "seed_staged_pairs",
+    _staging,
+    Column("english", String(200), nullable=False),
+    Column("yoruba", String(200), nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+
+class FastSeedResult(NamedTuple):
+    words_created: int
+    senses_created: int
+    translations_created: int
+    ambiguous_pairs: list[tuple[str, str]]
+    pairs: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Input pairs loaded per second."""
+        return self.pairs / self.seconds if self.seconds else float(self.pairs)
+
+
+def _copy_rows(connection, table: Table, rows: list[tuple]) -> None:
+    """Fill ``table`` with ``rows`` using Postgres COPY."""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    columns = ", ".join(column.name for column in table.columns)
+    dbapi_connection = connection.connection.dbapi_connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table.name} ({columns}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+
+def _stage(connection, table: Table, rows: list[tuple]) -> None:
+    if not rows:
+        return
+    if connection.dialect.name == "postgresql":
+        _copy_rows(connection, table, rows)
+    else:
+        names = [column.name for column in table.columns]
+        connection.execute(table.insert(), [dict(zip(names, row)) for row in rows])
+
+
+def _single_senses(name: str):
+    """``(word_id, sense_id)`` of every word that has exactly one sense."""
+    return (
+        select(Sense.word_id, func.min(Sense.sense_id).label("sense_id"))
+        .group_by(Sense.word_id)
+        .having(func.count() == 1)
+        .subquery(name)
+    )
+
+
+def load_translation_pairs(db, pairs: Iterable[tuple[str, str]]) -> FastSeedResult:
+    """Store ``(english, yoruba)`` pairs (normalized and valid, see
+    word_translations_loader.prepare_entries) set-based; does not commit."""
+    started = time.perf_counter()
+    pairs = sorted(set(pairs))
+    en, yo = Language.ENGLISH.value, Language.YORUBA.value
+    words = sorted({(en, english) for english, _ in pairs} | {(yo, yoruba) for _, yoruba in pairs})
+
+    connection = db.session.connection()
+    for table in (_staged_words, _staged_pairs):
+        table.drop(connection, checkfirst=True)
+        table.create(connection)
+
+    _stage(connection, _staged_words, [(language, text, fold_diacritics(text)) for language, text in words])
+    _stage(connection, _staged_pairs, pairs)
+    insert = dialect_insert(db.session)
+
+    # "WHERE true" keeps SQLite from parsing ON CONFLICT as a join's ON.
+    words_created = connection.execute(
+        insert(Word.__table__)
+        .from_select(
+            ["language", "text", "folded_text"],
+            select(_staged_words.c.language, _staged_words.c.text, _staged_words.c.folded_text).where(true()),
+        )
+        .on_conflict_do_nothing(index_elements=["language", "text"])
+    ).rowcount
+
+    staged_word_ids = (
+        select(Word.w_id)
+        .join(
+            _staged_words,
+            and_(Word.language == _staged_words.c.language, Word.text == _staged_words.c.text),
+        )
+        .where(~exists().where(Sense.word_id == Word.w_id))
+    )
+    senses_created = connection.execute(
+        Sense.__table__.insert().from_select(["word_id"], staged_word_ids)
+    ).rowcount
+
+    source, target = Word.__table__.alias("source"), Word.__table__.alias("target")
+    source_sense, target_sense = _single_senses("source_sense"), _single_senses("target_sense")
+    # Outer joins, filtered afterwards: an inner join to the aggregate makes
+    # SQLite rescan it for every pair.
+    candidates = (
+        _staged_pairs
+        .join(source, and_(source.c.language == en, source.c.text == _staged_pairs.c.english))
+        .join(target, and_(target.c.language == yo, target.c.text == _staged_pairs.c.yoruba))
+        .outerjoin(source_sense, source_sense.c.word_id == source.c.w_id)
+        .outerjoin(target_sense, target_sense.c.word_id == target.c.w_id)
+    )
+    unambiguous = and_(source_sense.c.sense_id.is_not(None), target_sense.c.sense_id.is_not(None))
+    translations_created = connection.execute(
+        insert(Translation.__table__)
+        .from_select(
+            ["source_word_id", "target_word_id", "source_sense_id", "target_sense_id"],
+            select(source.c.w_id, target.c.w_id, source_sense.c.sense_id, target_sense.c.sense_id)
+            .select_from(candidates)
+            .where(unambiguous),
+        )
+        .on_conflict_do_nothing(index_elements=["source_sense_id", "target_sense_id"])
+    ).rowcount
+
+    ambiguous_pairs = [
+        tuple(row)
+        for row in connection.execute(
+            select(_staged_pairs.c.english, _staged_pairs.c.yoruba)
+            .select_from(candidates)
+            .where(~unambiguous)
+            .order_by(_staged_pairs.c.english, _staged_pairs.c.yoruba)
+        )
+    ]
+    record_word_changes(db.session, words)
+    # Postgres drops them on rollback too; a leftover SQLite pair is
+    # dropped by the next run.
+    for table in (_staged_pairs, _staged_words):
+        table.drop(connection)
+
+    return FastSeedResult(
+        words_created=words_created,
+        senses_created=senses_created,
+        translations_created=translations_created,
+        ambiguous_pairs=ambiguous_pairs,
+        pairs=len(pairs),
+        seconds=time.perf_counter() - started,
+    )
@@ -1,3 +1,4 @@
+import argparse
 import json
 from pathlib import Path
 
@@ -9,6 +10,7 @@ from alarino_backend.db_models import db
 from alarino_backend.runtime import logger
 
 DATA_DIR = Path(__file__).resolve().parent
+CHECKPOINT_PATH = DATA_DIR / "checkpoints" / "proverbs.json"
 
 
 def load_proverbs_from_file(file_path: str):
@@ -28,53 +30,72 @@ def load_proverbs_from_file(file_path: str):
                 continue
 
 
-def seed_proverbs_batch(entries: list, batch_id: int, app=None) -> list:
+def prepare_proverbs(entries: list) -> tuple[list[tuple[str, str]], list[dict]]:
     """
-    Seeds a batch of proverbs into the database.
+    Validates a batch of proverb entries. CPU-only, so it can run on a
+    process pool.
     Args:
         entries: A list of proverb entries.
-        batch_id: The identifier for the current batch.
     Returns:
-        A list of invalid entries found in the batch.
+        The valid ``(yoruba, english)`` pairs and the invalid entries.
     """
+    proverbs = []
     invalid_entries = []
+    for entry in entries:
+        yoruba_text = entry.get("yoruba", "").strip()
+        english_text = entry.get("english", "").strip()
+
+        if not yoruba_text or not english_text:
+            invalid_entries.append({**entry, "reason": "Missing yoruba or english text"})
+            continue
+
+        if not is_valid_yoruba_text(yoruba_text):
+            reason = "Invalid Yoruba text"
+            logger.warning(f"Skipping invalid proverb: {yoruba_text} ({reason})")
+            invalid_entries.append({**entry, "reason": reason})
+            continue
+        if not is_valid_english_text(english_text):
+            reason = "Invalid English text"
+            logger.warning(f"Skipping invalid proverb: {english_text} ({reason})")
+            invalid_entries.append({**entry, "reason": reason})
+            continue
+
+        proverbs.append((yoruba_text, english_text))
+    return proverbs, invalid_entries
+
+
+def seed_proverbs_batch(proverbs: list, batch_id: int, app=None) -> None:
+    """
+    Seeds a batch of validated proverbs into the database. Invalid entries
+    are reported by prepare_proverbs, so there are none to return.
+    Args:
+        proverbs: ``(yoruba, english)`` pairs from prepare_proverbs.
+        batch_id: The identifier for the current batch.
+    """
     app = app or create_app()
 
     with app.app_context():
-        for entry in entries:
-            yoruba_text = entry.get("yoruba", "").strip()
-            english_text = entry.get("english", "").strip()
-
-            if not yoruba_text or not english_text:
-                invalid_entries.append({**entry, "reason": "Missing yoruba or english text"})
-                continue
-
-            if not is_valid_yoruba_text(yoruba_text):
-                reason = "Invalid Yoruba text"
-                logger.warning(f"Skipping invalid proverb: {yoruba_text} ({reason})")
-                invalid_entries.append({**entry, "reason": reason})
-                continue
-            if not is_valid_english_text(english_text):
-                reason = "Invalid English text"
-                logger.warning(f"Skipping invalid proverb: {english_text} ({reason})")
-                invalid_entries.append({**entry, "reason": reason})
-                continue
-
+        for yoruba_text, english_text in proverbs:
             add_proverb(yoruba_text, english_text)
 
         try:
             db.session.commit()
-            logger.info(f"Batch {batch_id}: Committed {len(entries) - len(invalid_entries)} proverbs.")
-        except IntegrityError:
+            logger.info(f"Batch {batch_id}: Committed {len(proverbs)} proverbs.")
+        except IntegrityError as e:
+            # Re-raise so upload_data_in_batches stops before checkpointing
+            # past a batch that was never committed.
             db.session.rollback()
-            logger.warning(f"Batch {batch_id}: IntegrityError, rolling back session.")
-
-    return invalid_entries
+            logger.exception(f"Batch {batch_id}: integrity error, rolled back: {e}")
+            raise
 
 
-def write_proverbs_data(app=None):
+def write_proverbs_data(app=None, workers: int = 0, restart: bool = False):
     """
     Main function to seed proverbs from the train.jsonl file.
+    Args:
+        workers: Validate batches on this many processes while this one
+            writes (0 validates inline).
+        restart: Ignore the checkpoint of an interrupted run.
     """
     file_path = DATA_DIR / "datasets" / "train.jsonl"
     proverbs = list(load_proverbs_from_file(file_path))
@@ -82,15 +103,22 @@ def write_proverbs_data(app=None):
 
     app = app or create_app()
 
-    # Set the starting batch index. Change to > 0 to resume a failed run.
-    batch_start = 0
+    if restart:
+        CHECKPOINT_PATH.unlink(missing_ok=True)
     upload_data_in_batches(
         entries=proverbs,
-        upload_func=lambda entries, batch_id: seed_proverbs_batch(entries, batch_id, app),
+        upload_func=lambda proverbs, batch_id: seed_proverbs_batch(proverbs, batch_id, app),
         invalid_files_prefix=DATA_DIR / "invalid_datasets" / "proverbs" / "invalid_proverbs_batch",
-        batch_size=500, batch_start=batch_start
+        batch_size=500,
+        checkpoint_path=CHECKPOINT_PATH,
+        prepare_func=prepare_proverbs,
+        workers=workers,
     )
 
 
 if __name__ == '__main__':
-    write_proverbs_data()
+    parser = argparse.ArgumentParser(description="Seed Yoruba proverbs.")
+    parser.add_argument("--workers", type=int, default=0, help="Processes that validate batches.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint of an interrupted run.")
+    args = parser.parse_args()
+    write_proverbs_data(workers=args.workers, restart=args.restart)
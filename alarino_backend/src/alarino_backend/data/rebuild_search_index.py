@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# rebuild_search_index.py
+"""Re-index every proverb and example sentence for full-text search.
+
+add_proverb keeps the index current for proverbs added through the app.
+Run this once after applying migration c3d9e1a7b25f, and again after any
+import that writes proverbs or examples directly.
+
+Usage:
+    python -m alarino_backend.data.rebuild_search_index
+"""
+from alarino_backend.full_text_search import rebuild_search_index
+from alarino_backend.runtime import logger
+
+
+def rebuild() -> int:
+    from alarino_backend.flask_extensions import db
+
+    count = rebuild_search_index(db)
+    logger.info(f"Indexed {count} search documents")
+    return count
+
+
+if __name__ == "__main__":
+    from alarino_backend import create_app
+
+    app = create_app()
+    with app.app_context():
+        rebuild()
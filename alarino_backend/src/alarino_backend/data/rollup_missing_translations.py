@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# rollup_missing_translations.py
+"""Fold missing_translation_events into per-day counts and into
+missing_translations (only needed with MISSING_TRANSLATION_SINK=events).
+
+Usage:
+    python -m alarino_backend.data.rollup_missing_translations [--batch-size N]
+"""
+import argparse
+
+from alarino_backend.missing_translations import ROLLUP_BATCH_SIZE, rollup_missing_translation_events
+from alarino_backend.runtime import logger
+
+# Add this to your crontab with: crontab -e
+# Roll up missing-translation events every 5 minutes
+# */5 * * * * cd /path/to/alarino/alarino_backend && /usr/bin/python3 -m alarino_backend.data.rollup_missing_translations >> missing_translation_rollup.log 2>&1
+
+
+def rollup(batch_size: int = ROLLUP_BATCH_SIZE) -> int:
+    from alarino_backend.flask_extensions import db
+
+    events = rollup_missing_translation_events(db, batch_size)
+    logger.info(f"Rolled up {events} missing translation events")
+    return events
+
+
+if __name__ == "__main__":
+    from alarino_backend import create_app
+
+    parser = argparse.ArgumentParser(description="Roll up missing-translation events.")
+    parser.add_argument("--batch-size", type=int, default=ROLLUP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        rollup(args.batch_size)
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# schedule_daily_words.py
+"""Materialize the word of the day ahead of time, so /api/daily-word only
+ever reads. Dates that already have a daily word are left alone, so the
+script is safe to re-run.
+
+Usage:
+    python -m alarino_backend.data.schedule_daily_words [--days N]
+"""
+import argparse
+
+from alarino_backend.daily_word import schedule_daily_words
+from alarino_backend.runtime import logger
+
+# Add this to your crontab with: crontab -e
+# Keep the next 30 days scheduled; run every day at 0:30 AM
+# 30 0 * * * cd /path/to/alarino/alarino_backend && /usr/bin/python3 -m alarino_backend.data.schedule_daily_words --days 30 >> daily_word_schedule.log 2>&1
+
+DEFAULT_DAYS = 30
+
+
+def schedule(days: int = DEFAULT_DAYS) -> list:
+    from alarino_backend.flask_extensions import db
+
+    scheduled = schedule_daily_words(db, days)
+    if scheduled:
+        logger.info(f"Scheduled {len(scheduled)} daily words: {scheduled[0]} to {scheduled[-1]}")
+    else:
+        logger.info(f"Next {days} days already scheduled")
+    return scheduled
+
+
+if __name__ == "__main__":
+    from alarino_backend import create_app
+
+    parser = argparse.ArgumentParser(description="Schedule daily words ahead of time.")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        schedule(args.days)
@@ -1,11 +1,18 @@
+import hashlib
 import json
+import os
 import re
 import unicodedata
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterator, Optional
 
-from alarino_backend.db_models import Proverb, ProverbWord, Sense, db, Word, Translation
+from alarino_backend.db_models import REVIEW_APPROVED, Proverb, ProverbWord, Sense, db, Word, Translation
+from alarino_backend.full_text_search import index_proverb
 from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import record_proverb_change, record_word_change, record_word_changes
 # normalize_word_text and normalize_text live in alarino_backend.normalization
 # so the TypeDecorators in db_models.py can use them without a circular import.
 # Re-exported here for callers that import them from this module.
@@ -38,6 +45,7 @@ def add_word(language: Language, word_text: str):
         return existing_word
     word = Word(language=language, text=word_text)
     db.session.add(word)
+    record_word_change(db.session, language, word_text)
     return word
 
 
@@ -69,6 +77,8 @@ def add_proverb(yoruba_proverb: str, english_proverb: str):
     new_proverb = Proverb(yoruba_text=yoruba_proverb, english_text=english_proverb)
     db.session.add(new_proverb)
     db.session.flush()  # Need new_proverb.p_id to populate proverb_words.
+    record_proverb_change(db.session, new_proverb.p_id)
+    index_proverb(db.session, new_proverb)
     logger.info(f"Added proverb: '{yoruba_proverb}'")
 
     # Extract individual words and connect them to the proverb via proverb_words.
@@ -218,7 +228,13 @@ def _ensure_default_sense(word: Word) -> Sense:
     return sense
 
 
-def create_translation(source: Word, target: Word):
+def create_translation(
+    source: Word,
+    target: Word,
+    provenance: Optional[str] = None,
+    confidence: Optional[float] = None,
+    review_status: str = REVIEW_APPROVED,
+) -> Translation:
     """Create a Translation between two Words, attaching to each Word's
     default sense. Raises AmbiguousSenseError if either word has multiple
     curated senses (the bulk-upload format carries no sense info; binding
@@ -228,7 +244,8 @@ def create_translation(source: Word, target: Word):
     already exists with the resolved sense pair, this is a no-op. Polysemy
     that targets the same surface words via *different* sense pairs is
     representable — that's exactly what the unique_translation_sense_pair
-    constraint allows."""
+    constraint allows. Returns the new or existing Translation; an existing
+    row keeps its own provenance and review_status."""
     source_sense = _ensure_default_sense(source)
     target_sense = _ensure_default_sense(target)
     existing = Translation.query.filter_by(
@@ -236,30 +253,133 @@ def create_translation(source: Word, target: Word):
         target_sense_id=target_sense.sense_id,
     ).first()
     if existing:
-        return
+        return existing
     translation = Translation(
         source_word=source,
         target_word=target,
         source_sense_id=source_sense.sense_id,
         target_sense_id=target_sense.sense_id,
+        provenance=provenance,
+        confidence=confidence,
+        review_status=review_status,
     )
     db.session.add(translation)
+    record_word_changes(
+        db.session,
+        [(source.language, source.text), (target.language, target.text)],
+    )
+    return translation
+
+
+def dataset_hash(entries: list) -> str:
+    """Content hash of a dataset, stored in checkpoints so a run only
+    resumes over the same data."""
+    encoded = json.dumps(entries, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _read_checkpoint(checkpoint_path: Path, digest: str, batch_size: int) -> Optional[dict]:
+    if not checkpoint_path.exists():
+        return None
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+        return None
+    if checkpoint.get("dataset_hash") != digest or checkpoint.get("batch_size") != batch_size:
+        logger.warning(f"Ignoring checkpoint {checkpoint_path}: it was written for other data or batch size")
+        return None
+    return checkpoint
 
 
-def upload_data_in_batches(entries: list, upload_func: Callable[[list, int], list],
+def _write_checkpoint(checkpoint_path: Path, checkpoint: dict) -> None:
+    # Write then rename, so an interrupted write never leaves half a file.
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = checkpoint_path.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def _prepared_batches(batches: list, prepare_func: Optional[Callable[[list], tuple]], workers: int) -> Iterator:
+    """``(prepared, invalid_entries)`` for each batch, in order. With
+    ``workers`` > 1 batches are prepared on a process pool, a few ahead of
+    the one being written."""
+    if prepare_func is None:
+        for batch in batches:
+            yield batch, []
+        return
+    if workers <= 1:
+        for batch in batches:
+            yield prepare_func(batch)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        remaining = iter(batches)
+        for batch in islice(remaining, 2 * workers):
+            pending.append(executor.submit(prepare_func, batch))
+        while pending:
+            prepared = pending.popleft().result()
+            batch = next(remaining, None)
+            if batch is not None:
+                pending.append(executor.submit(prepare_func, batch))
+            yield prepared
+
+
+def upload_data_in_batches(entries: list, upload_func: Callable[[list, int], Optional[list]],
                            invalid_files_prefix: str,
-                           batch_size: int = 500, batch_start: int = 0):
-    all_invalid_entries = []
+                           batch_size: int = 500, batch_start: int = 0,
+                           checkpoint_path: Optional[str | Path] = None,
+                           prepare_func: Optional[Callable[[list], tuple]] = None,
+                           workers: int = 0):
+    """
+    Upload ``entries`` in batches of ``batch_size`` through ``upload_func``,
+    which writes and commits one batch and returns its invalid entries, if
+    it finds any (None otherwise). It must raise if the batch was not
+    committed: the checkpoint only advances past batches whose upload_func
+    returned.
+    Args:
+        checkpoint_path: After each batch is committed, the next start index
+            and the dataset's hash are recorded here. A later run over the
+            same entries resumes after the last committed batch; the file is
+            removed once every batch is done.
+        prepare_func: Optional CPU-only step (validation, normalization) run
+            on each batch before upload_func, returning ``(prepared,
+            invalid_entries)``; upload_func then receives ``prepared``. It
+            must be a module-level function so it can run in another process.
+        workers: Run prepare_func on a pool of this many processes while the
+            caller's process writes. 0 or 1 prepares inline.
+    """
+    digest = dataset_hash(entries)
+    checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+    invalid_batches = []
+    if checkpoint_path:
+        checkpoint = _read_checkpoint(checkpoint_path, digest, batch_size)
+        if checkpoint:
+            batch_start = checkpoint["next_start"]
+            invalid_batches = checkpoint.get("invalid_batches", [])
+            logger.info(f"Resuming from checkpoint {checkpoint_path} at index {batch_start}")
 
-    while batch_start < len(entries):
-        end = min(batch_start + batch_size, len(entries))
-        batch_id = (batch_start // batch_size) + 1
-        logger.info(f"Processing batch {batch_id} from index {batch_start} to {end}")
-        batch = entries[batch_start:end]
-        batch_invalids = upload_func(batch, batch_id)
+    all_invalid_entries = []
+    # Invalid entries of batches committed before the interruption.
+    for batch_id in invalid_batches:
+        batch_file = Path(f"{invalid_files_prefix}_{batch_id}.json")
+        if batch_file.exists():
+            with open(batch_file, "r", encoding="utf-8") as f:
+                all_invalid_entries.extend(json.load(f))
+
+    starts = range(batch_start, len(entries), batch_size)
+    batches = [entries[start:start + batch_size] for start in starts]
+    for start, (prepared, prepare_invalids) in zip(starts, _prepared_batches(batches, prepare_func, workers)):
+        end = min(start + batch_size, len(entries))
+        batch_id = (start // batch_size) + 1
+        logger.info(f"Processing batch {batch_id} from index {start} to {end}")
+        batch_invalids = list(prepare_invalids) + list(upload_func(prepared, batch_id) or [])
 
         if batch_invalids:
             all_invalid_entries.extend(batch_invalids)
+            invalid_batches.append(batch_id)
             # Write invalid entries for the current batch
             batch_file = Path(f"{invalid_files_prefix}_{batch_id}.json")
             batch_file.parent.mkdir(parents=True, exist_ok=True)
@@ -267,7 +387,14 @@ def upload_data_in_batches(entries: list, upload_func: Callable[[list, int], lis
                 json.dump(batch_invalids, f, indent=2, ensure_ascii=False)
             logger.warning(f"Wrote {len(batch_invalids)} invalid entries to {batch_file}")
 
-        batch_start += batch_size
+        if checkpoint_path:
+            _write_checkpoint(checkpoint_path, {
+                "dataset_hash": digest,
+                "batch_size": batch_size,
+                "last_committed_batch": batch_id,
+                "next_start": end,
+                "invalid_batches": invalid_batches,
+            })
 
     if all_invalid_entries:
         invalid_file_path = Path(f"{invalid_files_prefix}_all.json")
@@ -276,4 +403,6 @@ def upload_data_in_batches(entries: list, upload_func: Callable[[list, int], lis
             json.dump(all_invalid_entries, f, indent=2, ensure_ascii=False)
         logger.info(f"Wrote {len(all_invalid_entries)} total invalid entries to {invalid_file_path}")
 
+    if checkpoint_path and checkpoint_path.exists():
+        checkpoint_path.unlink()
     logger.info(f"Finished processing all {len(entries)} entries. Skipped {len(all_invalid_entries)} invalid entries.")
@@ -1,105 +1,173 @@
+import argparse
 import json
 import re
 from pathlib import Path
+from typing import NamedTuple
 
 from sqlalchemy.exc import IntegrityError
 
 from alarino_backend import create_app
-from alarino_backend.data.seed_data_utils import add_word, create_translation, upload_data_in_batches
+from alarino_backend.data.fast_seed import load_translation_pairs
+from alarino_backend.data.seed_data_utils import (
+    AmbiguousSenseError,
+    add_word,
+    create_translation,
+    is_valid_english_word,
+    is_valid_yoruba_word,
+    normalize_word_text,
+    upload_data_in_batches,
+)
 from alarino_backend.db_models import db
 from alarino_backend.languages import Language
 from alarino_backend.runtime import logger
 
 DATA_DIR = Path(__file__).resolve().parent
+DATASET_PATH = DATA_DIR / "datasets" / "en-yo-dataset.json"
+CHECKPOINT_PATH = DATA_DIR / "checkpoints" / "translations.json"
 
 
-def process_translation(english_word:str, yoruba_translations:list, part_of_speech:str =None) -> list:
-    invalid_entries = []
-    # remove all substrings enclosed in parentheses
-    english_word = re.sub(r'\([^)]*\)', '', english_word).strip()
-
-    if part_of_speech:
-        eng_word_obj = add_word(Language.ENGLISH, english_word, part_of_speech=part_of_speech)
-    else:
-        eng_word_obj = add_word(Language.ENGLISH, english_word)
-
-    if eng_word_obj is None:
-        invalid_entries.append({
-            "english": english_word,
-            "yoruba": ", ".join(yoruba_translations),
-            "reason": "Invalid English word"
-        })
-        return invalid_entries
-
-    for yoruba_word in yoruba_translations:
-        yoruba_word = re.sub(r'\([^)]*\)', '', yoruba_word).strip()
-        yor_word_obj = add_word(Language.YORUBA, yoruba_word)
-        if yor_word_obj is None:
-            invalid_entries.append({
-                "english": english_word,
-                "yoruba": yoruba_word,
-                "reason": "Invalid Yoruba word"
-            })
-            continue
-        db.session.flush()
-        create_translation(eng_word_obj, yor_word_obj)
-    return invalid_entries
-
-
-def write_data_batch(entries: list, batch_id: int, app=None) -> list[dict]:
+def write_pairs_batch(pairs: set, batch_id: int, app=None) -> list[dict]:
+    """Write one batch of prepared ``(english, yoruba)`` pairs (see
+    prepare_entries) through the ORM and commit. Raises if the commit
+    fails, leaving the checkpoint at the previous batch."""
     app = app or create_app()
     with app.app_context():
-        batch_start = 0
-        batch_end = len(entries) - 1
         invalid_entries = []
-
-        for i, entry in enumerate(entries):
-            english_word = entry.get("english_word", "").strip().lower()
-            parts_of_speech = entry.get("parts_of_speech", [])
-            yoruba_text = entry.get("yoruba_translations", "")
-
-            if not english_word or not yoruba_text:
-                continue
-            yoruba_translations = [y.strip() for y in yoruba_text.split(",") if y.strip()]
-
-            if not parts_of_speech:
-                invalid_entries.extend(process_translation(english_word, yoruba_translations))
-            else:
-                for pos in parts_of_speech:
-                    invalid_entries.extend(process_translation(english_word, yoruba_translations, pos))
-
-            if i == batch_start:
-                logger.info(f"Starting at: {english_word} | POS: {parts_of_speech} | Yoruba: {yoruba_text}")
-            if i >= batch_end:
-                logger.info(f"Ending at: {english_word} | POS: {parts_of_speech} | Yoruba: {yoruba_text}")
+        for english_word, yoruba_word in sorted(pairs):
+            eng_word_obj = add_word(Language.ENGLISH, english_word)
+            yor_word_obj = add_word(Language.YORUBA, yoruba_word)
+            db.session.flush()
+            try:
+                create_translation(eng_word_obj, yor_word_obj)
+            except AmbiguousSenseError:
+                invalid_entries.append({"english": english_word, "yoruba": yoruba_word, "reason": "Ambiguous sense"})
 
         try:
             db.session.commit()
-            logger.info("Batch data committed successfully.")
-            logger.warning(f"Rejected {len(invalid_entries)} invalid entries.")
+            logger.info(f"Batch {batch_id}: committed {len(pairs) - len(invalid_entries)} pairs.")
         except IntegrityError as e:
+            # Re-raise so upload_data_in_batches stops before checkpointing
+            # past a batch that was never committed.
             db.session.rollback()
-            logger.exception("Integrity Error:", e)
+            logger.exception(f"Batch {batch_id}: integrity error, rolled back: {e}")
+            raise
 
         return invalid_entries
 
 
-def write_data(app=None):
-    with open(DATA_DIR / "datasets" / "en-yo-dataset.json", "r", encoding="utf-8") as f:
+def write_data(app=None, workers: int = 0, restart: bool = False):
+    """Per-entry ORM load in batches of 500. Batches are validated on
+    ``workers`` processes while this one writes; an interrupted run resumes
+    from CHECKPOINT_PATH unless ``restart``."""
+    with open(DATASET_PATH, "r", encoding="utf-8") as f:
         entries = json.load(f)
     logger.info(f"Finished loading data file with {len(entries)} translations")
 
     app = app or create_app()
 
-    # Set the starting batch index. Change to > 0 to resume a failed run.
-    batch_start = 0
+    if restart:
+        CHECKPOINT_PATH.unlink(missing_ok=True)
     upload_data_in_batches(
         entries=entries,
-        upload_func=lambda entries, batch_id: write_data_batch(entries, batch_id, app),
+        upload_func=lambda pairs, batch_id: write_pairs_batch(pairs, batch_id, app),
         invalid_files_prefix=DATA_DIR / "invalid_datasets" / "translations" / "invalid_entries_batch",
-        batch_size=500, batch_start=batch_start
+        batch_size=500,
+        checkpoint_path=CHECKPOINT_PATH,
+        prepare_func=prepare_entries,
+        workers=workers,
     )
 
 
+class PreparedEntries(NamedTuple):
+    pairs: set[tuple[str, str]]
+    invalid_entries: list[dict]
+
+
+def _strip_parenthesized(text: str) -> str:
+    return re.sub(r'\([^)]*\)', '', text).strip()
+
+
+def prepare_entries(entries: list) -> PreparedEntries:
+    """Normalize, validate and deduplicate dataset entries in memory, with
+    the rules add_word() applies. Parts of speech do not change the result
+    (default senses carry none), so an entry listed under several yields its
+    pairs once. CPU-only, so write_data can run it on a process pool."""
+    pairs = set()
+    invalid_entries = []
+    for entry in entries:
+        english_word = entry.get("english_word", "").strip().lower()
+        yoruba_text = entry.get("yoruba_translations", "")
+        if not english_word or not yoruba_text:
+            continue
+
+        english_word = normalize_word_text(_strip_parenthesized(english_word))
+        yoruba_translations = [y.strip() for y in yoruba_text.split(",") if y.strip()]
+        if not is_valid_english_word(english_word):
+            invalid_entries.append({
+                "english": english_word,
+                "yoruba": ", ".join(yoruba_translations),
+                "reason": "Invalid English word"
+            })
+            continue
+
+        for yoruba_word in yoruba_translations:
+            yoruba_word = normalize_word_text(_strip_parenthesized(yoruba_word))
+            if not is_valid_yoruba_word(yoruba_word):
+                invalid_entries.append({
+                    "english": english_word,
+                    "yoruba": yoruba_word,
+                    "reason": "Invalid Yoruba word"
+                })
+                continue
+            pairs.add((english_word, yoruba_word))
+    return PreparedEntries(pairs, invalid_entries)
+
+
+def write_data_fast(app=None):
+    """Seed the whole dataset in one transaction with set-based statements
+    (see fast_seed) instead of per-entry ORM calls; logs rows/sec."""
+    with open(DATASET_PATH, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+    prepared = prepare_entries(entries)
+    logger.info(
+        f"Prepared {len(prepared.pairs)} distinct pairs from {len(entries)} entries, "
+        f"rejected {len(prepared.invalid_entries)} invalid entries"
+    )
+
+    app = app or create_app()
+    with app.app_context():
+        result = load_translation_pairs(db, prepared.pairs)
+        db.session.commit()
+
+    invalid_entries = prepared.invalid_entries + [
+        {"english": english, "yoruba": yoruba, "reason": "Ambiguous sense"}
+        for english, yoruba in result.ambiguous_pairs
+    ]
+    if invalid_entries:
+        invalid_file = DATA_DIR / "invalid_datasets" / "translations" / "invalid_entries_fast.json"
+        invalid_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(invalid_file, "w", encoding="utf-8") as f:
+            json.dump(invalid_entries, f, indent=2, ensure_ascii=False)
+        logger.warning(f"Wrote {len(invalid_entries)} invalid entries to {invalid_file}")
+
+    logger.info(
+        f"Loaded {result.pairs} pairs in {result.seconds:.2f}s ({result.rows_per_second:.0f} rows/sec): "
+        f"{result.words_created} new words, {result.senses_created} new senses, "
+        f"{result.translations_created} new translations"
+    )
+    return result
+
+
 if __name__ == '__main__':
-    write_data()
+    parser = argparse.ArgumentParser(description="Seed English-Yoruba translations.")
+    parser.add_argument(
+        "--per-entry", action="store_true",
+        help="Use the slower per-entry ORM path instead of the set-based loader.",
+    )
+    parser.add_argument("--workers", type=int, default=0, help="Validation processes for --per-entry.")
+    parser.add_argument("--restart", action="store_true", help="Ignore the --per-entry checkpoint.")
+    args = parser.parse_args()
+    if args.per_entry:
+        write_data(workers=args.workers, restart=args.restart)
+    else:
+        write_data_fast()
@@ -1,10 +1,11 @@
 from datetime import date, datetime
 from sqlalchemy import Index, String, Text, func
 from sqlalchemy import text as sql_text
+from sqlalchemy.orm import validates
 from sqlalchemy.types import TypeDecorator
 
 from alarino_backend.flask_extensions import db
-from alarino_backend.normalization import normalize_text, normalize_word_text
+from alarino_backend.normalization import fold_diacritics, normalize_text, normalize_word_text
 from alarino_backend.parts_of_speech import ALLOWED_POS_VALUES
 
 
@@ -45,6 +46,18 @@ class NFCText(TypeDecorator):
             return None
         return normalize_text(value)
 
+# Translation.review_status values. Curated rows are approved; rows proposed
+# by the LLM wait in the review queue as pending until an admin promotes
+# (approves) or rejects (deletes) them.
+REVIEW_APPROVED = "approved"
+REVIEW_PENDING = "pending"
+REVIEW_STATUSES = (REVIEW_APPROVED, REVIEW_PENDING)
+
+
+def _folded_word_text(context) -> str:
+    return fold_diacritics(normalize_word_text(context.get_current_parameters()["text"]))
+
+
 class Word(db.Model):
     __tablename__ = 'words'
 
@@ -55,6 +68,12 @@ class Word(db.Model):
     # column holding the lexical string was renamed for clarity, since
     # `word.word` was awkward and `word.text` reads naturally.
     text = db.Column(NFCWord(200), nullable=False)
+    # fold_diacritics(text): tone marks and under-dots stripped, so "omo"
+    # finds "ọmọ". Kept in step with text by the validator below (ORM) and
+    # the column default (Core inserts); never written directly. Raw SQL
+    # inserts get '' and are found by exact text only until
+    # data/backfill_folded_words.py runs.
+    folded_text = db.Column(String(200), nullable=False, default=_folded_word_text, server_default='')
     # Phase 6d removed Word.part_of_speech. POS is now a sense-level attribute
     # only — a polysemous word can carry distinct POS values per sense (e.g.,
     # "run" as both noun and verb). Set Sense.part_of_speech instead.
@@ -71,8 +90,15 @@ class Word(db.Model):
             "language IN ('en', 'yo')",
             name='ck_words_language_valid',
         ),
+        Index('idx_words_language_folded_text', 'language', 'folded_text'),
     )
 
+    @validates('text')
+    def _sync_folded_text(self, key, value):
+        if value is not None:
+            self.folded_text = fold_diacritics(normalize_word_text(value))
+        return value
+
     def __repr__(self):
         return f"<Word {self.language}:{self.text}>"
 
@@ -99,6 +125,14 @@ class Translation(db.Model):
     note = db.Column(db.Text, nullable=True)
     confidence = db.Column(db.Float, nullable=True)
     provenance = db.Column(db.String(40), nullable=True)
+    # Pending rows are served by /api/translate (with their provenance) but
+    # kept out of the daily word and the sitemap until reviewed.
+    review_status = db.Column(
+        db.String(10),
+        nullable=False,
+        default=REVIEW_APPROVED,
+        server_default=REVIEW_APPROVED,
+    )
     created_at = db.Column(
         db.DateTime,
         nullable=False,
@@ -124,6 +158,18 @@ class Translation(db.Model):
         # join; without an index on source_word_id, that side scans.
         Index('idx_translations_source_word_id', 'source_word_id'),
         Index('idx_translations_target_word_id', 'target_word_id'),
+        # The review queue is the only reader by status, and it only wants
+        # the (few) pending rows.
+        Index(
+            'idx_translations_pending',
+            'created_at',
+            postgresql_where=sql_text("review_status = 'pending'"),
+            sqlite_where=sql_text("review_status = 'pending'"),
+        ),
+        db.CheckConstraint(
+            "review_status IN ('approved', 'pending')",
+            name='ck_translations_review_status_valid',
+        ),
     )
 
     def __repr__(self):
@@ -246,6 +292,116 @@ class MissingTranslation(db.Model):
         return f"<Missing '{self.text}' from {self.source_language} to {self.target_language}>"
 
 
+class MissingTranslationEvent(db.Model):
+    """One row per translate() miss, appended by the event writer when
+    MISSING_TRANSLATION_SINK=events. Raw events are transient: the rollup
+    job folds them into MissingTranslationDailyCount and missing_translations
+    and deletes them."""
+
+    __tablename__ = 'missing_translation_events'
+
+    ev_id = db.Column(db.Integer, primary_key=True)
+    text = db.Column(NFCWord(200), nullable=False)
+    source_language = db.Column(db.String(3), nullable=False)
+    target_language = db.Column(db.String(3), nullable=False)
+    user_agent = db.Column(db.Text)
+    requested_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.now,
+        server_default=func.now(),
+    )
+
+    __table_args__ = (
+        db.CheckConstraint(
+            "source_language IN ('en', 'yo')",
+            name='ck_missing_translation_events_source_language_valid',
+        ),
+        db.CheckConstraint(
+            "target_language IN ('en', 'yo')",
+            name='ck_missing_translation_events_target_language_valid',
+        ),
+    )
+
+    def __repr__(self):
+        return f"<MissingEvent '{self.text}' from {self.source_language} to {self.target_language} at {self.requested_at}>"
+
+
+class MissingTranslationDailyCount(db.Model):
+    """Misses per (day, text, source, target), written by the rollup job.
+    Answers "what are users failing to find this week" without raw events."""
+
+    __tablename__ = 'missing_translation_daily_counts'
+
+    day = db.Column(db.Date, primary_key=True)
+    text = db.Column(NFCWord(200), primary_key=True)
+    source_language = db.Column(db.String(3), primary_key=True)
+    target_language = db.Column(db.String(3), primary_key=True)
+    hit_count = db.Column(db.Integer, nullable=False)
+
+    __table_args__ = (
+        db.CheckConstraint(
+            "source_language IN ('en', 'yo')",
+            name='ck_missing_translation_daily_counts_source_language_valid',
+        ),
+        db.CheckConstraint(
+            "target_language IN ('en', 'yo')",
+            name='ck_missing_translation_daily_counts_target_language_valid',
+        ),
+    )
+
+    def __repr__(self):
+        return f"<MissingDaily {self.day} '{self.text}' {self.source_language}->{self.target_language}: {self.hit_count}>"
+
+
+# BulkUploadJob.status values, in lifecycle order.
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class BulkUploadJob(db.Model):
+    """An /api/admin/bulk-upload submitted as a background job. The worker
+    commits the payload chunk by chunk and updates the counters with each
+    chunk, so a poll sees progress and a crash keeps the chunks already
+    stored. ``failed_pairs`` holds the first BULK_UPLOAD_MAX_REPORTED_FAILURES
+    per-row failures; ``failed_count`` counts them all."""
+
+    __tablename__ = 'bulk_upload_jobs'
+
+    job_id = db.Column(db.String(32), primary_key=True)
+    status = db.Column(db.String(10), nullable=False, default=JOB_QUEUED, server_default=JOB_QUEUED)
+    dry_run = db.Column(db.Boolean, nullable=False)
+    # Cleared once the job finishes.
+    payload = db.Column(db.Text, nullable=False)
+    total_rows = db.Column(db.Integer, nullable=False, default=0, server_default=sql_text("0"))
+    processed_rows = db.Column(db.Integer, nullable=False, default=0, server_default=sql_text("0"))
+    successful_count = db.Column(db.Integer, nullable=False, default=0, server_default=sql_text("0"))
+    failed_count = db.Column(db.Integer, nullable=False, default=0, server_default=sql_text("0"))
+    translations_created = db.Column(db.Integer, nullable=False, default=0, server_default=sql_text("0"))
+    failed_pairs = db.Column(db.JSON, nullable=False, default=list)
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.now,
+        server_default=func.now(),
+    )
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    __table_args__ = (
+        db.CheckConstraint(
+            "status IN ('queued', 'running', 'succeeded', 'failed')",
+            name='ck_bulk_upload_jobs_status_valid',
+        ),
+    )
+
+    def __repr__(self):
+        return f"<BulkUploadJob {self.job_id} {self.status} {self.processed_rows}/{self.total_rows}>"
+
+
 class Example(db.Model):
     __tablename__ = 'examples'
 
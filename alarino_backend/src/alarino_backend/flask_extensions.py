@@ -3,3 +3,17 @@ from flask_sqlalchemy import SQLAlchemy
 
 db: SQLAlchemy = SQLAlchemy()
 migrate: Migrate = Migrate()
+
+
+def dialect_insert(session):
+    """The dialect-specific ``insert`` construct for ``session``'s bind, for
+    statements that need ON CONFLICT. Only Postgres (production) and SQLite
+    (tests, local dev) are supported."""
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"ON CONFLICT inserts not implemented for dialect {dialect_name!r}")
+    return insert
@@ -0,0 +1,358 @@
+# full_text_search.py
+"""Full-text search over proverbs and example sentences.
+
+Every searchable text field (both sides of each Proverb and Example) is one
+row in ``search_documents``, stored twice: ``body`` is the NFC text and
+``folded`` is its fold_diacritics() form. The table is dialect-specific:
+
+    SQLite    an FTS5 virtual table (unicode61 with remove_diacritics 0, so
+              Yoruba tone marks and dots stay part of the token), ranked
+              with bm25().
+    Postgres  a plain table with a generated ``search_vector`` tsvector
+              (body weighted A, folded weighted B) under a GIN index, ranked
+              with ts_rank_cd().
+
+Search is diacritic-aware: a query word typed with diacritics must match
+exactly (against ``body``), while a word typed without any matches every
+diacritic variant (against ``folded``), so "oro" finds "ọ̀rọ̀" but "ọ̀rọ̀"
+does not find "ọrọ". Bare words are ANDed; double-quoted phrases must
+appear in order. Snippets are cut and highlighted in Python with the same
+matching rule, so both dialects highlight identically.
+
+The table is created with the rest of the schema (metadata create_all for
+tests and dev, migration c3d9e1a7b25f in production). add_proverb indexes
+new proverbs in the same transaction; data/rebuild_search_index.py
+(re)indexes everything, e.g. after the migration or a bulk import.
+Examples have no write path in the app, so they are only indexed by that
+rebuild: run it after adding or changing examples.
+"""
+
+import html
+import re
+from typing import Iterable, NamedTuple, Optional
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.orm import aliased
+
+from alarino_backend.db_models import Example, Proverb, Sense, Word
+from alarino_backend.flask_extensions import db
+from alarino_backend.languages import Language
+from alarino_backend.normalization import fold_diacritics, normalize_text
+
+SEARCH_TABLE = "search_documents"
+
+PROVERB = "proverb"
+EXAMPLE = "example"
+DOCUMENT_TYPES = (PROVERB, EXAMPLE)
+
+SNIPPET_TOKENS = 12
+_HIGHLIGHT_OPEN = "<mark>"
+_HIGHLIGHT_CLOSE = "</mark>"
+
+# Word characters plus combining marks: Python's \w alone splits "ẹ̀kọ́" at
+# the combining grave, which FTS5 and to_tsvector do not.
+_TOKEN = re.compile(r"[\w\u0300-\u036f]+")
+_PHRASE = re.compile(r'"([^"]*)"')
+
+_SQLITE_CREATE = DDL(
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+    "doc_type UNINDEXED, doc_id UNINDEXED, field UNINDEXED, language UNINDEXED, "
+    "body, folded, tokenize = 'unicode61 remove_diacritics 0')"
+)
+_POSTGRES_CREATE = DDL(
+    f"""
+    CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} (
+        doc_type VARCHAR(16) NOT NULL,
+        doc_id INTEGER NOT NULL,
+        field VARCHAR(32) NOT NULL,
+        language VARCHAR(3),
+        body TEXT NOT NULL,
+        folded TEXT NOT NULL,
+        search_vector TSVECTOR GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', body), 'A')
+            || setweight(to_tsvector('simple', folded), 'B')
+        ) STORED,
+        PRIMARY KEY (doc_type, doc_id, field)
+    );
+    CREATE INDEX IF NOT EXISTS ix_{SEARCH_TABLE}_search_vector
+        ON {SEARCH_TABLE} USING GIN (search_vector)
+    """
+)
+_DROP = DDL(f"DROP TABLE IF EXISTS {SEARCH_TABLE}")
+
+event.listen(db.metadata, "after_create", _SQLITE_CREATE.execute_if(dialect="sqlite"))
+event.listen(db.metadata, "after_create", _POSTGRES_CREATE.execute_if(dialect="postgresql"))
+event.listen(db.metadata, "before_drop", _DROP)
+
+
+class SearchDocument(NamedTuple):
+    doc_type: str
+    doc_id: int
+    field: str
+    language: Optional[str]
+    body: str
+
+
+class Clause(NamedTuple):
+    """Consecutive tokens that must all match one column: ``body`` (exact)
+    or ``folded`` (diacritic-insensitive). A single-token clause is a term."""
+
+    column: str
+    tokens: tuple[str, ...]
+
+
+class SearchHit(NamedTuple):
+    doc_type: str
+    doc_id: int
+    field: str
+    language: Optional[str]
+    score: float
+
+
+def search_tokens(text_: str) -> list[str]:
+    return _TOKEN.findall(normalize_text(text_).lower())
+
+
+def _has_diacritics(token: str) -> bool:
+    return fold_diacritics(token) != token
+
+
+def parse_search_query(q: str) -> list[Clause]:
+    """Turn ``q`` into AND-ed clauses. Words without diacritics go to the
+    folded column. A quoted phrase that mixes both kinds is matched as a
+    folded phrase plus an exact clause per diacritic word."""
+    clauses: list[Clause] = []
+    groups = [search_tokens(phrase) for phrase in _PHRASE.findall(q)]
+    groups += [[token] for token in search_tokens(_PHRASE.sub(" ", q))]
+    for tokens in groups:
+        if not tokens:
+            continue
+        exact = [token for token in tokens if _has_diacritics(token)]
+        if len(exact) == len(tokens):
+            clauses.append(Clause("body", tuple(tokens)))
+            continue
+        clauses.append(Clause("folded", tuple(fold_diacritics(token) for token in tokens)))
+        clauses.extend(Clause("body", (token,)) for token in exact)
+    return list(dict.fromkeys(clauses))
+
+
+def make_snippet(text_: str, clauses: list[Clause], max_tokens: int = SNIPPET_TOKENS) -> str:
+    """HTML-escaped excerpt of ``text_`` of at most ``max_tokens`` words,
+    starting near the first match, with matching words wrapped in <mark>."""
+    exact = {token for clause in clauses if clause.column == "body" for token in clause.tokens}
+    folded = {token for clause in clauses if clause.column == "folded" for token in clause.tokens}
+    matches = list(_TOKEN.finditer(text_))
+    if not matches:
+        return html.escape(text_)
+
+    def is_hit(match: re.Match) -> bool:
+        token = match.group().lower()
+        return token in exact or fold_diacritics(token) in folded
+
+    first_hit = next((i for i, match in enumerate(matches) if is_hit(match)), 0)
+    start = max(0, min(first_hit - max_tokens // 4, len(matches) - max_tokens))
+    window = matches[start:start + max_tokens]
+
+    begin = 0 if start == 0 else window[0].start()
+    end = len(text_) if start + max_tokens >= len(matches) else window[-1].end()
+    parts = ["…" if begin else ""]
+    cursor = begin
+    for match in window:
+        parts.append(html.escape(text_[cursor:match.start()]))
+        word = html.escape(match.group())
+        parts.append(f"{_HIGHLIGHT_OPEN}{word}{_HIGHLIGHT_CLOSE}" if is_hit(match) else word)
+        cursor = match.end()
+    parts.append(html.escape(text_[cursor:end]))
+    parts.append("…" if end < len(text_) else "")
+    return "".join(parts)
+
+
+class _SqliteBackend:
+    @staticmethod
+    def match_expression(clauses: list[Clause]) -> str:
+        return " AND ".join(f'{clause.column} : "{" ".join(clause.tokens)}"' for clause in clauses)
+
+    def search(self, session, clauses, language, doc_type, limit, offset) -> tuple[int, list[SearchHit]]:
+        where = [f"{SEARCH_TABLE} MATCH :match"]
+        params = {"match": self.match_expression(clauses), "limit": limit, "offset": offset}
+        if language is not None:
+            where.append("language = :language")
+            params["language"] = language.value
+        if doc_type is not None:
+            where.append("doc_type = :doc_type")
+            params["doc_type"] = doc_type
+        condition = " AND ".join(where)
+        total = session.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {condition}"), params).scalar()
+        # bm25() is lower-is-better; exact (body) hits weigh twice folded ones.
+        rows = session.execute(
+            text(
+                f"SELECT doc_type, doc_id, field, language, "
+                f"-bm25({SEARCH_TABLE}, 0, 0, 0, 0, 2.0, 1.0) AS score "
+                f"FROM {SEARCH_TABLE} WHERE {condition} "
+                f"ORDER BY score DESC, doc_type, doc_id, field LIMIT :limit OFFSET :offset"
+            ),
+            params,
+        )
+        return total, [SearchHit(*row) for row in rows]
+
+
+class _PostgresBackend:
+    @staticmethod
+    def tsquery(clauses: list[Clause]) -> str:
+        weight = {"body": "A", "folded": "B"}
+        return " & ".join(
+            "(" + " <-> ".join(f"'{token}':{weight[clause.column]}" for token in clause.tokens) + ")"
+            for clause in clauses
+        )
+
+    def search(self, session, clauses, language, doc_type, limit, offset) -> tuple[int, list[SearchHit]]:
+        where = ["search_vector @@ to_tsquery('simple', :query)"]
+        params = {"query": self.tsquery(clauses), "limit": limit, "offset": offset}
+        if language is not None:
+            where.append("language = :language")
+            params["language"] = language.value
+        if doc_type is not None:
+            where.append("doc_type = :doc_type")
+            params["doc_type"] = doc_type
+        condition = " AND ".join(where)
+        total = session.execute(text(f"SELECT count(*) FROM {SEARCH_TABLE} WHERE {condition}"), params).scalar()
+        rows = session.execute(
+            text(
+                f"SELECT doc_type, doc_id, field, language, "
+                f"ts_rank_cd(search_vector, to_tsquery('simple', :query)) AS score "
+                f"FROM {SEARCH_TABLE} WHERE {condition} "
+                f"ORDER BY score DESC, doc_type, doc_id, field LIMIT :limit OFFSET :offset"
+            ),
+            params,
+        )
+        return total, [SearchHit(*row) for row in rows]
+
+
+def _backend(session):
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "sqlite":
+        return _SqliteBackend()
+    if dialect_name == "postgresql":
+        return _PostgresBackend()
+    raise NotImplementedError(f"Full-text search not implemented for dialect {dialect_name!r}")
+
+
+def index_documents(session, documents: Iterable[SearchDocument], replace: bool = True) -> int:
+    """Insert ``documents``, replacing any already indexed under the same
+    (doc_type, doc_id, field) unless ``replace`` is False (the caller has
+    just emptied the table). Does not commit."""
+    rows = [
+        {**document._asdict(), "body": normalize_text(document.body), "folded": fold_diacritics(document.body)}
+        for document in documents
+    ]
+    if not rows:
+        return 0
+    if replace:
+        session.execute(
+            text(f"DELETE FROM {SEARCH_TABLE} WHERE doc_type = :doc_type AND doc_id = :doc_id AND field = :field"),
+            rows,
+        )
+    session.execute(
+        text(
+            f"INSERT INTO {SEARCH_TABLE} (doc_type, doc_id, field, language, body, folded) "
+            f"VALUES (:doc_type, :doc_id, :field, :language, :body, :folded)"
+        ),
+        rows,
+    )
+    return len(rows)
+
+
+def proverb_documents(proverb: Proverb) -> list[SearchDocument]:
+    return [
+        SearchDocument(PROVERB, proverb.p_id, "yoruba_text", Language.YORUBA.value, proverb.yoruba_text),
+        SearchDocument(PROVERB, proverb.p_id, "english_text", Language.ENGLISH.value, proverb.english_text),
+    ]
+
+
+def example_documents(
+    example: Example, source_language: Optional[str], target_language: Optional[str]
+) -> list[SearchDocument]:
+    return [
+        SearchDocument(EXAMPLE, example.e_id, "example_source", source_language, example.example_source),
+        SearchDocument(EXAMPLE, example.e_id, "example_target", target_language, example.example_target),
+    ]
+
+
+def index_proverb(session, proverb: Proverb) -> None:
+    index_documents(session, proverb_documents(proverb))
+
+
+def rebuild_search_index(db) -> int:
+    """Re-index every proverb and example from scratch and commit. Returns
+    the number of documents written."""
+    db.session.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    count = 0
+    for proverb in db.session.query(Proverb).yield_per(1000):
+        count += index_documents(db.session, proverb_documents(proverb), replace=False)
+
+    source_sense, target_sense = aliased(Sense), aliased(Sense)
+    source_word, target_word = aliased(Word), aliased(Word)
+    examples = (
+        db.session.query(Example, source_word.language, target_word.language)
+        .outerjoin(source_sense, Example.source_sense_id == source_sense.sense_id)
+        .outerjoin(source_word, source_sense.word_id == source_word.w_id)
+        .outerjoin(target_sense, Example.target_sense_id == target_sense.sense_id)
+        .outerjoin(target_word, target_sense.word_id == target_word.w_id)
+    )
+    for example, source_language, target_language in examples.yield_per(1000):
+        count += index_documents(
+            db.session, example_documents(example, source_language, target_language), replace=False
+        )
+    db.session.commit()
+    return count
+
+
+def search(
+    db,
+    q: str,
+    language: Optional[Language] = None,
+    doc_type: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> tuple[list[Clause], int, list[SearchHit]]:
+    """Parse ``q`` and run it. Returns the parsed clauses (for snippets),
+    the total match count, and one page of hits, best first."""
+    clauses = parse_search_query(q)
+    if not clauses:
+        return clauses, 0, []
+    total, hits = _backend(db.session).search(db.session, clauses, language, doc_type, limit, offset)
+    return clauses, total, hits
+
+
+def load_hits(db, clauses: list[Clause], hits: list[SearchHit]) -> list[dict]:
+    """Hydrate ``hits`` into result dicts (text, its translation, snippet,
+    score), one primary-key IN query per document type. Hits whose row was
+    deleted since it was indexed are skipped."""
+    ids = {doc_type: [hit.doc_id for hit in hits if hit.doc_type == doc_type] for doc_type in DOCUMENT_TYPES}
+    proverbs = {p.p_id: p for p in Proverb.query.filter(Proverb.p_id.in_(ids[PROVERB]))} if ids[PROVERB] else {}
+    examples = {e.e_id: e for e in Example.query.filter(Example.e_id.in_(ids[EXAMPLE]))} if ids[EXAMPLE] else {}
+    other_side = {
+        "yoruba_text": "english_text",
+        "english_text": "yoruba_text",
+        "example_source": "example_target",
+        "example_target": "example_source",
+    }
+
+    results = []
+    for hit in hits:
+        row = (proverbs if hit.doc_type == PROVERB else examples).get(hit.doc_id)
+        if row is None:
+            continue
+        matched_text = getattr(row, hit.field)
+        results.append(
+            {
+                "type": hit.doc_type,
+                "id": hit.doc_id,
+                "language": hit.language,
+                "text": matched_text,
+                "translation": getattr(row, other_side[hit.field]),
+                "snippet": make_snippet(matched_text, clauses),
+                "score": round(float(hit.score), 4),
+            }
+        )
+    return results
@@ -0,0 +1,92 @@
+"""Commit-time notifications for lexicon writes.
+
+Write paths (add_word, create_translation, and everything built on them:
+bulk upload, the seed loaders) record which (language, text) words they
+touched on the current session. Once the session commits, every registered
+listener is called with the set of changed words; a rollback discards them.
+
+add_proverb records the new proverb ids the same way on a separate
+``PROVERBS`` topic, so proverb-derived structures (the search index) can
+rebuild without waking every word listener.
+
+Notifying after commit rather than at write time means a listener (e.g.
+the translation cache) never drops an entry only to have a concurrent
+request re-populate it from the pre-commit state.
+"""
+
+from typing import Any, Callable, Hashable, Iterable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from alarino_backend.languages import Language
+from alarino_backend.normalization import normalize_word_text
+from alarino_backend.runtime import logger
+
+WordKey = tuple[Language, str]
+LexiconListener = Callable[[frozenset[Any]], None]
+
+WORDS = "words"
+PROVERBS = "proverbs"
+
+_PENDING_KEY = "alarino_lexicon_changes"
+_listeners: dict[str, list[LexiconListener]] = {WORDS: [], PROVERBS: []}
+
+
+def register_listener(listener: LexiconListener, topic: str = WORDS) -> None:
+    """Subscribe ``listener`` to committed changes on ``topic``. Idempotent."""
+    listeners = _listeners[topic]
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def unregister_listener(listener: LexiconListener, topic: str = WORDS) -> None:
+    listeners = _listeners[topic]
+    if listener in listeners:
+        listeners.remove(listener)
+
+
+def _pending(session, topic: str) -> set[Hashable]:
+    return session.info.setdefault(_PENDING_KEY, {}).setdefault(topic, set())
+
+
+def record_word_change(session, language: Language | str, text: str) -> None:
+    """Mark (language, text) as changed in ``session``'s pending transaction."""
+    record_word_changes(session, [(language, text)])
+
+
+def record_word_changes(session, words: Iterable[tuple[Language | str, str]]) -> None:
+    pending = _pending(session, WORDS)
+    for language, text in words:
+        pending.add((Language(language), normalize_word_text(text)))
+
+
+def record_proverb_change(session, p_id: int) -> None:
+    """Mark proverb ``p_id`` as added or changed in ``session``'s pending
+    transaction."""
+    _pending(session, PROVERBS).add(p_id)
+
+
+def notify_listeners(changes: Iterable[Any], topic: str = WORDS) -> None:
+    """Deliver ``changes`` to every listener of ``topic``. A failing
+    listener is logged and skipped; it must not break the commit that
+    triggered it."""
+    changes = frozenset(changes)
+    if not changes:
+        return
+    for listener in list(_listeners[topic]):
+        try:
+            listener(changes)
+        except Exception as e:
+            logger.error(f"Lexicon change listener {listener!r} failed: {e}")
+
+
+@event.listens_for(Session, "after_commit")
+def _dispatch_after_commit(session) -> None:
+    for topic, changes in session.info.pop(_PENDING_KEY, {}).items():
+        notify_listeners(changes, topic)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session) -> None:
+    session.info.pop(_PENDING_KEY, None)
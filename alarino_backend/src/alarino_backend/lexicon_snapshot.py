@@ -0,0 +1,577 @@
+"""Immutable in-memory snapshot of the lexicon for database-free translate().
+
+The whole lexicon (words, senses, translations, examples) is tens of
+thousands of rows, so it fits comfortably in memory as a handful of flat
+arrays. With ``LEXICON_SNAPSHOT_ENABLED=1`` each worker builds a snapshot at
+startup and translate() answers from it without touching the database.
+
+Layout (every column is a flat sequence indexed by row number; string
+columns hold an index into ``strings`` or -1 for NULL):
+
+- words, sorted by (language, text) so lookup is a binary search, carrying
+  their database w_id (SnapshotWord.w_id is that id, not the row number);
+- senses, carrying their database sense_id for deterministic group order;
+- edges (translations), sorted by t_id, with per-edge ranges into the
+  example arrays for the forward (source→target) and reverse sense pair;
+- a CSR adjacency list mapping each word to the edges touching it on
+  either side.
+
+The same layout is what the binary artifact in
+alarino_backend.data.export_lexicon writes, so a snapshot can equally be
+backed by ``array`` objects built from SQL or by zero-copy memoryviews over
+an mmap.
+
+Freshness: the snapshot records a cheap fingerprint of the four tables
+(row counts and max ids). A background thread re-checks the fingerprint
+every ``LEXICON_SNAPSHOT_CHECK_SECONDS`` and rebuilds on a change; commits
+from this worker mark it stale immediately via lexicon_changes. While
+stale (or disabled), translate() falls back to SQL. The fingerprint does
+not see in-place edits to sense metadata or translation notes; those are
+picked up on the next insert or restart.
+"""
+
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+from flask import current_app
+from sqlalchemy import func, select
+
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener
+from alarino_backend.runtime import logger
+
+# Language is stored as a small int in the word_language column.
+LANGUAGE_CODES: tuple[Language, ...] = (Language.ENGLISH, Language.YORUBA)
+_LANGUAGE_INDEX = {language: i for i, language in enumerate(LANGUAGE_CODES)}
+
+SNAPSHOT_ENABLED = os.getenv("LEXICON_SNAPSHOT_ENABLED", "0") == "1"
+SNAPSHOT_CHECK_SECONDS = float(os.getenv("LEXICON_SNAPSHOT_CHECK_SECONDS", "30"))
+# Optional artifact written by alarino_backend.data.export_lexicon. When set,
+# workers map it at startup instead of building from SQL.
+SNAPSHOT_PATH = os.getenv("LEXICON_SNAPSHOT_PATH")
+
+
+class SnapshotWord(NamedTuple):
+    w_id: int
+    text: str
+    language: str
+
+
+class SnapshotSense(NamedTuple):
+    sense_id: int
+    sense_label: Optional[str]
+    definition: Optional[str]
+    register: Optional[str]
+    domain: Optional[str]
+    part_of_speech: Optional[str]
+
+
+class SnapshotTranslation(NamedTuple):
+    note: Optional[str]
+    provenance: Optional[str]
+
+
+class LexiconSnapshot:
+    """Read-only columnar lexicon index. Construct via build_snapshot() or
+    alarino_backend.data.export_lexicon.load_snapshot(); never mutated."""
+
+    def __init__(
+        self,
+        *,
+        fingerprint: tuple,
+        strings: Sequence[str],
+        word_language: Sequence[int],
+        word_text: Sequence[int],
+        word_db_id: Sequence[int],
+        sense_db_id: Sequence[int],
+        sense_label: Sequence[int],
+        sense_definition: Sequence[int],
+        sense_register: Sequence[int],
+        sense_domain: Sequence[int],
+        sense_part_of_speech: Sequence[int],
+        edge_source_word: Sequence[int],
+        edge_target_word: Sequence[int],
+        edge_source_sense: Sequence[int],
+        edge_target_sense: Sequence[int],
+        edge_note: Sequence[int],
+        edge_provenance: Sequence[int],
+        edge_forward_examples: Sequence[int],
+        edge_reverse_examples: Sequence[int],
+        adjacency_offsets: Sequence[int],
+        adjacency_edges: Sequence[int],
+        example_source: Sequence[int],
+        example_target: Sequence[int],
+        backing: Any = None,
+    ):
+        self.fingerprint = fingerprint
+        # Keeps the mmap alive when columns are memoryviews into it.
+        self._backing = backing
+        self.strings = strings
+        self.word_language = word_language
+        self.word_text = word_text
+        self.word_db_id = word_db_id
+        self.sense_db_id = sense_db_id
+        self.sense_label = sense_label
+        self.sense_definition = sense_definition
+        self.sense_register = sense_register
+        self.sense_domain = sense_domain
+        self.sense_part_of_speech = sense_part_of_speech
+        self.edge_source_word = edge_source_word
+        self.edge_target_word = edge_target_word
+        self.edge_source_sense = edge_source_sense
+        self.edge_target_sense = edge_target_sense
+        self.edge_note = edge_note
+        self.edge_provenance = edge_provenance
+        # Example ranges are stored flat as [start0, end0, start1, end1, ...].
+        self.edge_forward_examples = edge_forward_examples
+        self.edge_reverse_examples = edge_reverse_examples
+        self.adjacency_offsets = adjacency_offsets
+        self.adjacency_edges = adjacency_edges
+        self.example_source = example_source
+        self.example_target = example_target
+
+    @property
+    def word_count(self) -> int:
+        return len(self.word_text)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_source_word)
+
+    def _string(self, index: int) -> Optional[str]:
+        return None if index < 0 else self.strings[index]
+
+    def _word_key(self, word: int) -> tuple[int, str]:
+        return (self.word_language[word], self.strings[self.word_text[word]])
+
+    def find_word(self, language: Language, text: str) -> Optional[int]:
+        """Binary-search the (language, text)-sorted word column."""
+        key = (_LANGUAGE_INDEX[Language(language)], text)
+        i = bisect_left(range(self.word_count), key, key=self._word_key)
+        if i < self.word_count and self._word_key(i) == key:
+            return i
+        return None
+
+    def word(self, word: int) -> SnapshotWord:
+        return SnapshotWord(
+            w_id=self.word_db_id[word],
+            text=self.strings[self.word_text[word]],
+            language=LANGUAGE_CODES[self.word_language[word]].value,
+        )
+
+    def sense(self, sense: int) -> Optional[SnapshotSense]:
+        if sense < 0:
+            return None
+        return SnapshotSense(
+            sense_id=self.sense_db_id[sense],
+            sense_label=self._string(self.sense_label[sense]),
+            definition=self._string(self.sense_definition[sense]),
+            register=self._string(self.sense_register[sense]),
+            domain=self._string(self.sense_domain[sense]),
+            part_of_speech=self._string(self.sense_part_of_speech[sense]),
+        )
+
+    def _examples(self, ranges: Sequence[int], edge: int) -> list[dict]:
+        start, end = ranges[2 * edge], ranges[2 * edge + 1]
+        return [
+            {"source": self.strings[self.example_source[i]], "target": self.strings[self.example_target[i]]}
+            for i in range(start, end)
+        ]
+
+    def lookup(self, text: str, source: Language, target: Language):
+        """Return ``(source_text, edges, examples_by_pair)`` in the shape
+        translation_service._build_translation_response consumes, or
+        ``(None, [], {})`` when the word is not in the lexicon."""
+        word = self.find_word(source, text)
+        if word is None:
+            return None, [], {}
+
+        target_index = _LANGUAGE_INDEX[Language(target)]
+        seen_words: set[int] = set()
+        edges = []
+        examples_by_pair: dict[tuple[int, int], list[dict]] = {}
+        for i in range(self.adjacency_offsets[word], self.adjacency_offsets[word + 1]):
+            edge = self.adjacency_edges[i]
+            if self.edge_source_word[edge] == word:
+                other = self.edge_target_word[edge]
+                my_sense, other_sense = self.edge_source_sense[edge], self.edge_target_sense[edge]
+                example_ranges = self.edge_forward_examples
+            else:
+                other = self.edge_source_word[edge]
+                my_sense, other_sense = self.edge_target_sense[edge], self.edge_source_sense[edge]
+                example_ranges = self.edge_reverse_examples
+
+            if self.word_language[other] != target_index or other in seen_words:
+                continue
+            seen_words.add(other)
+
+            my_sense_view = self.sense(my_sense)
+            other_sense_view = self.sense(other_sense)
+            if my_sense_view is not None and other_sense_view is not None:
+                examples_by_pair[(my_sense_view.sense_id, other_sense_view.sense_id)] = self._examples(
+                    example_ranges, edge
+                )
+            edges.append((
+                SnapshotTranslation(
+                    note=self._string(self.edge_note[edge]),
+                    provenance=self._string(self.edge_provenance[edge]),
+                ),
+                self.word(other),
+                my_sense_view,
+                other_sense_view,
+            ))
+        return self.strings[self.word_text[word]], edges, examples_by_pair
+
+
+def lexicon_fingerprint(db) -> tuple:
+    """Row count and max primary key of each lexicon table, in one query.
+    Changes whenever a row is inserted or deleted."""
+    from alarino_backend.db_models import Example, Sense, Translation, Word
+
+    columns = []
+    for pk in (Word.w_id, Sense.sense_id, Translation.t_id, Example.e_id):
+        columns.append(select(func.count(pk)).scalar_subquery())
+        columns.append(select(func.coalesce(func.max(pk), 0)).scalar_subquery())
+    return tuple(db.session.execute(select(*columns)).one())
+
+
+class _StringInterner:
+    def __init__(self):
+        self.strings: list[str] = []
+        self._index: dict[str, int] = {}
+
+    def __call__(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        index = self._index.get(value)
+        if index is None:
+            index = self._index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+
+def build_snapshot(db) -> LexiconSnapshot:
+    """Read the four lexicon tables (one query each) into a LexiconSnapshot."""
+    from alarino_backend.db_models import Example, Sense, Translation, Word
+
+    fingerprint = lexicon_fingerprint(db)
+    intern = _StringInterner()
+
+    word_rows = sorted(
+        (
+            (_LANGUAGE_INDEX[Language(language)], text, w_id)
+            for w_id, language, text in db.session.execute(select(Word.w_id, Word.language, Word.text))
+        ),
+    )
+    word_index = {w_id: i for i, (_, _, w_id) in enumerate(word_rows)}
+    word_language = array("b", (language for language, _, _ in word_rows))
+    word_text = array("i", (intern(text) for _, text, _ in word_rows))
+
+    sense_rows = db.session.execute(
+        select(
+            Sense.sense_id, Sense.sense_label, Sense.definition,
+            Sense.register, Sense.domain, Sense.part_of_speech,
+        ).order_by(Sense.sense_id)
+    ).all()
+    sense_index = {row.sense_id: i for i, row in enumerate(sense_rows)}
+
+    example_rows = db.session.execute(
+        select(
+            Example.source_sense_id, Example.target_sense_id,
+            Example.example_source, Example.example_target,
+        )
+        .where(Example.source_sense_id.is_not(None), Example.target_sense_id.is_not(None))
+        .order_by(Example.source_sense_id, Example.target_sense_id, Example.e_id)
+    ).all()
+    example_ranges: dict[tuple[int, int], tuple[int, int]] = {}
+    for i, row in enumerate(example_rows):
+        pair = (row.source_sense_id, row.target_sense_id)
+        start, _ = example_ranges.get(pair, (i, i))
+        example_ranges[pair] = (start, i + 1)
+
+    edge_rows = db.session.execute(
+        select(
+            Translation.source_word_id, Translation.target_word_id,
+            Translation.source_sense_id, Translation.target_sense_id,
+            Translation.note, Translation.provenance,
+        ).order_by(Translation.t_id)
+    ).all()
+    edge_forward_examples = array("i")
+    edge_reverse_examples = array("i")
+    adjacency: list[list[int]] = [[] for _ in word_rows]
+    for edge, row in enumerate(edge_rows):
+        edge_forward_examples.extend(example_ranges.get((row.source_sense_id, row.target_sense_id), (0, 0)))
+        edge_reverse_examples.extend(example_ranges.get((row.target_sense_id, row.source_sense_id), (0, 0)))
+        source, target = word_index[row.source_word_id], word_index[row.target_word_id]
+        adjacency[source].append(edge)
+        if target != source:
+            adjacency[target].append(edge)
+
+    adjacency_offsets = array("i", [0])
+    adjacency_edges = array("i")
+    for edges in adjacency:
+        adjacency_edges.extend(edges)
+        adjacency_offsets.append(len(adjacency_edges))
+
+    return LexiconSnapshot(
+        fingerprint=fingerprint,
+        word_language=word_language,
+        word_text=word_text,
+        word_db_id=array("i", (w_id for _, _, w_id in word_rows)),
+        sense_db_id=array("i", (row.sense_id for row in sense_rows)),
+        sense_label=array("i", (intern(row.sense_label) for row in sense_rows)),
+        sense_definition=array("i", (intern(row.definition) for row in sense_rows)),
+        sense_register=array("i", (intern(row.register) for row in sense_rows)),
+        sense_domain=array("i", (intern(row.domain) for row in sense_rows)),
+        sense_part_of_speech=array("i", (intern(row.part_of_speech) for row in sense_rows)),
+        edge_source_word=array("i", (word_index[row.source_word_id] for row in edge_rows)),
+        edge_target_word=array("i", (word_index[row.target_word_id] for row in edge_rows)),
+        edge_source_sense=array("i", (sense_index.get(row.source_sense_id, -1) for row in edge_rows)),
+        edge_target_sense=array("i", (sense_index.get(row.target_sense_id, -1) for row in edge_rows)),
+        edge_note=array("i", (intern(row.note) for row in edge_rows)),
+        edge_provenance=array("i", (intern(row.provenance) for row in edge_rows)),
+        edge_forward_examples=edge_forward_examples,
+        edge_reverse_examples=edge_reverse_examples,
+        adjacency_offsets=adjacency_offsets,
+        adjacency_edges=adjacency_edges,
+        example_source=array("i", (intern(row.example_source) for row in example_rows)),
+        example_target=array("i", (intern(row.example_target) for row in example_rows)),
+        strings=intern.strings,
+    )
+
+
+class LexiconDerivedIndex(ABC):
+    """Base for smaller in-memory structures derived from the lexicon
+    (autocomplete, fuzzy matching, phrase segmentation) that rebuild on
+    demand rather than on a timer: stale after a local word commit
+    (subclasses register mark_stale with lexicon_changes), re-checked
+    against lexicon_fingerprint() at most every ``check_seconds``, and
+    rebuilt anyway once older than ``max_age_seconds``.
+
+    By default the request that finds the index stale rebuilds it inline.
+    With ``background`` the rebuild runs on a thread instead and requests
+    keep using the previous structure until _build swaps in the new one."""
+
+    thread_name = "lexicon-derived-index"
+
+    def __init__(
+        self,
+        check_seconds: float,
+        max_age_seconds: float = float("inf"),
+        clock: Callable[[], float] = time.monotonic,
+        background: bool = False,
+    ):
+        self.check_seconds = check_seconds
+        self.max_age_seconds = max_age_seconds
+        self.background = background
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._fingerprint: Optional[tuple] = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._stale = True
+        self._builder: Optional[threading.Thread] = None
+        self._builder_lock = threading.Lock()
+        self.builds = 0
+
+    def mark_stale(self, changes=None) -> None:
+        self._stale = True
+
+    @abstractmethod
+    def _build(self, db) -> None:
+        """Rebuild the structure from the database and swap it in."""
+
+    def _check_due(self) -> bool:
+        return self._stale or self._clock() - self._checked_at >= self.check_seconds
+
+    def _ensure_fresh(self, db) -> None:
+        if not self.background:
+            self._refresh(db)
+            return
+        if not self._check_due():
+            return
+        with self._builder_lock:
+            if self._builder is not None and self._builder.is_alive():
+                return
+            self._builder = threading.Thread(
+                target=self._refresh_in_app_context,
+                args=(current_app._get_current_object(),),
+                name=self.thread_name,
+                daemon=True,
+            )
+            self._builder.start()
+
+    def _refresh(self, db) -> None:
+        if not self._check_due():
+            return
+        with self._lock:
+            if not self._check_due():
+                return
+            now = self._clock()
+            fingerprint = lexicon_fingerprint(db)
+            self._checked_at = now
+            if self._stale or fingerprint != self._fingerprint or now - self._built_at >= self.max_age_seconds:
+                # Clear the flag first: a commit landing mid-build re-sets it.
+                self._stale = False
+                self._build(db)
+                self._fingerprint = fingerprint
+                self._built_at = now
+
+    def _refresh_in_app_context(self, app) -> None:
+        from alarino_backend.flask_extensions import db
+
+        with app.app_context():
+            try:
+                self._refresh(db)
+            except Exception as e:
+                logger.error(f"{type(self).__name__} build failed: {e}")
+            finally:
+                db.session.remove()
+
+
+class LexiconSnapshotManager:
+    """Owns the current snapshot for this worker and keeps it fresh."""
+
+    def __init__(
+        self,
+        enabled: bool = SNAPSHOT_ENABLED,
+        check_seconds: float = SNAPSHOT_CHECK_SECONDS,
+        artifact_path: Optional[str] = SNAPSHOT_PATH,
+    ):
+        self.enabled = enabled
+        self.check_seconds = check_seconds
+        self.artifact_path = artifact_path
+        self._snapshot: Optional[LexiconSnapshot] = None
+        self._stale = True
+        # Bumped by every local commit; a rebuild that started before the
+        # bump must not clear the stale flag.
+        self._generation = 0
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.builds = 0
+        self.last_build_seconds: Optional[float] = None
+
+    def current(self) -> Optional[LexiconSnapshot]:
+        """The snapshot to answer from, or None to fall back to SQL."""
+        if not self.enabled or self._stale:
+            return None
+        return self._snapshot
+
+    def install(self, snapshot: LexiconSnapshot, generation: Optional[int] = None) -> None:
+        self._snapshot = snapshot
+        self._stale = generation is not None and generation != self._generation
+        if self._stale:
+            self._wake.set()
+
+    def mark_stale(self, changes=None) -> None:
+        self._generation += 1
+        self._stale = True
+        self._wake.set()
+
+    def refresh(self, db, force: bool = False) -> bool:
+        """Rebuild if the database fingerprint moved. Returns True if a new
+        snapshot was installed."""
+        generation = self._generation
+        if not force and self._snapshot is not None:
+            if lexicon_fingerprint(db) == self._snapshot.fingerprint:
+                self.install(self._snapshot, generation)
+                return False
+        self._stale = True
+        started = time.perf_counter()
+        snapshot = build_snapshot(db)
+        self.last_build_seconds = time.perf_counter() - started
+        self.builds += 1
+        self.install(snapshot, generation)
+        logger.info(
+            f"Lexicon snapshot built: {snapshot.word_count} words, {snapshot.edge_count} translations "
+            f"in {self.last_build_seconds * 1000:.1f}ms"
+        )
+        return True
+
+    def load_artifact(self, path: str) -> bool:
+        """Map a prebuilt artifact and serve from it. The background refresher
+        then compares its fingerprint against the database as usual."""
+        from alarino_backend.data.export_lexicon import load_snapshot
+
+        started = time.perf_counter()
+        try:
+            snapshot = load_snapshot(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load lexicon artifact {path}: {e}")
+            return False
+        self.install(snapshot)
+        logger.info(
+            f"Lexicon snapshot mapped from {path} in {(time.perf_counter() - started) * 1000:.1f}ms"
+        )
+        return True
+
+    def start(self, app) -> None:
+        """Load the first snapshot (from the artifact if configured, else from
+        SQL) and start the background refresher."""
+        if not self.enabled or self._thread is not None:
+            return
+        from alarino_backend.flask_extensions import db
+
+        if self.artifact_path and self.load_artifact(self.artifact_path):
+            # Check the artifact against the database without blocking startup.
+            self._wake.set()
+        else:
+            with app.app_context():
+                try:
+                    self.refresh(db, force=True)
+                except Exception as e:
+                    logger.error(f"Initial lexicon snapshot build failed; serving from SQL: {e}")
+                finally:
+                    db.session.remove()
+
+        self._thread = threading.Thread(
+            target=self._run, args=(app,), name="lexicon-snapshot", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, app) -> None:
+        from alarino_backend.flask_extensions import db
+
+        while True:
+            self._wake.wait(self.check_seconds)
+            self._wake.clear()
+            if self._stopping:
+                return
+            with app.app_context():
+                try:
+                    self.refresh(db)
+                except Exception as e:
+                    logger.error(f"Lexicon snapshot refresh failed: {e}")
+                finally:
+                    db.session.remove()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        thread.join()
+        self._thread = None
+        self._stopping = False
+
+    def stats(self) -> dict:
+        snapshot = self._snapshot
+        return {
+            "enabled": self.enabled,
+            "stale": self._stale,
+            "builds": self.builds,
+            "last_build_seconds": self.last_build_seconds,
+            "words": snapshot.word_count if snapshot else 0,
+            "translations": snapshot.edge_count if snapshot else 0,
+        }
+
+
+lexicon_snapshot = LexiconSnapshotManager()
+register_listener(lexicon_snapshot.mark_stale)
@@ -0,0 +1,160 @@
+# llm_cache.py
+"""Result cache and single-flight for /api/translate/llm.
+
+An LLM lookup costs a provider call per attempt, each with up to a
+``GRADIENT_TIMEOUT_SECONDS`` timeout, so results are kept far longer than
+dictionary lookups. Entries are keyed on ``(normalized text, source,
+target, model, prompt version)``: switching model or bumping
+LLMService.prompt_version simply stops hitting old entries, which then
+age out.
+
+Storage is a CacheBackend (see alarino_backend.cache_backends), so with a
+``file://`` or ``redis://`` ``ALARINO_CACHE_URL`` results survive restarts
+and are shared by every worker. A translation is kept for
+``LLM_CACHE_TTL_SECONDS``; an empty answer (the model was not confident)
+is cached too, for the shorter ``LLM_CACHE_NEGATIVE_TTL_SECONDS``. A failed
+call (None, or an exception) is never cached.
+
+Concurrent identical requests in one worker are coalesced: the first
+becomes the leader and calls the provider, the rest wait for its result
+(or its exception) instead of making calls of their own. Only the leader
+runs ``on_answer``, so work done with a fresh answer (storing it for
+review, see llm_review) happens once per provider call.
+"""
+
+import os
+import threading
+from typing import Callable, List, Optional
+
+from alarino_backend.cache_backends import CacheBackend, InProcessCacheBackend, create_cache_backend
+from alarino_backend.languages import Language
+from alarino_backend.llm_service import LLMService
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000"))
+DEFAULT_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+DEFAULT_NEGATIVE_TTL_SECONDS = float(os.getenv("LLM_CACHE_NEGATIVE_TTL_SECONDS", str(24 * 3600)))
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[List[str]] = None
+        self.error: Optional[BaseException] = None
+
+
+class LLMTranslationCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        negative_ttl_seconds: float = DEFAULT_NEGATIVE_TTL_SECONDS,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.backend = backend or InProcessCacheBackend(namespace="llm", max_entries=max_entries)
+        self._lock = threading.Lock()
+        self._flights: dict[str, _Flight] = {}
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.upstream_calls = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @staticmethod
+    def key(service: LLMService, text: str, source: Language, target: Language) -> str:
+        model = getattr(service, "model", None) or type(service).__name__
+        prompt_version = getattr(service, "prompt_version", "")
+        return f"{model}:{prompt_version}:{Language(source).value}:{Language(target).value}:{text}"
+
+    def translate(
+        self,
+        service: LLMService,
+        text: str,
+        source: Language,
+        target: Language,
+        on_answer: Optional[Callable[[List[str]], None]] = None,
+    ) -> Optional[List[str]]:
+        """``service.get_translation`` for ``text`` (already normalized),
+        answered from the cache when possible and made at most once at a
+        time per key in this process. ``on_answer`` is called with every
+        non-empty answer that came from the provider, not from the cache."""
+        key = self.key(service, text, source, target)
+        if self.enabled:
+            cached = self.backend.get(key)
+            if cached is not None:
+                with self._lock:
+                    self.hits += 1
+                    if not cached:
+                        self.negative_hits += 1
+                return list(cached)
+
+        with self._lock:
+            self.misses += 1
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return list(flight.result) if flight.result is not None else None
+
+        try:
+            flight.result = self._call(service, key, text, source, target)
+            if flight.result and on_answer is not None:
+                on_answer(flight.result)
+            return flight.result
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def _call(
+        self, service: LLMService, key: str, text: str, source: Language, target: Language
+    ) -> Optional[List[str]]:
+        with self._lock:
+            self.upstream_calls += 1
+        translations = service.get_translation(text, Language(source).value, Language(target).value)
+        if translations is not None and self.enabled:
+            ttl = self.ttl_seconds if translations else self.negative_ttl_seconds
+            self.backend.set(key, list(translations), ttl)
+        return translations
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = {
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "upstream_calls": self.upstream_calls,
+                "in_flight": len(self._flights),
+            }
+        return {
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "negative_ttl_seconds": self.negative_ttl_seconds,
+            **self.backend.stats(),
+            **counters,
+        }
+
+
+llm_translation_cache = LLMTranslationCache(
+    backend=create_cache_backend("llm", max_entries=DEFAULT_MAX_ENTRIES)
+)
@@ -0,0 +1,187 @@
+# llm_review.py
+"""Provisional lexicon entries from /api/translate/llm, and their review
+queue.
+
+When the provider answers, each translation is written as a Translation
+with review_status 'pending', provenance ``llm:<model>`` and a confidence
+taken from its rank in the answer (the prompt asks for the most accurate
+first). Missing Words and default Senses are created as for bulk upload.
+From then on /api/translate answers the word from the database, and the
+entry's provenance in the response shows where it came from. Pending rows
+are kept out of the daily word and the sitemap.
+
+Admins list the queue oldest first and promote (approve) or reject
+(delete) rows in bulk. Only pending rows are touched, so a stray id can
+never delete curated data. Rejecting also deletes the Words (and their
+default Senses) the answer brought in, once nothing else uses them, so
+they do not linger as "word found but translation not available". A
+rejected answer is only proposed again if the provider gives it again
+after the LLM cache entry for that word expires.
+"""
+
+from typing import List, Sequence
+
+from sqlalchemy import exists, or_, select
+from sqlalchemy.orm import joinedload
+
+from alarino_backend.data.seed_data_utils import AmbiguousSenseError, add_word, create_translation
+from alarino_backend.db_models import (
+    REVIEW_APPROVED,
+    REVIEW_PENDING,
+    Example,
+    ProverbWord,
+    Sense,
+    Translation,
+    Word,
+    db,
+)
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import record_word_changes
+from alarino_backend.runtime import logger
+
+LLM_PROVENANCE_PREFIX = "llm:"
+# Confidence of an answer's first translation; later ones get
+# LLM_BASE_CONFIDENCE / (rank + 1). An ordering signal for reviewers, not a
+# calibrated probability.
+LLM_BASE_CONFIDENCE = 0.5
+
+REVIEW_ACTIONS = ("promote", "reject")
+
+
+def llm_provenance(service) -> str:
+    model = getattr(service, "model", None) or type(service).__name__
+    return (LLM_PROVENANCE_PREFIX + model)[:40]
+
+
+def llm_confidence(rank: int) -> float:
+    return round(LLM_BASE_CONFIDENCE / (rank + 1), 3)
+
+
+def store_llm_translations(
+    text: str, source: Language, target: Language, translations: Sequence[str], provenance: str
+) -> List[Translation]:
+    """Write ``translations`` of ``text`` as pending Translation rows and
+    commit. Pairs that already exist (curated or pending) are left alone;
+    invalid words and words with several senses are skipped."""
+    try:
+        source_word = add_word(source, text)
+        if source_word is None:
+            return []
+        stored = []
+        for rank, translated in enumerate(translations):
+            target_word = add_word(target, translated)
+            if target_word is None:
+                continue
+            db.session.flush()
+            try:
+                translation = create_translation(
+                    source_word,
+                    target_word,
+                    provenance=provenance,
+                    confidence=llm_confidence(rank),
+                    review_status=REVIEW_PENDING,
+                )
+            except AmbiguousSenseError as e:
+                logger.warning(f"Not storing LLM translation '{text}' -> '{translated}': {e}")
+                continue
+            if translation.review_status == REVIEW_PENDING:
+                stored.append(translation)
+        db.session.commit()
+        return stored
+    except Exception:
+        db.session.rollback()
+        raise
+
+
+def pending_translations(limit: int, offset: int = 0) -> tuple[int, List[Translation]]:
+    """``(total, page)`` of the review queue, oldest first, with both
+    Words loaded."""
+    query = Translation.query.filter(Translation.review_status == REVIEW_PENDING)
+    total = query.count()
+    rows = (
+        query.options(joinedload(Translation.source_word), joinedload(Translation.target_word))
+        .order_by(Translation.created_at, Translation.t_id)
+        .limit(limit)
+        .offset(offset)
+        .all()
+    )
+    return total, rows
+
+
+def review_translations(t_ids: Sequence[int], action: str) -> List[int]:
+    """Promote or reject the pending rows among ``t_ids`` in one statement
+    and commit; returns the ids acted on. Caches holding either side's word
+    are invalidated through lexicon_changes."""
+    if action not in REVIEW_ACTIONS:
+        raise ValueError(f"Unknown review action: {action!r}")
+    rows = (
+        Translation.query
+        .options(joinedload(Translation.source_word), joinedload(Translation.target_word))
+        .filter(Translation.t_id.in_(set(t_ids)), Translation.review_status == REVIEW_PENDING)
+        .all()
+    )
+    if not rows:
+        return []
+    ids = sorted(row.t_id for row in rows)
+    record_word_changes(
+        db.session,
+        [
+            (word.language, word.text)
+            for row in rows
+            for word in (row.source_word, row.target_word)
+        ],
+    )
+    query = Translation.query.filter(Translation.t_id.in_(ids))
+    if action == "promote":
+        query.update({Translation.review_status: REVIEW_APPROVED}, synchronize_session=False)
+    else:
+        query.delete(synchronize_session=False)
+        _delete_unused_words(
+            {w_id for row in rows for w_id in (row.source_word_id, row.target_word_id)}
+        )
+    db.session.commit()
+    return ids
+
+
+def _delete_unused_words(word_ids: set[int]) -> None:
+    """Delete the words among ``word_ids`` that no translation or proverb
+    uses any more, with their senses, unless a sense carries curation (POS,
+    label, definition) or an example. Does not commit."""
+    sense_in_use = or_(
+        Sense.part_of_speech.is_not(None),
+        Sense.sense_label.is_not(None),
+        Sense.definition.is_not(None),
+        exists().where(or_(
+            Example.source_sense_id == Sense.sense_id,
+            Example.target_sense_id == Sense.sense_id,
+        )),
+    )
+    unused = db.session.scalars(
+        select(Word.w_id).where(
+            Word.w_id.in_(word_ids),
+            ~exists().where(or_(
+                Translation.source_word_id == Word.w_id,
+                Translation.target_word_id == Word.w_id,
+            )),
+            ~exists().where(ProverbWord.word_id == Word.w_id),
+            ~exists().where(Sense.word_id == Word.w_id, sense_in_use),
+        )
+    ).all()
+    if not unused:
+        return
+    Sense.query.filter(Sense.word_id.in_(unused)).delete(synchronize_session=False)
+    Word.query.filter(Word.w_id.in_(unused)).delete(synchronize_session=False)
+
+
+def review_entry(translation: Translation) -> dict:
+    source_word, target_word = translation.source_word, translation.target_word
+    return {
+        "id": translation.t_id,
+        "source_word": source_word.text,
+        "source_language": source_word.language,
+        "target_word": target_word.text,
+        "target_language": target_word.language,
+        "provenance": translation.provenance,
+        "confidence": translation.confidence,
+        "created_at": translation.created_at.isoformat() if translation.created_at else None,
+    }
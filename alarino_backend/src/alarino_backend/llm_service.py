@@ -18,6 +18,10 @@ DEFAULT_TIMEOUT_SECONDS = float(os.getenv("GRADIENT_TIMEOUT_SECONDS", "20"))
 
 
 class LLMService(ABC):
+    # Part of the llm_cache key. Bump it whenever the prompt changes so
+    # answers to the old prompt stop being served.
+    prompt_version = "1"
+
     @abstractmethod
     def get_translation(self, text: str, source_lang: str, target_lang: str) -> Optional[List[str]]:
         pass
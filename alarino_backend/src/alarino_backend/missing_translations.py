@@ -0,0 +1,424 @@
+# missing_translations.py
+"""Recording of translate() misses in the missing_translations table.
+
+Every 404 from /api/translate counts a hit against the (text, source,
+target) tuple. Doing that as one upsert + commit inside the request turns a
+burst of unknown words into a burst of write transactions contending for
+the same hot rows. MissingTranslationBuffer instead sums hits per tuple in
+memory and a background thread writes them as one multi-row upsert every
+MISSING_TRANSLATION_FLUSH_SECONDS, or sooner once
+MISSING_TRANSLATION_FLUSH_THRESHOLD distinct tuples are pending. The buffer
+is flushed once more when the worker exits.
+
+Counts are at-least-once per flush attempt but may lag by up to one flush
+interval; a worker killed with SIGKILL loses what it had buffered.
+
+With MISSING_TRANSLATION_SINK=events, misses are instead appended one row
+each to missing_translation_events by MissingTranslationEventWriter (a
+bounded queue drained by a background thread, so the request never waits
+on the database). rollup_missing_translation_events() later folds those
+events into per-day counts and into missing_translations. Only one sink
+runs at a time so hits are never counted twice.
+"""
+
+import atexit
+import os
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Iterable, Optional, TypedDict
+
+from alarino_backend.db_models import (
+    MissingTranslation,
+    MissingTranslationDailyCount,
+    MissingTranslationEvent,
+)
+from alarino_backend.flask_extensions import dialect_insert
+from alarino_backend.languages import Language
+from alarino_backend.normalization import normalize_word_text
+from alarino_backend.runtime import logger
+
+# "buffer" (aggregate per worker) or "events" (append-only events + rollup).
+SINK = os.getenv("MISSING_TRANSLATION_SINK", "buffer")
+BUFFER_ENABLED = SINK == "buffer" and os.getenv("MISSING_TRANSLATION_BUFFER_ENABLED", "1") == "1"
+EVENTS_ENABLED = SINK == "events"
+FLUSH_SECONDS = float(os.getenv("MISSING_TRANSLATION_FLUSH_SECONDS", "5"))
+FLUSH_THRESHOLD = int(os.getenv("MISSING_TRANSLATION_FLUSH_THRESHOLD", "500"))
+# Hard cap on distinct pending tuples, so a database outage can't grow the
+# buffer without bound. New tuples beyond it are dropped (and counted).
+MAX_PENDING = int(os.getenv("MISSING_TRANSLATION_MAX_PENDING", "10000"))
+EVENT_QUEUE_SIZE = int(os.getenv("MISSING_TRANSLATION_EVENT_QUEUE_SIZE", "10000"))
+EVENT_BATCH_SIZE = int(os.getenv("MISSING_TRANSLATION_EVENT_BATCH_SIZE", "500"))
+ROLLUP_BATCH_SIZE = 5000
+
+MissingKey = tuple[str, str, str]
+
+
+class MissingTranslationRow(TypedDict):
+    text: str
+    source_language: str
+    target_language: str
+    user_agent: str
+    hit_count: int
+
+
+def _add_hit_counts(db, model, rows: list[dict], index_elements: list[str]) -> None:
+    """INSERT ... ON CONFLICT (index_elements) DO UPDATE hit_count += excluded."""
+    if not rows:
+        return
+    table = model.__table__
+    stmt = dialect_insert(db.session)(table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={"hit_count": table.c.hit_count + stmt.excluded.hit_count},
+    )
+    db.session.execute(stmt)
+
+
+def upsert_missing_translations(db, rows: list[MissingTranslationRow]) -> None:
+    """Add each row's hit_count to its (text, source, target) tuple in one
+    INSERT ... ON CONFLICT DO UPDATE, then commit. user_agent is only
+    written on first insert. Rows must be unique per tuple: Postgres refuses
+    to update the same row twice in one statement."""
+    _add_hit_counts(db, MissingTranslation, rows, ["text", "source_language", "target_language"])
+    db.session.commit()
+
+
+class _BackgroundWriter(ABC):
+    """Thread plumbing shared by the sinks: a daemon thread calls flush()
+    every ``flush_seconds`` or when woken, and stop() (also run at exit)
+    flushes whatever is left."""
+
+    thread_name = "missing-translation-writer"
+
+    def __init__(self, enabled: bool, flush_seconds: float):
+        self.enabled = enabled
+        self.flush_seconds = flush_seconds
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._app = None
+
+    @property
+    def running(self) -> bool:
+        return self.enabled and self._thread is not None
+
+    @abstractmethod
+    def flush(self, db) -> int:
+        """Write out what is pending; returns how many entries."""
+
+    def start(self, app) -> None:
+        if not self.enabled or self._thread is not None:
+            return
+        self._app = app
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def _flush_in_app_context(self) -> None:
+        from alarino_backend.flask_extensions import db
+
+        with self._app.app_context():
+            try:
+                self.flush(db)
+            finally:
+                db.session.remove()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            if self._stopping:
+                return
+            self._flush_in_app_context()
+
+    def stop(self) -> None:
+        """Stop the background thread and flush whatever is left."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        thread.join()
+        self._thread = None
+        self._stopping = False
+        atexit.unregister(self.stop)
+        self._flush_in_app_context()
+
+
+class MissingTranslationBuffer(_BackgroundWriter):
+    """Per-worker aggregation of misses, flushed in the background."""
+
+    thread_name = "missing-translation-flush"
+
+    def __init__(
+        self,
+        enabled: bool = BUFFER_ENABLED,
+        flush_seconds: float = FLUSH_SECONDS,
+        flush_threshold: int = FLUSH_THRESHOLD,
+        max_pending: int = MAX_PENDING,
+    ):
+        super().__init__(enabled, flush_seconds)
+        self.flush_threshold = flush_threshold
+        self.max_pending = max_pending
+        self._pending: dict[MissingKey, MissingTranslationRow] = {}
+        self._lock = threading.Lock()
+        # Serializes flushes so the shutdown flush can't interleave with the
+        # background one.
+        self._flush_lock = threading.Lock()
+        self.flushes = 0
+        self.flushed_rows = 0
+        self.flushed_hits = 0
+        self.failed_flushes = 0
+        self.dropped_hits = 0
+        self.last_flush_seconds: Optional[float] = None
+        self.max_flush_seconds = 0.0
+
+    def add(self, text: str, source: Language | str, target: Language | str, user_agent: str, hits: int = 1) -> None:
+        key = (
+            normalize_word_text(text),
+            Language(source).value,
+            Language(target).value,
+        )
+        with self._lock:
+            row = self._pending.get(key)
+            if row is not None:
+                row["hit_count"] += hits
+            elif len(self._pending) >= self.max_pending:
+                self.dropped_hits += hits
+                return
+            else:
+                self._pending[key] = MissingTranslationRow(
+                    text=key[0],
+                    source_language=key[1],
+                    target_language=key[2],
+                    user_agent=user_agent,
+                    hit_count=hits,
+                )
+            depth = len(self._pending)
+        if depth >= self.flush_threshold:
+            self._wake.set()
+
+    def _merge_back(self, rows: Iterable[MissingTranslationRow]) -> None:
+        for row in rows:
+            self.add(
+                row["text"], row["source_language"], row["target_language"],
+                row["user_agent"], row["hit_count"],
+            )
+
+    def flush(self, db) -> int:
+        """Write everything pending in one upsert. On failure the hits are
+        put back for the next attempt. Returns the number of rows written."""
+        with self._flush_lock:
+            with self._lock:
+                rows = list(self._pending.values())
+                self._pending = {}
+            if not rows:
+                return 0
+            started = time.perf_counter()
+            try:
+                upsert_missing_translations(db, rows)
+            except Exception as e:
+                db.session.rollback()
+                self.failed_flushes += 1
+                self._merge_back(rows)
+                logger.error(f"Flushing {len(rows)} missing translations failed: {e}")
+                return 0
+            elapsed = time.perf_counter() - started
+            self.flushes += 1
+            self.flushed_rows += len(rows)
+            self.flushed_hits += sum(row["hit_count"] for row in rows)
+            self.last_flush_seconds = elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+            return len(rows)
+
+    def stats(self) -> dict:
+        with self._lock:
+            depth = len(self._pending)
+            pending_hits = sum(row["hit_count"] for row in self._pending.values())
+        return {
+            "enabled": self.enabled,
+            "depth": depth,
+            "pending_hits": pending_hits,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "flushed_hits": self.flushed_hits,
+            "failed_flushes": self.failed_flushes,
+            "dropped_hits": self.dropped_hits,
+            "last_flush_seconds": self.last_flush_seconds,
+            "max_flush_seconds": self.max_flush_seconds,
+        }
+
+
+class MissingTranslationEventWriter(_BackgroundWriter):
+    """Appends one missing_translation_events row per miss. add() only puts
+    on a bounded queue and never blocks; a background thread drains it in
+    batches of ``batch_size`` with one executemany INSERT each. When the
+    queue is full the event is dropped and counted."""
+
+    thread_name = "missing-translation-events"
+
+    def __init__(
+        self,
+        enabled: bool = EVENTS_ENABLED,
+        flush_seconds: float = FLUSH_SECONDS,
+        batch_size: int = EVENT_BATCH_SIZE,
+        max_queue: int = EVENT_QUEUE_SIZE,
+    ):
+        super().__init__(enabled, flush_seconds)
+        self.batch_size = batch_size
+        self._queue: queue.Queue[dict] = queue.Queue(maxsize=max_queue)
+        self._flush_lock = threading.Lock()
+        self.written = 0
+        self.failed_flushes = 0
+        self.dropped = 0
+        self.last_flush_seconds: Optional[float] = None
+
+    def add(self, text: str, source: Language | str, target: Language | str, user_agent: str) -> None:
+        event = {
+            "text": normalize_word_text(text),
+            "source_language": Language(source).value,
+            "target_language": Language(target).value,
+            "user_agent": user_agent,
+            "requested_at": datetime.now(),
+        }
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+            return
+        if self._queue.qsize() >= self.batch_size:
+            self._wake.set()
+
+    def _drain(self) -> list[dict]:
+        events = []
+        while len(events) < self.batch_size:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return events
+
+    def flush(self, db) -> int:
+        """Insert everything queued, ``batch_size`` rows per statement.
+        A failed batch is dropped (and counted) rather than retried so a
+        database outage can't wedge the queue. Returns rows written."""
+        written = 0
+        with self._flush_lock:
+            started = time.perf_counter()
+            while events := self._drain():
+                try:
+                    db.session.execute(MissingTranslationEvent.__table__.insert(), events)
+                    db.session.commit()
+                except Exception as e:
+                    db.session.rollback()
+                    self.failed_flushes += 1
+                    self.dropped += len(events)
+                    logger.error(f"Writing {len(events)} missing translation events failed: {e}")
+                    continue
+                written += len(events)
+            if written:
+                self.written += written
+                self.last_flush_seconds = time.perf_counter() - started
+        return written
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "depth": self._queue.qsize(),
+            "written": self.written,
+            "failed_flushes": self.failed_flushes,
+            "dropped": self.dropped,
+            "last_flush_seconds": self.last_flush_seconds,
+        }
+
+
+def rollup_missing_translation_events(db, batch_size: int = ROLLUP_BATCH_SIZE) -> int:
+    """Fold missing_translation_events into missing_translation_daily_counts
+    and missing_translations, deleting the folded events. Each batch is one
+    transaction, so an event is counted exactly once even if the job dies
+    midway; on Postgres, rows are claimed with FOR UPDATE SKIP LOCKED so
+    overlapping runs don't double count. Returns the number of events."""
+    events_table = MissingTranslationEvent.__table__
+    total = 0
+    while True:
+        events = db.session.execute(
+            db.select(events_table)
+            .order_by(events_table.c.ev_id)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        ).all()
+        if not events:
+            return total
+
+        daily: dict[tuple[date, str, str, str], int] = {}
+        totals: dict[MissingKey, MissingTranslationRow] = {}
+        for event in events:
+            key = (event.text, event.source_language, event.target_language)
+            day_key = (event.requested_at.date(), *key)
+            daily[day_key] = daily.get(day_key, 0) + 1
+            if key in totals:
+                totals[key]["hit_count"] += 1
+            else:
+                totals[key] = MissingTranslationRow(
+                    text=event.text,
+                    source_language=event.source_language,
+                    target_language=event.target_language,
+                    user_agent=event.user_agent,
+                    hit_count=1,
+                )
+
+        try:
+            _add_hit_counts(
+                db,
+                MissingTranslationDailyCount,
+                [
+                    {"day": day, "text": text, "source_language": source,
+                     "target_language": target, "hit_count": hits}
+                    for (day, text, source, target), hits in daily.items()
+                ],
+                ["day", "text", "source_language", "target_language"],
+            )
+            _add_hit_counts(
+                db, MissingTranslation, list(totals.values()),
+                ["text", "source_language", "target_language"],
+            )
+            db.session.execute(
+                events_table.delete().where(events_table.c.ev_id.in_([e.ev_id for e in events]))
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        total += len(events)
+        if len(events) < batch_size:
+            return total
+
+
+def top_missing_translations(db, since: date, limit: int) -> list[dict]:
+    """The most-requested missing (text, source, target) tuples since
+    ``since``, from the rolled-up daily counts."""
+    counts = MissingTranslationDailyCount
+    hits = db.func.sum(counts.hit_count).label("hits")
+    rows = db.session.execute(
+        db.select(counts.text, counts.source_language, counts.target_language, hits)
+        .where(counts.day >= since)
+        .group_by(counts.text, counts.source_language, counts.target_language)
+        .order_by(hits.desc(), counts.text)
+        .limit(limit)
+    ).all()
+    return [
+        {
+            "text": row.text,
+            "source_language": row.source_language,
+            "target_language": row.target_language,
+            "hit_count": row.hits,
+        }
+        for row in rows
+    ]
+
+
+missing_translation_buffer = MissingTranslationBuffer()
+missing_translation_events = MissingTranslationEventWriter()
@@ -33,6 +33,16 @@ def normalize_text(text: str) -> str:
     return unicodedata.normalize("NFC", text.strip())
 
 
+def fold_diacritics(text: str) -> str:
+    """Diacritic-insensitive form of ``text`` for search keys: lowercase
+    with every combining mark removed, so tone marks and the dot below
+    (ẹ, ọ, ṣ) all fold away and "ọ̀rọ̀" and "oro" compare equal. Lossy by
+    design; never store it in place of the canonical text."""
+    decomposed = unicodedata.normalize("NFD", text.lower())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return unicodedata.normalize("NFC", stripped)
+
+
 def audit_normalization_integrity(db) -> dict[str, list[int]]:
     """Scan every canonical text column and return the row IDs whose stored
     value is not the canonical form expected by its column type.
@@ -0,0 +1,114 @@
+# phrase_segmentation.py
+"""Splits a phrase or short sentence into lexicon entries for
+/api/translate/phrase.
+
+The lexicon holds multi-word entries ("fi sílẹ̀", "thank you") next to
+single words, so a phrase is segmented greedily: at each position the
+longest run of tokens that is a known Word of the source language wins,
+and a token that starts no known entry becomes a segment of its own.
+Tokens are the whitespace-separated pieces of the input, each put through
+normalize_word_text, so "Ẹ ṣé, ọ̀rẹ́!" segments the same way as "ẹ ṣé ọ̀rẹ́".
+
+PhraseSegmenter keeps, per language, the set of Word texts (inner
+whitespace collapsed) and, for each first token, the longest entry
+starting with it, so trying lengths at a position is a handful of set
+lookups. It is rebuilt on the next request after this worker commits a
+word, and re-checked against lexicon_fingerprint() every
+``PHRASE_INDEX_CHECK_SECONDS``.
+"""
+
+import os
+import re
+import time
+from typing import Callable, NamedTuple
+
+from alarino_backend.db_models import Word
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener
+from alarino_backend.lexicon_snapshot import LexiconDerivedIndex
+from alarino_backend.normalization import normalize_word_text
+
+PHRASE_INDEX_CHECK_SECONDS = float(os.getenv("PHRASE_INDEX_CHECK_SECONDS", "30"))
+
+# Whitespace-separated runs, minus the punctuation normalize_word_text
+# strips, so offsets cover just the word.
+_TOKEN = re.compile(r"[^\s,.?!()]+(?:\S*[^\s,.?!()])?")
+
+
+class Token(NamedTuple):
+    text: str
+    start: int
+    end: int
+
+
+class Segment(NamedTuple):
+    """``text`` is the normalized entry key (tokens joined by one space);
+    ``start``/``end`` are character offsets into the original input."""
+
+    text: str
+    start: int
+    end: int
+    known: bool
+
+
+def tokenize_phrase(text: str) -> list[Token]:
+    """Whitespace tokens of ``text``, normalized, with their offsets.
+    Punctuation-only tokens are dropped."""
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        normalized = normalize_word_text(match.group())
+        if normalized:
+            tokens.append(Token(normalized, match.start(), match.end()))
+    return tokens
+
+
+def _entry_key(text: str) -> str:
+    return " ".join(text.split())
+
+
+class _LanguageEntries(NamedTuple):
+    entries: set[str]
+    max_tokens: dict[str, int]
+
+
+class PhraseSegmenter(LexiconDerivedIndex):
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        super().__init__(PHRASE_INDEX_CHECK_SECONDS, clock=clock)
+        self._languages: dict[str, _LanguageEntries] = {}
+
+    def _build(self, db) -> None:
+        languages: dict[str, _LanguageEntries] = {}
+        for language, text in db.session.query(Word.language, Word.text):
+            key = _entry_key(text)
+            if not key:
+                continue
+            entries = languages.setdefault(language, _LanguageEntries(set(), {}))
+            entries.entries.add(key)
+            first, *rest = key.split(" ")
+            entries.max_tokens[first] = max(entries.max_tokens.get(first, 0), len(rest) + 1)
+        self._languages = languages
+        self.builds += 1
+
+    def segment(self, db, tokens: list[Token], language: Language) -> list[Segment]:
+        """Longest-match segmentation of ``tokens`` (from tokenize_phrase)
+        against the Words of ``language``, in input order."""
+        self._ensure_fresh(db)
+        entries = self._languages.get(language.value, _LanguageEntries(set(), {}))
+        segments = []
+        i = 0
+        while i < len(tokens):
+            longest = min(entries.max_tokens.get(tokens[i].text, 0), len(tokens) - i)
+            for length in range(longest, 0, -1):
+                key = " ".join(token.text for token in tokens[i:i + length])
+                if key in entries.entries:
+                    segments.append(Segment(key, tokens[i].start, tokens[i + length - 1].end, True))
+                    i += length
+                    break
+            else:
+                segments.append(Segment(tokens[i].text, tokens[i].start, tokens[i].end, False))
+                i += 1
+        return segments
+
+
+phrase_segmenter = PhraseSegmenter()
+register_listener(phrase_segmenter.mark_stale)
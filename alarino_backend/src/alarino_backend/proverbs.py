@@ -0,0 +1,250 @@
+# proverbs.py
+"""Random proverb sampling without sorting the proverbs table.
+
+ProverbSampler keeps every proverb id in an array (one id-only query to
+build) and samples a random index, then reads that one row by primary key.
+Before each sample it checks max(proverbs.p_id), an index-only lookup, and
+rebuilds when it has moved, which catches proverbs added by any worker; an
+id deleted since the build is dropped when its read comes back empty.
+
+"Proverb of the hour" mode picks the index with an RNG seeded by the hour,
+so every worker with the same id array serves the same proverb for the
+whole hour without coordinating, and the result is cached in-process.
+
+ProverbSearchIndex answers /api/proverbs/search from memory. proverb_words
+already is an inverted index (word → proverb, with token positions); the
+index loads it once with a single ProverbWord ⋈ Word query into
+``(language, text) → {p_id: [positions]}`` postings, so a query costs dict
+lookups and set intersections instead of a three-table join per term.
+Multi-word queries are ANDed, quoted phrases must appear at consecutive
+positions, and matches are ranked with BM25 plus a bonus per phrase
+occurrence. It rebuilds on the next search after this worker commits a
+proverb (the lexicon_changes PROVERBS topic) or when max(proverbs.p_id)
+moves.
+"""
+
+import math
+import random
+import re
+import threading
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Callable, NamedTuple, Optional
+
+from alarino_backend.db_models import Proverb, ProverbWord, Word
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import PROVERBS, register_listener
+from alarino_backend.normalization import normalize_text, normalize_word_text
+
+
+class HourlyProverb(NamedTuple):
+    hour: str
+    p_id: int
+    yoruba_text: str
+    english_text: str
+
+
+def seconds_until_next_hour(now: datetime) -> int:
+    next_hour = now.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
+    return max(1, int((next_hour - now).total_seconds()))
+
+
+class ProverbSampler:
+    def __init__(self, rng: Optional[random.Random] = None, now: Callable[[], datetime] = datetime.now):
+        self._rng = rng or random.Random()
+        self._now = now
+        self._lock = threading.Lock()
+        self._ids: list[int] = []
+        self._max_p_id: Optional[int] = None
+        self._hourly: Optional[HourlyProverb] = None
+        self.builds = 0
+
+    def _ensure_fresh(self, db) -> None:
+        max_p_id = db.session.query(db.func.max(Proverb.p_id)).scalar()
+        if max_p_id != self._max_p_id or (max_p_id is not None and not self._ids):
+            self._ids = [p_id for (p_id,) in db.session.query(Proverb.p_id).order_by(Proverb.p_id)]
+            self._max_p_id = max_p_id
+            self.builds += 1
+
+    def _pick(self, db, rng: random.Random) -> Optional[Proverb]:
+        while self._ids:
+            index = rng.randrange(len(self._ids))
+            proverb = db.session.get(Proverb, self._ids[index])
+            if proverb is not None:
+                return proverb
+            # Deleted since the build.
+            self._ids.pop(index)
+        return None
+
+    def sample(self, db) -> Optional[Proverb]:
+        """A uniformly random Proverb, or None if there are none."""
+        with self._lock:
+            self._ensure_fresh(db)
+            return self._pick(db, self._rng)
+
+    def hour_key(self) -> str:
+        return self._now().strftime("%Y-%m-%dT%H")
+
+    def current(self) -> Optional[HourlyProverb]:
+        """The cached proverb of the hour, if one was chosen this hour."""
+        hourly = self._hourly
+        if hourly is not None and hourly.hour == self.hour_key():
+            return hourly
+        return None
+
+    def of_the_hour(self, db) -> Optional[HourlyProverb]:
+        hourly = self.current()
+        if hourly is not None:
+            return hourly
+        with self._lock:
+            hour = self.hour_key()
+            self._ensure_fresh(db)
+            proverb = self._pick(db, random.Random(hour))
+            if proverb is None:
+                return None
+            self._hourly = HourlyProverb(hour, proverb.p_id, proverb.yoruba_text, proverb.english_text)
+            return self._hourly
+
+    @staticmethod
+    def etag(hourly: HourlyProverb) -> str:
+        return f"{hourly.hour}-{hourly.p_id}"
+
+    def max_age(self) -> int:
+        return seconds_until_next_hour(self._now())
+
+
+proverb_sampler = ProverbSampler()
+
+
+# BM25 parameters and the score added per occurrence of each quoted phrase.
+BM25_K1 = 1.2
+BM25_B = 0.75
+PHRASE_BOOST = 2.0
+
+# Tokenized exactly as add_proverb tokenizes proverb text, so query terms and
+# indexed positions line up.
+_TOKEN = re.compile(r"\b\w+\b")
+_PHRASE = re.compile(r'"([^"]*)"')
+
+
+class ProverbQuery(NamedTuple):
+    terms: tuple[str, ...]
+    phrases: tuple[tuple[str, ...], ...]
+
+    @property
+    def required_terms(self) -> set[str]:
+        return set(self.terms).union(*self.phrases)
+
+
+def _tokens(text: str) -> list[str]:
+    tokens = (normalize_word_text(token) for token in _TOKEN.findall(normalize_text(text)))
+    return [token for token in tokens if token]
+
+
+def parse_proverb_query(q: str) -> ProverbQuery:
+    """Split ``q`` into bare terms (all required) and double-quoted phrases
+    (required, in order, at consecutive positions). A one-word phrase is just
+    a term."""
+    phrases = []
+    terms = []
+    for phrase in _PHRASE.findall(q):
+        tokens = tuple(_tokens(phrase))
+        if len(tokens) > 1:
+            phrases.append(tokens)
+        else:
+            terms.extend(tokens)
+    terms.extend(_tokens(_PHRASE.sub(" ", q)))
+    return ProverbQuery(tuple(dict.fromkeys(terms)), tuple(dict.fromkeys(phrases)))
+
+
+class ProverbSearchIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: dict[tuple[str, str], dict[int, list[int]]] = {}
+        self._lengths: dict[str, dict[int, int]] = {}
+        self._max_p_id: Optional[int] = None
+        self._stale = True
+        self.builds = 0
+
+    def mark_stale(self, changes=None) -> None:
+        self._stale = True
+
+    def _build(self, db) -> None:
+        postings: dict[tuple[str, str], dict[int, list[int]]] = defaultdict(lambda: defaultdict(list))
+        lengths: dict[str, dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        rows = (
+            db.session.query(ProverbWord.language, Word.text, ProverbWord.proverb_id, ProverbWord.position)
+            .join(Word, Word.w_id == ProverbWord.word_id)
+            .order_by(ProverbWord.proverb_id, ProverbWord.position)
+        )
+        for language, text, p_id, position in rows:
+            postings[(language, text)][p_id].append(position)
+            lengths[language][p_id] += 1
+        self._postings = {key: dict(docs) for key, docs in postings.items()}
+        self._lengths = {language: dict(docs) for language, docs in lengths.items()}
+        self.builds += 1
+
+    def _ensure_fresh(self, db) -> None:
+        max_p_id = db.session.query(db.func.max(Proverb.p_id)).scalar()
+        if self._stale or max_p_id != self._max_p_id:
+            # Clear the flag first: a commit landing mid-build re-sets it.
+            self._stale = False
+            self._build(db)
+            self._max_p_id = max_p_id
+
+    @staticmethod
+    def _phrase_count(postings: list[dict[int, list[int]]], p_id: int) -> int:
+        following = [set(docs[p_id]) for docs in postings[1:]]
+        return sum(
+            all(start + offset in positions for offset, positions in enumerate(following, 1))
+            for start in postings[0][p_id]
+        )
+
+    def search(self, db, query: ProverbQuery, language: Language) -> list[tuple[int, float]]:
+        """Every proverb matching ``query`` on its ``language`` side, as
+        ``(p_id, score)`` pairs, best first (ties by p_id)."""
+        required = query.required_terms
+        if not required:
+            return []
+        with self._lock:
+            self._ensure_fresh(db)
+            postings = {term: self._postings.get((language.value, term), {}) for term in required}
+            lengths = self._lengths.get(language.value, {})
+
+        candidates = set.intersection(*(set(docs) for docs in postings.values()))
+        phrase_counts: dict[int, int] = defaultdict(int)
+        for phrase in query.phrases:
+            phrase_postings = [postings[term] for term in phrase]
+            for p_id in list(candidates):
+                count = self._phrase_count(phrase_postings, p_id)
+                if count:
+                    phrase_counts[p_id] += count
+                else:
+                    candidates.discard(p_id)
+        if not candidates:
+            return []
+
+        doc_count = len(lengths)
+        average_length = sum(lengths.values()) / doc_count
+        scored = []
+        for p_id in candidates:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[p_id] / average_length)
+            score = PHRASE_BOOST * phrase_counts[p_id]
+            for docs in postings.values():
+                idf = math.log(1 + (doc_count - len(docs) + 0.5) / (len(docs) + 0.5))
+                tf = len(docs[p_id])
+                score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            scored.append((p_id, score))
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored
+
+    def stats(self) -> dict:
+        return {
+            "terms": len(self._postings),
+            "proverbs": {language: len(docs) for language, docs in self._lengths.items()},
+            "builds": self.builds,
+        }
+
+
+proverb_search_index = ProverbSearchIndex()
+register_listener(proverb_search_index.mark_stale, PROVERBS)
@@ -52,6 +52,60 @@ class TranslationResponseData(BaseResponseData):
     to_language: Language
     senses: List[SenseGroup] = field(default_factory=list)
 
+    @classmethod
+    def from_json(cls, data: dict) -> 'TranslationResponseData':
+        """Inverse of to_json(), for values read back from a cache backend."""
+        return cls(
+            translation=list(data["translation"]),
+            source_word=data["source_word"],
+            to_language=Language(data["to_language"]),
+            senses=[
+                SenseGroup(
+                    **{k: v for k, v in group.items() if k != "translations"},
+                    translations=[
+                        TranslationInSenseGroup(**translation)
+                        for translation in group.get("translations", [])
+                    ],
+                )
+                for group in data.get("senses", [])
+            ],
+        )
+
+
+@dataclass
+class BatchTranslationResponseData(BaseResponseData):
+    """Per-item results of /api/translate/batch, in request order. Each entry
+    is the full APIResponse body (success, status, message, data) the single
+    /api/translate endpoint would have returned for that item."""
+
+    results: List[dict]
+
+
+@dataclass
+class PhraseTranslationResponseData(BaseResponseData):
+    """/api/translate/phrase result: the input split into lexicon entries,
+    in order. Each segment has its normalized ``text``, ``start``/``end``
+    offsets into ``source_text``, whether it is a ``known`` entry, and (if
+    so) the /api/translate response body for it as ``result``."""
+
+    source_text: str
+    to_language: Language
+    segments: List[dict]
+
+
+@dataclass
+class WordNotFoundResponseData(BaseResponseData):
+    """Payload of a translate() miss that has something to offer instead.
+    ``candidates`` are known words equal to the input once diacritics are
+    ignored (``{text, translation_count}``); ``suggestions`` are "did you
+    mean" words within a small edit distance (``{text, distance,
+    translation_count}``). Both are best first."""
+
+    source_word: str
+    to_language: Language
+    candidates: List[dict] = field(default_factory=list)
+    suggestions: List[dict] = field(default_factory=list)
+
 
 @dataclass
 class WordOfTheDayResponseData(BaseResponseData):
@@ -65,6 +119,44 @@ class ProverbResponseData(BaseResponseData):
     english_text: str
 
 
+@dataclass
+class SuggestResponseData(BaseResponseData):
+    """Autocomplete completions for ``prefix`` (as normalized), best first.
+    Each suggestion carries the word, its translation count and how often
+    it was requested without a translation."""
+
+    prefix: str
+    language: Language
+    suggestions: List[dict]
+
+
+@dataclass
+class ProverbSearchResponseData(BaseResponseData):
+    """One page of proverb search hits, best first. ``total`` counts every
+    match, not just this page; each result carries both texts and its
+    relevance score."""
+
+    query: str
+    language: Language
+    total: int
+    page: int
+    per_page: int
+    results: List[dict]
+
+
+@dataclass
+class FullTextSearchResponseData(BaseResponseData):
+    """One page of full-text hits over proverbs and examples, best first.
+    Each result names its document (``type``, ``id``), the matched text and
+    its translation, and an HTML snippet with matches in <mark>."""
+
+    query: str
+    total: int
+    page: int
+    per_page: int
+    results: List[dict]
+
+
 @dataclass
 class BulkUploadResponseData(BaseResponseData):
     successful_pairs: List[dict]
@@ -72,6 +164,48 @@ class BulkUploadResponseData(BaseResponseData):
     dry_run: bool
 
 
+@dataclass
+class ReviewQueueResponseData(BaseResponseData):
+    """One page of pending LLM translations, oldest first. ``total`` counts
+    the whole queue; each entry carries both words, provenance and
+    confidence."""
+
+    total: int
+    page: int
+    per_page: int
+    entries: List[dict]
+
+
+@dataclass
+class ReviewResultResponseData(BaseResponseData):
+    """Ids of the pending translations that a bulk promote/reject acted on."""
+
+    action: str
+    ids: List[int]
+
+
+@dataclass
+class BulkUploadJobResponseData(BaseResponseData):
+    """Progress of a background bulk upload. Counts cover the rows
+    processed so far; ``failed_pairs`` lists at most the first 1000
+    failures (``failed_count`` has the full number). Timestamps are ISO
+    strings, None until reached."""
+
+    job_id: str
+    status: str
+    dry_run: bool
+    total_rows: int
+    processed_rows: int
+    successful_count: int
+    failed_count: int
+    translations_created: int
+    failed_pairs: List[dict]
+    error: Optional[str] = None
+    created_at: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+
 @dataclass
 class SitemapWordsResponseData(BaseResponseData):
     """The list of English word strings that have a Yoruba translation,
@@ -80,6 +214,27 @@ class SitemapWordsResponseData(BaseResponseData):
     words: List[str]
 
 
+@dataclass
+class MissingTranslationsReportResponseData(BaseResponseData):
+    """Top missed (text, source_language, target_language) tuples with their
+    summed hit_count since ``since`` (ISO date, inclusive)."""
+
+    since: str
+    entries: List[dict]
+
+
+@dataclass
+class StatsResponseData(BaseResponseData):
+    """Operational counters for the in-process caches and buffers, used to
+    size them. Each field is the ``stats()`` dict of one component."""
+
+    translation_cache: dict
+    llm_cache: dict
+    lexicon_snapshot: dict
+    missing_translations: dict
+    missing_translation_events: dict
+
+
 class APIResponse:
     def __init__(self, success: bool, status: int, message: str, data: Optional[BaseResponseData] = None):
         self.success = success
@@ -1,15 +1,19 @@
 import logging
 import os
 import sys
-from datetime import date
 from pathlib import Path
-from typing import Dict, Tuple
+
+from alarino_backend.cache_backends import create_cache_backend
+from alarino_backend.daily_word_cache import DailyWordCache
 
 LOG_FORMAT = "%(asctime)s [%(levelname)s] [%(processName)s] %(message)s"
 
 
 logger: logging.Logger = logging.getLogger("alarino_backend")
-_daily_word_cache: Dict[date, Tuple[str, str]] = {}
+# Shared across gunicorn workers when ALARINO_CACHE_URL points at a shared
+# backend, so the daily word is computed once rather than once per worker.
+# Holds at most today's and tomorrow's entry.
+_daily_word_cache: DailyWordCache = DailyWordCache(create_cache_backend("daily-word", max_entries=2))
 
 
 def configure_logging() -> None:
@@ -0,0 +1,137 @@
+"""Bounded read-through cache for /api/translate.
+
+Keyed on ``(normalized text, source Language, target Language)`` and holding
+the finished TranslationResponseData, so a hit skips the database entirely.
+Storage is a CacheBackend (see alarino_backend.cache_backends): the default
+in-process backend evicts least-recently-used entries past ``max_entries``;
+a shared backend lets every gunicorn worker serve a value computed once.
+Entries expire after ``ttl_seconds`` either way. Only successful lookups are
+cached — misses still go to the database so they keep being recorded as
+MissingTranslation.
+
+Invalidation is driven by alarino_backend.lexicon_changes: when a commit
+adds a word or a translation, every key whose source text is one of the
+changed words is dropped from the committing worker's backend. With the
+default in-process backend every gunicorn worker has its own cache, so the
+other workers keep serving their stale entries until ``ttl_seconds``
+expires; invalidation only reaches the whole deployment with a shared
+backend (``ALARINO_CACHE_URL`` of ``file://`` or ``redis://``). A generation
+counter guards against a lookup that started before the commit writing its
+(now stale) result after it; it is per-process, so with a shared backend
+the guard covers the writing worker only and TTL bounds staleness elsewhere.
+"""
+
+import os
+import threading
+import time
+from typing import Callable, Iterable, Optional
+
+from alarino_backend.cache_backends import CacheBackend, InProcessCacheBackend, create_cache_backend
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import WordKey, register_listener
+from alarino_backend.response import TranslationResponseData
+
+CacheKey = tuple[str, Language, Language]
+
+DEFAULT_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "5000"))
+DEFAULT_TTL_SECONDS = float(os.getenv("TRANSLATION_CACHE_TTL_SECONDS", "3600"))
+
+
+class TranslationCache:
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.backend = backend or InProcessCacheBackend(
+            namespace="translate", max_entries=max_entries, clock=clock
+        )
+        self._lock = threading.Lock()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def key(text: str, source: Language, target: Language) -> CacheKey:
+        return (text, Language(source), Language(target))
+
+    @staticmethod
+    def _backend_key(key: CacheKey) -> str:
+        text, source, target = key
+        return f"{source.value}:{target.value}:{text}"
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @property
+    def generation(self) -> int:
+        """Bumped on every invalidation. Read it before a database lookup
+        and pass it to put() so a result computed from pre-invalidation
+        data is not cached."""
+        return self._generation
+
+    def get(self, key: CacheKey) -> Optional[TranslationResponseData]:
+        if not self.enabled:
+            return None
+        value = self.backend.get(self._backend_key(key))
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return TranslationResponseData.from_json(value)
+
+    def put(
+        self,
+        key: CacheKey,
+        value: TranslationResponseData,
+        generation: Optional[int] = None,
+    ) -> None:
+        if not self.enabled:
+            return
+        if generation is not None and generation != self._generation:
+            return
+        self.backend.set(self._backend_key(key), value.to_json(), self.ttl_seconds)
+
+    def invalidate_words(self, words: Iterable[WordKey]) -> None:
+        """Drop every entry looked up by one of ``words`` as source text."""
+        with self._lock:
+            self._generation += 1
+        removed = self.backend.delete(
+            self._backend_key((text, Language(language), target))
+            for language, text in words
+            for target in Language
+        )
+        with self._lock:
+            self.invalidations += removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+        self.backend.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            counters = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+            }
+        return {
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            **self.backend.stats(),
+            **counters,
+        }
+
+
+translation_cache = TranslationCache(
+    backend=create_cache_backend("translate", max_entries=DEFAULT_MAX_ENTRIES)
+)
+register_listener(translation_cache.invalidate_words)
@@ -1,29 +1,79 @@
 # translation_service.py
 import csv
-import io
-from datetime import date
+import os
+from collections import defaultdict
+from datetime import date, timedelta
 import threading
-from typing import Tuple, Dict, Optional
+from typing import Tuple, Dict, Iterable, Iterator, Optional
 
-from alarino_backend.data.seed_data_utils import add_word, create_translation, is_valid_english_word, is_valid_yoruba_word, normalize_word_text
-from alarino_backend.db_models import Word, DailyWord, Example, Sense, Translation, MissingTranslation, Proverb, ProverbWord
+from sqlalchemy import and_, func, or_, tuple_
+from sqlalchemy.orm import aliased, joinedload
+
+from alarino_backend import full_text_search
+from alarino_backend.bulk_upload import BULK_CHUNK_SIZE, bulk_upload, chunked, parse_bulk_lines, process_rows
+from alarino_backend.bulk_upload_jobs import bulk_upload_jobs, job_response_data
+from alarino_backend.daily_word import daily_word_pool, insert_daily_words
+from alarino_backend.daily_word_cache import DailyWordCache, DailyWordEntry
+from alarino_backend.data.seed_data_utils import normalize_word_text
+from alarino_backend.db_models import REVIEW_APPROVED, BulkUploadJob, Word, DailyWord, Example, Sense, Translation, Proverb
 from alarino_backend.languages import Language
+from alarino_backend.lexicon_snapshot import lexicon_snapshot
+from alarino_backend.llm_cache import llm_translation_cache
+from alarino_backend.llm_review import (
+    REVIEW_ACTIONS,
+    llm_provenance,
+    pending_translations,
+    review_entry,
+    review_translations,
+    store_llm_translations,
+)
 from alarino_backend.llm_service import get_llm_service
+from alarino_backend.missing_translations import (
+    MissingTranslationRow,
+    missing_translation_buffer,
+    missing_translation_events,
+    top_missing_translations,
+    upsert_missing_translations,
+)
+from alarino_backend.normalization import fold_diacritics
+from alarino_backend.phrase_segmentation import phrase_segmenter, tokenize_phrase
+from alarino_backend.proverbs import parse_proverb_query, proverb_sampler, proverb_search_index
 from alarino_backend.response import (
     APIResponse,
+    BatchTranslationResponseData,
     BulkUploadResponseData,
+    FullTextSearchResponseData,
+    MissingTranslationsReportResponseData,
+    PhraseTranslationResponseData,
     ProverbResponseData,
+    ProverbSearchResponseData,
+    ReviewQueueResponseData,
+    ReviewResultResponseData,
     SenseGroup,
     SitemapWordsResponseData,
+    SuggestResponseData,
     TranslationInSenseGroup,
     TranslationResponseData,
+    WordNotFoundResponseData,
     WordOfTheDayResponseData,
 )
 from alarino_backend.runtime import logger
+from alarino_backend.translation_cache import translation_cache
+from alarino_backend.word_suggestions import SUGGEST_MAX_LIMIT, fuzzy_word_matcher, word_suggester
+
+TRANSLATE_BATCH_MAX_ITEMS = int(os.getenv("TRANSLATE_BATCH_MAX_ITEMS", "100"))
+SEARCH_MAX_PER_PAGE = 50
+DIACRITIC_CANDIDATE_LIMIT = 5
+PHRASE_MAX_TOKENS = 50
+REVIEW_MAX_PER_PAGE = 200
+REVIEW_MAX_IDS = 1000
 
 
 def translate_llm(text: str, source: Language, target: Language) -> tuple[dict, int]:
-    """Translates text using the LLM service."""
+    """Translates text using the LLM service, through llm_translation_cache
+    so repeated and concurrent identical requests share one provider call.
+    A fresh answer is also stored as pending lexicon entries (see
+    llm_review) so /api/translate serves the word from then on."""
     text = normalize_word_text(text)
     if not text:
         return APIResponse.error("Text must not be empty.", 400).as_response()
@@ -33,7 +83,13 @@ def translate_llm(text: str, source: Language, target: Language) -> tuple[dict,
         return APIResponse.error("LLM service not configured.", 500).as_response()
 
     try:
-        translation = llm_service.get_translation(text, source.value, target.value)
+        translation = llm_translation_cache.translate(
+            llm_service,
+            text,
+            source,
+            target,
+            on_answer=lambda answer: _store_llm_answer(llm_service, text, source, target, answer),
+        )
         if not translation:
             return APIResponse.error("Translation not found.", 404).as_response()
 
@@ -48,51 +104,423 @@ def translate_llm(text: str, source: Language, target: Language) -> tuple[dict,
         return APIResponse.error("An error occurred during translation.", 500).as_response()
 
 
+def _store_llm_answer(llm_service, text: str, source: Language, target: Language, answer: list[str]) -> None:
+    """Best effort: failing to queue the answer for review must not fail
+    the translation that produced it."""
+    try:
+        store_llm_translations(text, source, target, answer, llm_provenance(llm_service))
+    except Exception as e:
+        logger.error(f"Error storing LLM translation of '{text}' for review: {e}")
+
+
 def translate(db, text: str, source: Language, target: Language, user_agent: str) -> tuple[dict, int]:
     text = normalize_word_text(text)
     if not text:
         return APIResponse.error("Text must not be empty.", 400).as_response()
 
+    cache_key = translation_cache.key(text, source, target)
+    cached = translation_cache.get(cache_key)
+    if cached is not None:
+        return APIResponse.success("Translation successful.", cached).as_response()
+    cache_generation = translation_cache.generation
+
+    snapshot = lexicon_snapshot.current()
+    if snapshot is not None:
+        lookup = snapshot.lookup(text, source, target)
+    else:
+        lookup = _lookup_in_database(text, source, target)
+    return _respond_to_lookups(db, {cache_key: lookup}, cache_generation, user_agent)[cache_key].as_response()
+
+
+def translate_batch(db, items: list, user_agent: str) -> tuple[dict, int]:
+    """Translate up to TRANSLATE_BATCH_MAX_ITEMS ``{text, source_lang,
+    target_lang}`` items in one call. Each entry of ``results`` is the
+    APIResponse body translate() would have returned for that item, in input
+    order; a bad item gets its own 400 entry rather than failing the batch.
+
+    Cache misses are resolved together: from the snapshot if one is current,
+    otherwise with one query for all Words, one for all their Translation
+    edges and one for all matched examples, however many items there are."""
+    if len(items) > TRANSLATE_BATCH_MAX_ITEMS:
+        return APIResponse.error(
+            f"A batch may contain at most {TRANSLATE_BATCH_MAX_ITEMS} items.", 400
+        ).as_response()
+
+    results: list[Optional[dict]] = [None] * len(items)
+    pending: dict[tuple[str, Language, Language], list[int]] = {}
+    for index, item in enumerate(items):
+        parsed = _parse_batch_item(item)
+        if isinstance(parsed, APIResponse):
+            results[index] = parsed.to_json()
+        else:
+            pending.setdefault(translation_cache.key(*parsed), []).append(index)
+
+    responses = _translate_keys(db, list(pending), user_agent)
+    for cache_key, indexes in pending.items():
+        for index in indexes:
+            results[index] = responses[cache_key]
+
+    response_data = BatchTranslationResponseData(results=results)
+    return APIResponse.success("Batch translation completed.", response_data).as_response()
+
+
+def translate_phrase(db, text: str, source: Language, target: Language, user_agent: str) -> tuple[dict, int]:
+    """Translate a phrase or short sentence entry by entry. The text is
+    segmented by longest match against the known Words of ``source`` (see
+    phrase_segmentation), so multi-word entries are kept whole, and every
+    known segment is translated in one batch. ``segments`` lists each piece
+    in input order with its character offsets and, for known segments, the
+    APIResponse body translate() would have returned. Tokens that match no
+    entry get ``result: None`` and are not recorded as missing."""
+    if not isinstance(text, str):
+        return APIResponse.error("Invalid request body.", 400).as_response()
+    tokens = tokenize_phrase(text)
+    if not tokens:
+        return APIResponse.error("Text must not be empty.", 400).as_response()
+    if len(tokens) > PHRASE_MAX_TOKENS:
+        return APIResponse.error(
+            f"A phrase may contain at most {PHRASE_MAX_TOKENS} words.", 400
+        ).as_response()
+
+    try:
+        segments = phrase_segmenter.segment(db, tokens, source)
+        keys = list(dict.fromkeys(
+            translation_cache.key(segment.text, source, target) for segment in segments if segment.known
+        ))
+        responses = _translate_keys(db, keys, user_agent)
+        response_data = PhraseTranslationResponseData(
+            source_text=text,
+            to_language=target,
+            segments=[
+                {
+                    "text": segment.text,
+                    "start": segment.start,
+                    "end": segment.end,
+                    "known": segment.known,
+                    "result": (
+                        responses[translation_cache.key(segment.text, source, target)]
+                        if segment.known else None
+                    ),
+                }
+                for segment in segments
+            ],
+        )
+        return APIResponse.success("Phrase translation completed.", response_data).as_response()
+    except Exception as e:
+        logger.error(f"Error translating phrase '{text}': {e}")
+        return APIResponse.error("An error occurred during phrase translation.", 500).as_response()
+
+
+def _translate_keys(db, keys: list[tuple[str, Language, Language]], user_agent: str) -> dict:
+    """Resolve distinct ``(text, source, target)`` keys to the APIResponse
+    body translate() would return for each: cache hits first, then every
+    miss together from the snapshot or _lookup_many_in_database() and
+    _respond_to_lookups()."""
+    responses = {}
+    uncached = []
+    for cache_key in keys:
+        cached = translation_cache.get(cache_key)
+        if cached is not None:
+            responses[cache_key] = APIResponse.success("Translation successful.", cached).to_json()
+        else:
+            uncached.append(cache_key)
+    if not uncached:
+        return responses
+
+    cache_generation = translation_cache.generation
+    snapshot = lexicon_snapshot.current()
+    if snapshot is not None:
+        lookups = {key: snapshot.lookup(*key) for key in uncached}
+    else:
+        lookups = _lookup_many_in_database(uncached)
+    for cache_key, response in _respond_to_lookups(db, lookups, cache_generation, user_agent).items():
+        responses[cache_key] = response.to_json()
+    return responses
+
+
+def _parse_batch_item(item) -> tuple[str, Language, Language] | APIResponse:
+    """Validate one batch item the way require_translation_params validates a
+    single request; returns the normalized key or the error to report."""
+    if not isinstance(item, dict) or not all(k in item for k in ["text", "source_lang", "target_lang"]):
+        return APIResponse.error("Invalid request body.", 400)
+    if not isinstance(item["text"], str):
+        return APIResponse.error("Invalid request body.", 400)
+    try:
+        source = Language(item["source_lang"])
+        target = Language(item["target_lang"])
+    except ValueError:
+        return APIResponse.error("Unsupported language.", 400)
+    text = normalize_word_text(item["text"])
+    if not text:
+        return APIResponse.error("Text must not be empty.", 400)
+    return text, source, target
+
+
+def _respond_to_lookups(db, lookups: dict, cache_generation: int, user_agent: str) -> dict:
+    """Turn ``{cache_key: (source_text, edges, examples_by_pair)}`` lookups
+    into APIResponses, caching hits. However many words are unknown, their
+    diacritic candidates take one query and their fuzzy suggestions one
+    index check, and all misses are logged in one call."""
+    unknown = [cache_key for cache_key, (source_text, _, _) in lookups.items() if source_text is None]
+    candidates = find_diacritic_candidates(db, unknown)
+    suggestions = _did_you_mean(db, [cache_key for cache_key in unknown if not candidates[cache_key]])
+    responses = {}
+    missed = []
+    for cache_key, (source_text, edges, examples_by_pair) in lookups.items():
+        text, source, target = cache_key
+        if source_text is None:
+            if candidates[cache_key]:
+                # Known word typed without (or with different) diacritics:
+                # offer the real forms instead of recording a miss.
+                response_data = WordNotFoundResponseData(
+                    source_word=text, to_language=target, candidates=candidates[cache_key]
+                )
+            else:
+                missed.append(cache_key)
+                response_data = (
+                    WordNotFoundResponseData(
+                        source_word=text, to_language=target, suggestions=suggestions[cache_key]
+                    )
+                    if suggestions[cache_key] else None
+                )
+            responses[cache_key] = APIResponse.error("Word not found.", 404, response_data)
+            continue
+
+        response_data = _build_translation_response(source_text, target, edges, examples_by_pair)
+
+        if response_data is None:
+            missed.append(cache_key)
+            responses[cache_key] = APIResponse.error("Word found but translation not available.", 404)
+            continue
+
+        logger.info(f"[Translated '{text}' from {source} to {target}]")
+        translation_cache.put(cache_key, response_data, cache_generation)
+        responses[cache_key] = APIResponse.success("Translation successful.", response_data)
+
+    log_missing_translations(db, missed, user_agent)
+    return responses
+
+
+def _did_you_mean(db, keys: list[tuple[str, Language, Language]]) -> dict:
+    """Fuzzy suggestions for each missed key. Best effort: a failure here
+    must not turn the 404s into 500s."""
+    if not keys:
+        return {}
+    try:
+        matches = fuzzy_word_matcher.lookup_many(db, [(text, source) for text, source, _ in keys])
+    except Exception as e:
+        logger.error(f"Error finding suggestions for {len(keys)} words: {e}")
+        matches = [[] for _ in keys]
+    return dict(zip(keys, matches))
+
+
+def find_diacritic_candidates(db, keys: list[tuple[str, Language, Language]]) -> dict:
+    """For each ``(text, source, target)`` key, the words of ``source``
+    whose folded form (see fold_diacritics) equals that of ``text`` and that
+    have at least one ``target`` translation, most-translated first. One
+    query on idx_words_language_folded_text for all keys."""
+    if not keys:
+        return {}
+    other = aliased(Word)
+    rows = (
+        db.session.query(Word.language, Word.folded_text, Word.text, other.language, func.count(Translation.t_id))
+        .join(Translation, or_(Translation.source_word_id == Word.w_id, Translation.target_word_id == Word.w_id))
+        .join(
+            other,
+            or_(
+                and_(Translation.source_word_id == Word.w_id, Translation.target_word_id == other.w_id),
+                and_(Translation.target_word_id == Word.w_id, Translation.source_word_id == other.w_id),
+            ),
+        )
+        .filter(
+            Word.language.in_({source.value for _, source, _ in keys}),
+            Word.folded_text.in_({fold_diacritics(text) for text, _, _ in keys}),
+        )
+        .group_by(Word.w_id, Word.language, Word.folded_text, Word.text, other.language)
+    )
+    counts_by_form = defaultdict(list)
+    for language, folded, word_text, target_language, count in rows:
+        counts_by_form[(language, folded, target_language)].append((-count, word_text))
+
+    candidates = {}
+    for cache_key in keys:
+        text, source, target = cache_key
+        matches = sorted(
+            (negative_count, word_text)
+            for negative_count, word_text in counts_by_form[(source.value, fold_diacritics(text), target.value)]
+            if word_text != text
+        )
+        candidates[cache_key] = [
+            {"text": word_text, "translation_count": -negative_count}
+            for negative_count, word_text in matches[:DIACRITIC_CANDIDATE_LIMIT]
+        ]
+    return candidates
+
+
+def _lookup_in_database(text: str, source: Language, target: Language):
+    """SQL counterpart of LexiconSnapshot.lookup(): returns ``(source_text,
+    edges, examples_by_pair)``, or ``(None, [], {})`` if the word is unknown.
+
+    A fixed number of round trips regardless of how many translations or
+    examples the word has: one for the Word, one for every Translation edge
+    touching it (with both Words and both Senses eager-joined), and one for
+    the examples of every matched sense pair."""
     source_word = Word.query.filter_by(language=source, text=text).first()
     if not source_word:
-        log_missing_translation(db, text, source, target, user_agent)
-        return APIResponse.error("Word not found.", 404).as_response()
-
-    # Bidirectional lookup. Translation is stored as a directed edge — the
-    # curator added it as source→target — but a user querying in either
-    # direction should find a match if either direction was curated. Match the
-    # source_word on EITHER column and return the opposite-side word, filtered
-    # by the requested target language and deduped by w_id so a pair that
-    # happens to be curated in both directions doesn't return duplicates.
-    translations = (
+        return None, [], {}
+
+    edges = _select_target_edges(
+        source_word.w_id, _load_translation_edges([source_word.w_id]), target
+    )
+    examples_by_pair = _load_examples_by_sense_pair(
+        (my_sense.sense_id, other_sense.sense_id)
+        for _, _, my_sense, other_sense in edges
+        if my_sense is not None and other_sense is not None
+    )
+    return source_word.text, edges, examples_by_pair
+
+
+def _lookup_many_in_database(keys: list[tuple[str, Language, Language]]) -> dict:
+    """Batch counterpart of _lookup_in_database(): resolves every
+    ``(text, source, target)`` key in three queries total and returns
+    ``{key: (source_text, edges, examples_by_pair)}``."""
+    word_keys = {(source.value, text) for text, source, _ in keys}
+    words = Word.query.filter(tuple_(Word.language, Word.text).in_(word_keys)).all()
+    words_by_key = {(word.language, word.text): word for word in words}
+
+    # Bucket edges by the word they touch so each key only walks its own.
+    edges_by_word_id: dict[int, list[Translation]] = {}
+    for translation in _load_translation_edges([word.w_id for word in words]):
+        edges_by_word_id.setdefault(translation.source_word_id, []).append(translation)
+        if translation.target_word_id != translation.source_word_id:
+            edges_by_word_id.setdefault(translation.target_word_id, []).append(translation)
+
+    edges_by_key = {}
+    for key in keys:
+        text, source, target = key
+        word = words_by_key.get((source.value, text))
+        if word is not None:
+            edges_by_key[key] = _select_target_edges(
+                word.w_id, edges_by_word_id.get(word.w_id, []), target
+            )
+
+    examples_by_pair = _load_examples_by_sense_pair(
+        (my_sense.sense_id, other_sense.sense_id)
+        for edges in edges_by_key.values()
+        for _, _, my_sense, other_sense in edges
+        if my_sense is not None and other_sense is not None
+    )
+
+    lookups = {}
+    for key in keys:
+        text, source, _ = key
+        word = words_by_key.get((source.value, text))
+        if word is None:
+            lookups[key] = (None, [], {})
+        else:
+            lookups[key] = (word.text, edges_by_key[key], examples_by_pair)
+    return lookups
+
+
+def _load_translation_edges(word_ids: list[int]) -> list[Translation]:
+    """Return every Translation touching any of ``word_ids`` on either side,
+    with source/target Words and Senses eager-joined so that walking the
+    edges issues no further queries.
+
+    Bidirectional lookup. Translation is stored as a directed edge — the
+    curator added it as source→target — but a user querying in either
+    direction should find a match if either direction was curated. Ordered
+    by t_id so output is deterministic across dialects."""
+    if not word_ids:
+        return []
+    return (
         Translation.query
+        .options(
+            joinedload(Translation.source_word),
+            joinedload(Translation.target_word),
+            joinedload(Translation.source_sense),
+            joinedload(Translation.target_sense),
+        )
         .filter(
-            (Translation.source_word_id == source_word.w_id)
-            | (Translation.target_word_id == source_word.w_id)
+            Translation.source_word_id.in_(word_ids)
+            | Translation.target_word_id.in_(word_ids)
         )
+        .order_by(Translation.t_id)
         .all()
     )
+
+
+def _select_target_edges(
+    word_id: int, translations: list[Translation], target: Language
+) -> list[tuple[Translation, Word, Optional[Sense], Optional[Sense]]]:
+    """Orient each edge touching ``word_id`` as (translation, other_word,
+    my_sense, other_sense), keeping only edges whose opposite side is in the
+    requested target language. The looked-up side may be either source or
+    target; "my sense" is whichever sense FK sits on the same side. Deduped
+    by the opposite word's w_id so a pair that happens to be curated in both
+    directions doesn't return duplicates."""
     seen_word_ids: set[int] = set()
-    translated_words: list[str] = []
-    # Group results by the *looked-up* word's sense (Phase 6c). For each
-    # matching translation, the looked-up side may be either source or target;
-    # the "my sense" is whichever sense FK sits on the same side. Default
-    # bucket (sense_id None) catches translations whose sense FKs are NULL —
-    # shouldn't happen post-Phase-6b for new data but kept as a safety net.
-    sense_buckets: dict[Optional[int], SenseGroup] = {}
+    edges = []
     for translation in translations:
-        if translation.source_word_id == source_word.w_id:
+        if translation.source_word_id == word_id:
             other = translation.target_word
             my_sense = translation.source_sense
             other_sense = translation.target_sense
-        else:
+        elif translation.target_word_id == word_id:
             other = translation.source_word
             my_sense = translation.target_sense
             other_sense = translation.source_sense
+        else:
+            continue
 
         if other.language != target.value or other.w_id in seen_word_ids:
             continue
         seen_word_ids.add(other.w_id)
+        edges.append((translation, other, my_sense, other_sense))
+    return edges
+
+
+def _load_examples_by_sense_pair(pairs) -> dict[tuple[int, int], list[dict]]:
+    """Return Example rows for every (source_sense_id, target_sense_id) pair
+    in ``pairs`` in a single query, formatted as {source, target} dicts and
+    keyed by pair. Read paths surface only sense-attached examples (Phase
+    6b backfilled examples to point at sense pairs); an Example without
+    sense FKs is never matched."""
+    pairs = set(pairs)
+    if not pairs:
+        return {}
+    rows = (
+        Example.query
+        .filter(tuple_(Example.source_sense_id, Example.target_sense_id).in_(pairs))
+        .order_by(Example.e_id)
+        .all()
+    )
+    examples_by_pair: dict[tuple[int, int], list[dict]] = {}
+    for row in rows:
+        examples_by_pair.setdefault((row.source_sense_id, row.target_sense_id), []).append(
+            {"source": row.example_source, "target": row.example_target}
+        )
+    return examples_by_pair
+
+
+def _build_translation_response(
+    source_text: str,
+    target: Language,
+    edges: list[tuple[Translation, Word, Optional[Sense], Optional[Sense]]],
+    examples_by_pair: dict[tuple[int, int], list[dict]],
+) -> Optional[TranslationResponseData]:
+    """Assemble the sense-grouped response from oriented edges. Returns None
+    when no edge reaches the target language.
+
+    Groups results by the *looked-up* word's sense (Phase 6c). Default bucket
+    (sense_id None) catches translations whose sense FKs are NULL — shouldn't
+    happen post-Phase-6b for new data but kept as a safety net."""
+    if not edges:
+        return None
+
+    translated_words: list[str] = []
+    sense_buckets: dict[Optional[int], SenseGroup] = {}
+    for translation, other, my_sense, other_sense in edges:
         translated_words.append(other.text)
 
         sense_key = my_sense.sense_id if my_sense is not None else None
@@ -104,90 +532,147 @@ def translate(db, text: str, source: Language, target: Language, user_agent: str
                 domain=my_sense.domain if my_sense else None,
                 part_of_speech=(my_sense.part_of_speech if my_sense else None),
             )
-        examples = _examples_for_sense_pair(my_sense, other_sense)
+        if my_sense is not None and other_sense is not None:
+            examples = examples_by_pair.get((my_sense.sense_id, other_sense.sense_id), [])
+        else:
+            examples = []
         sense_buckets[sense_key].translations.append(
             TranslationInSenseGroup(
                 word=other.text,
                 note=translation.note,
                 provenance=translation.provenance,
-                examples=examples,
+                examples=list(examples),
             )
         )
 
-    if not translated_words:
-        log_missing_translation(db, text, source, target, user_agent)
-        return APIResponse.error("Word found but translation not available.", 404).as_response()
-
-    logger.info(f"[Translated '{text}' from {source} to {target}]")
-
     # Sense groups are ordered by first-seen sense_id for deterministic output;
     # the default-sense bucket (key None) sorts to the end if present.
     ordered_groups = sorted(
         sense_buckets.items(),
         key=lambda item: (item[0] is None, item[0] or 0),
     )
-    response_data = TranslationResponseData(
+    return TranslationResponseData(
         translation=translated_words,
-        source_word=source_word.text,
+        source_word=source_text,
         to_language=target,
         senses=[group for _, group in ordered_groups],
     )
-    return APIResponse.success("Translation successful.", response_data).as_response()
-
-
-def _examples_for_sense_pair(
-    source_sense: Optional[Sense], target_sense: Optional[Sense]
-) -> list[dict]:
-    """Return Example rows attached to the given (source_sense, target_sense)
-    pair, formatted as {source, target} dicts. If either sense is None, returns
-    [] — Phase 6b backfilled examples to point at sense pairs but a future
-    raw-SQL inserted Example without sense FKs would not match. Read paths
-    surface only sense-attached examples; legacy examples linked only by
-    translation_id surface through Phase 6c-incompatible read paths (none
-    exposed today) until 6d drops translation_id."""
-    if source_sense is None or target_sense is None:
-        return []
-    rows = (
-        Example.query
-        .filter_by(
-            source_sense_id=source_sense.sense_id,
-            target_sense_id=target_sense.sense_id,
-        )
-        .all()
-    )
-    return [
-        {"source": row.example_source, "target": row.example_target}
-        for row in rows
-    ]
 
 
 def log_missing_translation(db, text, source_lang, target_lang, user_agent):
-    # Atomic upsert: on first hit insert with user_agent and hit_count=1; on
-    # subsequent hits increment hit_count without overwriting user_agent. The
-    # previous read-modify-write pattern lost concurrent increments under load.
-    dialect_name = db.session.get_bind().dialect.name
-    if dialect_name == "postgresql":
-        from sqlalchemy.dialects.postgresql import insert
-    elif dialect_name == "sqlite":
-        from sqlalchemy.dialects.sqlite import insert
-    else:
-        raise NotImplementedError(
-            f"log_missing_translation upsert not implemented for dialect {dialect_name!r}"
+    log_missing_translations(db, [(text, source_lang, target_lang)], user_agent)
+
+
+def log_missing_translations(db, keys, user_agent):
+    # Count a hit against each (text, source, target) key. With the events
+    # sink running each miss is queued as a missing_translation_events row and
+    # reaches missing_translations through the rollup job. With the buffer
+    # running the hits are summed in memory and written by its flusher as part
+    # of one multi-row upsert; otherwise they are upserted right away, all in
+    # one statement. Either way the upsert is atomic: first hit inserts with
+    # user_agent, later hits add to hit_count without overwriting user_agent.
+    if not keys:
+        return
+    if missing_translation_events.running:
+        for text, source_lang, target_lang in keys:
+            missing_translation_events.add(text, source_lang, target_lang, user_agent)
+        return
+    if missing_translation_buffer.running:
+        for text, source_lang, target_lang in keys:
+            missing_translation_buffer.add(text, source_lang, target_lang, user_agent)
+        return
+    rows: dict[tuple[str, str, str], MissingTranslationRow] = {}
+    for text, source_lang, target_lang in keys:
+        key = (text, Language(source_lang).value, Language(target_lang).value)
+        if key in rows:
+            rows[key]["hit_count"] += 1
+        else:
+            rows[key] = MissingTranslationRow(
+                text=text,
+                source_language=key[1],
+                target_language=key[2],
+                user_agent=user_agent,
+                hit_count=1,
+            )
+    upsert_missing_translations(db, list(rows.values()))
+
+
+def submit_bulk_upload_job(db, text_input: str, dry_run: bool) -> tuple[dict, int]:
+    """Queue ``text_input`` as a background bulk upload (see
+    bulk_upload_jobs) and return 202 with the new job's status."""
+    if not isinstance(text_input, str):
+        return APIResponse.error("'text_input' must be a string.", 400).as_response()
+    try:
+        job = bulk_upload_jobs.submit(db, text_input, bool(dry_run))
+        return APIResponse(True, 202, "Bulk upload job accepted.", job_response_data(job)).as_response()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error submitting bulk upload job: {e}")
+        return APIResponse.error("An error occurred while submitting the bulk upload job.", 500).as_response()
+
+
+def get_bulk_upload_job(db, job_id: str) -> tuple[dict, int]:
+    try:
+        job = db.session.get(BulkUploadJob, job_id)
+        if job is None:
+            return APIResponse.error("Job not found.", 404).as_response()
+        return APIResponse.success("Job status fetched successfully.", job_response_data(job)).as_response()
+    except Exception as e:
+        logger.error(f"Error fetching bulk upload job {job_id}: {e}")
+        return APIResponse.error("An error occurred while fetching the job.", 500).as_response()
+
+
+def get_review_queue(db, page: int, per_page: int) -> tuple[dict, int]:
+    """One page of pending LLM translations, oldest first."""
+    if page < 1 or per_page < 1:
+        return APIResponse.error("page and per_page must be positive.", 400).as_response()
+    per_page = min(per_page, REVIEW_MAX_PER_PAGE)
+    try:
+        total, rows = pending_translations(per_page, (page - 1) * per_page)
+        response_data = ReviewQueueResponseData(
+            total=total,
+            page=page,
+            per_page=per_page,
+            entries=[review_entry(row) for row in rows],
         )
+        return APIResponse.success("Review queue fetched successfully.", response_data).as_response()
+    except Exception as e:
+        logger.error(f"Error fetching review queue: {e}")
+        return APIResponse.error("An error occurred while fetching the review queue.", 500).as_response()
 
-    table = MissingTranslation.__table__
-    stmt = insert(table).values(
-        text=text,
-        source_language=source_lang,
-        target_language=target_lang,
-        user_agent=user_agent,
-    )
-    stmt = stmt.on_conflict_do_update(
-        index_elements=["text", "source_language", "target_language"],
-        set_={"hit_count": table.c.hit_count + 1},
+
+def review_llm_translations(db, t_ids, action: str) -> tuple[dict, int]:
+    """Promote or reject pending LLM translations by id, in bulk. Ids that
+    are not pending are ignored and left out of ``ids``."""
+    if action not in REVIEW_ACTIONS:
+        return APIResponse.error(f"action must be one of {', '.join(REVIEW_ACTIONS)}.", 400).as_response()
+    if not isinstance(t_ids, list) or not all(
+        isinstance(t_id, int) and not isinstance(t_id, bool) for t_id in t_ids
+    ):
+        return APIResponse.error("ids must be a list of integers.", 400).as_response()
+    if len(t_ids) > REVIEW_MAX_IDS:
+        return APIResponse.error(f"At most {REVIEW_MAX_IDS} ids may be reviewed at once.", 400).as_response()
+    try:
+        ids = review_translations(t_ids, action)
+        response_data = ReviewResultResponseData(action=action, ids=ids)
+        return APIResponse.success(f"{len(ids)} translation(s) updated.", response_data).as_response()
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error reviewing translations {t_ids}: {e}")
+        return APIResponse.error("An error occurred while reviewing translations.", 500).as_response()
+
+
+def get_missing_translations_report(db, days: int, limit: int) -> tuple[dict, int]:
+    """The most-requested words users failed to find over the last ``days``
+    days, from the rolled-up missing_translation_daily_counts."""
+    if days < 1 or limit < 1:
+        return APIResponse.error("'days' and 'limit' must be positive.", 400).as_response()
+    since = date.today() - timedelta(days=days - 1)
+    response_data = MissingTranslationsReportResponseData(
+        since=since.isoformat(),
+        entries=top_missing_translations(db, since, limit),
     )
-    db.session.execute(stmt)
-    db.session.commit()
+    return APIResponse.success("Missing translations fetched successfully.", response_data).as_response()
 
 
 def _derive_yoruba_english(translation: Translation) -> Tuple[Word, Word]:
@@ -207,59 +692,58 @@ def find_random_unused_translation(db, can_reuse: bool = True) -> Optional[Trans
     spotlights individual Yoruba words, not phrases). With can_reuse=True the
     used-set filter is skipped — same semantic as the previous version.
 
-    Phase 4 keeps Translation as a directed edge, so the Yoruba side may sit
-    on either source_word or target_word. The single-word filter is applied
-    in Python rather than SQL because the "yoruba side is on one of two
-    columns" condition is awkward to express portably; alarino's translations
-    table is small enough that loading the candidate set is negligible."""
-    query = Translation.query
-    if not can_reuse:
-        used_set = {
-            t_id for (t_id,) in db.session.query(DailyWord.translation_id).all()
-        }
-        if used_set:
-            query = query.filter(~Translation.t_id.in_(used_set))
-
-    yoruba = Language.YORUBA.value
-    for translation in query.order_by(db.func.random()).all():
-        yo_word = (
-            translation.source_word
-            if translation.source_word.language == yoruba
-            else translation.target_word
+    Served from daily_word_pool: a random index into a maintained array of
+    eligible translation ids plus one primary-key read, instead of shuffling
+    and walking the whole translations table."""
+    return daily_word_pool.pick(db, can_reuse)
+
+
+def _load_daily_word(day: date) -> Optional[DailyWord]:
+    return (
+        DailyWord.query
+        .options(
+            joinedload(DailyWord.translation).joinedload(Translation.source_word),
+            joinedload(DailyWord.translation).joinedload(Translation.target_word),
         )
-        if " " not in yo_word.text:
-            return translation
-    return None
+        .filter_by(date=day)
+        .first()
+    )
 
 
-def get_word_of_the_day(db, daily_word_cache: Dict[date, Tuple[str, str]]) -> Tuple[Dict, int]:
+def get_word_of_the_day(db, daily_word_cache: DailyWordCache) -> Tuple[Dict, int]:
     """
     Get the word of the day, either from cache, database, or by selecting a new one.
     Args:
         db: SQLAlchemy database instance?
-        daily_word_cache: Cache dictionary mapping dates to (yoruba_word, english_word) tuples
+        daily_word_cache: DailyWordCache holding today's DailyWordEntry
     Returns:
         An API response tuple (response_dict, status_code)
     """
-    today = date.today()
-    # Check the in-memory cache first
-    if today in daily_word_cache:
-        yoruba_word, english_word = daily_word_cache[today]
-        response_data = WordOfTheDayResponseData(yoruba_word=yoruba_word, english_word=english_word)
+    today = daily_word_cache.today()
+    # Check the cache first
+    cached = daily_word_cache.get(today)
+    if cached is not None:
+        response_data = WordOfTheDayResponseData(yoruba_word=cached.yoruba_word, english_word=cached.english_word)
         return APIResponse.success("Word of the day fetched from cache.", response_data).as_response()
     try:
-        # Check if already selected today in the DB
-        existing = DailyWord.query.filter_by(date=today).first()
+        # Normally materialized ahead of time by data/schedule_daily_words.py,
+        # so this is one indexed lookup with both words joined in.
+        existing = _load_daily_word(today)
         if existing:
             yoruba_word_obj, english_word_obj = _derive_yoruba_english(existing.translation)
-            yoruba_word = yoruba_word_obj.text
-            english_word = english_word_obj.text
-            daily_word_cache[today] = (yoruba_word, english_word)
+            daily_word_cache.set(
+                today, DailyWordEntry(yoruba_word_obj.text, english_word_obj.text, existing.translation_id)
+            )
 
-            response_data = WordOfTheDayResponseData(yoruba_word=yoruba_word, english_word=english_word)
+            response_data = WordOfTheDayResponseData(
+                yoruba_word=yoruba_word_obj.text, english_word=english_word_obj.text
+            )
             return APIResponse.success("Word of the day fetched from database.", response_data).as_response()
 
-        # Pick a fresh translation for today.
+        # The schedule ran out: pick a fresh translation for today. Concurrent
+        # first requests may each pick one; the insert skips a date that is
+        # already taken, so exactly one wins and everyone serves its row.
+        logger.warning(f"No daily word scheduled for {today}; selecting one now")
         translation = find_random_unused_translation(db)
         if translation is None:
             return APIResponse.error(
@@ -267,11 +751,15 @@ def get_word_of_the_day(db, daily_word_cache: Dict[date, Tuple[str, str]]) -> Tu
                 500,
             ).as_response()
 
-        yoruba_word_obj, english_word_obj = _derive_yoruba_english(translation)
-        daily = DailyWord(translation=translation)
-        db.session.add(daily)
+        insert_daily_words(db, [{"translation_id": translation.t_id, "date": today}])
         db.session.commit()
-        daily_word_cache[today] = (yoruba_word_obj.text, english_word_obj.text)
+        daily_word_pool.mark_used(translation.t_id)
+
+        daily = _load_daily_word(today)
+        yoruba_word_obj, english_word_obj = _derive_yoruba_english(daily.translation)
+        daily_word_cache.set(
+            today, DailyWordEntry(yoruba_word_obj.text, english_word_obj.text, daily.translation_id)
+        )
 
         response_data = WordOfTheDayResponseData(
             yoruba_word=yoruba_word_obj.text, english_word=english_word_obj.text
@@ -286,6 +774,9 @@ def get_proverbs_containing(db, language: Language, word_text: str) -> list[Prov
     """Return every Proverb whose `proverb_words` join entries reference a Word
     matching (language, word_text). Returns an empty list if no match.
 
+    Answered from proverb_search_index, so this is one primary-key IN query
+    for the matching proverbs rather than a join through proverb_words.
+
     Phase 3 backfill is best-effort: proverbs that predate Phase 3 are linked
     only if their tokenized words match an existing Word row at backfill time.
     Misses are silently skipped, so a missing result here does not necessarily
@@ -294,14 +785,114 @@ def get_proverbs_containing(db, language: Language, word_text: str) -> list[Prov
     word_text = normalize_word_text(word_text)
     if not word_text:
         return []
-    return (
-        Proverb.query
-        .join(ProverbWord, ProverbWord.proverb_id == Proverb.p_id)
-        .join(Word, Word.w_id == ProverbWord.word_id)
-        .filter(Word.language == language, Word.text == word_text)
-        .distinct()
-        .all()
-    )
+    matches = proverb_search_index.search(db, parse_proverb_query(word_text), language)
+    return _load_proverbs(db, [p_id for p_id, _ in matches])
+
+
+def _load_proverbs(db, p_ids: list[int]) -> list[Proverb]:
+    """The Proverbs with ``p_ids``, in that order, skipping any deleted
+    since the index was built."""
+    if not p_ids:
+        return []
+    by_id = {p.p_id: p for p in db.session.query(Proverb).filter(Proverb.p_id.in_(p_ids))}
+    return [by_id[p_id] for p_id in p_ids if p_id in by_id]
+
+
+def suggest_words(db, prefix: str, language: Language, limit: int) -> tuple[dict, int]:
+    """Autocomplete: the ``limit`` best words of ``language`` starting with
+    ``prefix``, from the in-memory word_suggester."""
+    if not 1 <= limit <= SUGGEST_MAX_LIMIT:
+        return APIResponse.error(f"'limit' must be between 1 and {SUGGEST_MAX_LIMIT}.", 400).as_response()
+    prefix = normalize_word_text(prefix)
+    if not prefix:
+        return APIResponse.error("Prefix must not be empty.", 400).as_response()
+
+    try:
+        suggestions = word_suggester.suggest(db, prefix, language, limit)
+        response_data = SuggestResponseData(
+            prefix=prefix,
+            language=language,
+            suggestions=[suggestion._asdict() for suggestion in suggestions],
+        )
+        return APIResponse.success("Suggestions fetched successfully.", response_data).as_response()
+
+    except Exception as e:
+        logger.error(f"Error suggesting words for '{prefix}': {e}")
+        return APIResponse.error("An error occurred while fetching suggestions.", 500).as_response()
+
+
+def search_proverbs(db, q: str, language: Language, page: int, per_page: int) -> tuple[dict, int]:
+    """Proverbs whose ``language`` side contains every term of ``q``, with
+    double-quoted phrases matched at consecutive word positions. Ranked
+    best first and paginated (``page`` is 1-based)."""
+    if page < 1 or not 1 <= per_page <= SEARCH_MAX_PER_PAGE:
+        return APIResponse.error(
+            f"'page' must be positive and 'per_page' between 1 and {SEARCH_MAX_PER_PAGE}.", 400
+        ).as_response()
+    query = parse_proverb_query(q)
+    if not query.required_terms:
+        return APIResponse.error("Query must not be empty.", 400).as_response()
+
+    try:
+        matches = proverb_search_index.search(db, query, language)
+        page_matches = matches[(page - 1) * per_page:page * per_page]
+        scores = dict(page_matches)
+        proverbs = _load_proverbs(db, [p_id for p_id, _ in page_matches])
+        response_data = ProverbSearchResponseData(
+            query=q,
+            language=language,
+            total=len(matches),
+            page=page,
+            per_page=per_page,
+            results=[
+                {
+                    "yoruba_text": proverb.yoruba_text,
+                    "english_text": proverb.english_text,
+                    "score": round(scores[proverb.p_id], 4),
+                }
+                for proverb in proverbs
+            ],
+        )
+        return APIResponse.success("Proverbs fetched successfully.", response_data).as_response()
+
+    except Exception as e:
+        logger.error(f"Error searching proverbs for '{q}': {e}")
+        return APIResponse.error("An error occurred while searching proverbs.", 500).as_response()
+
+
+def search_text(
+    db, q: str, language: Optional[Language], doc_type: Optional[str], page: int, per_page: int
+) -> tuple[dict, int]:
+    """Full-text search over proverbs and example sentences (see
+    full_text_search). ``language`` and ``doc_type`` narrow the search when
+    given; results are ranked best first and paginated (``page`` is 1-based)."""
+    if page < 1 or not 1 <= per_page <= SEARCH_MAX_PER_PAGE:
+        return APIResponse.error(
+            f"'page' must be positive and 'per_page' between 1 and {SEARCH_MAX_PER_PAGE}.", 400
+        ).as_response()
+    if doc_type is not None and doc_type not in full_text_search.DOCUMENT_TYPES:
+        return APIResponse.error(
+            f"'type' must be one of {', '.join(full_text_search.DOCUMENT_TYPES)}.", 400
+        ).as_response()
+    if not full_text_search.parse_search_query(q):
+        return APIResponse.error("Query must not be empty.", 400).as_response()
+
+    try:
+        clauses, total, hits = full_text_search.search(
+            db, q, language, doc_type, limit=per_page, offset=(page - 1) * per_page
+        )
+        response_data = FullTextSearchResponseData(
+            query=q,
+            total=total,
+            page=page,
+            per_page=per_page,
+            results=full_text_search.load_hits(db, clauses, hits),
+        )
+        return APIResponse.success("Search results fetched successfully.", response_data).as_response()
+
+    except Exception as e:
+        logger.error(f"Error running full-text search for '{q}': {e}")
+        return APIResponse.error("An error occurred while searching.", 500).as_response()
 
 
 def get_random_proverb(db):
@@ -309,7 +900,7 @@ def get_random_proverb(db):
     Fetches a random proverb from the database.
     """
     try:
-        proverb = Proverb.query.order_by(db.func.random()).first()
+        proverb = proverb_sampler.sample(db)
         if not proverb:
             return APIResponse.error("No proverbs found in the database.", 404).as_response()
         response_data = ProverbResponseData(
@@ -323,6 +914,26 @@ def get_random_proverb(db):
         return APIResponse.error("An error occurred while fetching a proverb.", 500).as_response()
 
 
+def get_proverb_of_the_hour(db):
+    """
+    Fetches the proverb of the current hour: the same proverb for every
+    request (and every worker) until the hour changes.
+    """
+    try:
+        hourly = proverb_sampler.of_the_hour(db)
+        if not hourly:
+            return APIResponse.error("No proverbs found in the database.", 404).as_response()
+        response_data = ProverbResponseData(
+            yoruba_text=hourly.yoruba_text,
+            english_text=hourly.english_text
+        )
+        return APIResponse.success("Proverb of the hour fetched successfully.", response_data).as_response()
+
+    except Exception as e:
+        logger.error(f"Error fetching proverb of the hour: {e}")
+        return APIResponse.error("An error occurred while fetching a proverb.", 500).as_response()
+
+
 def get_sitemap_words(db) -> Tuple[Dict, int]:
     """Return all English words that have at least one Yoruba translation.
 
@@ -335,6 +946,7 @@ def get_sitemap_words(db) -> Tuple[Dict, int]:
             db.session.query(Word.text)
             .filter(Word.language == Language.ENGLISH.value)
             .join(Translation, Word.w_id == Translation.source_word_id)
+            .filter(Translation.review_status == REVIEW_APPROVED)
             .distinct()
             .all()
         )
@@ -348,59 +960,23 @@ def get_sitemap_words(db) -> Tuple[Dict, int]:
         return APIResponse.error("An error occurred while fetching sitemap words.", 500).as_response()
 
 
-def _process_translation_pair(row: list, dry_run: bool, successful_pairs: list, failed_pairs: list):
-    """
-    Processes a single row from the bulk upload CSV.
-    """
-    original_line = ",".join(row)
-
-    if len(row) != 2:
-        failed_pairs.append({"line": original_line, "reason": "Invalid format: each line must contain exactly two values"})
-        return
-
-    english_word_str, yoruba_word_str = [item.strip().lower() for item in row]
-
-    # Validation
-    if not is_valid_english_word(english_word_str):
-        failed_pairs.append({"line": original_line, "reason": f"Invalid English word: '{english_word_str}'"})
-        return
-    if not is_valid_yoruba_word(yoruba_word_str):
-        failed_pairs.append({"line": original_line, "reason": f"Invalid Yoruba word: '{yoruba_word_str}'"})
-        return
-
-    if dry_run:
-        # In dry_run, we just validate and report
-        successful_pairs.append({"english": english_word_str, "yoruba": yoruba_word_str})
-    else:
-        # In a live run, we add the words and translation
-        english_word_obj = add_word(language=Language.ENGLISH, word_text=english_word_str)
-        yoruba_word_obj = add_word(language=Language.YORUBA, word_text=yoruba_word_str)
-        
-        if english_word_obj and yoruba_word_obj:
-            create_translation(english_word_obj, yoruba_word_obj)
-            successful_pairs.append({"english": english_word_str, "yoruba": yoruba_word_str})
-        else:
-            failed_pairs.append({"line": original_line, "reason": "Failed to process one or both words."})
-
-
 def bulk_upload_words(db, text_input: str, dry_run: bool) -> tuple[dict, int]:
     """
-    Bulk upload words from a comma-separated text input using seed data utils.
+    Bulk upload words from a comma-separated text input. Validates every
+    line first, then writes the live run with a handful of set-based
+    statements (see bulk_upload).
     """
-    successful_pairs = []
-    failed_pairs = []
-
-    text_io = io.StringIO(text_input)
-    reader = csv.reader(text_io)
-
-    for row in reader:
-        if not row:
-            continue
-        _process_translation_pair(row, dry_run, successful_pairs, failed_pairs)
+    try:
+        successful_pairs, failed_pairs, created = bulk_upload(db, text_input, dry_run)
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error during bulk upload: {e}")
+        return APIResponse.error("An error occurred during bulk upload.", 500).as_response()
 
     message = "Bulk upload validation completed"
     if not dry_run:
         db.session.commit()
+        logger.info(f"Bulk upload stored {len(successful_pairs)} pairs, {created} new translations")
         message = "Bulk upload process completed."
 
     response_data = BulkUploadResponseData(
@@ -408,5 +984,46 @@ def bulk_upload_words(db, text_input: str, dry_run: bool) -> tuple[dict, int]:
         failed_pairs=failed_pairs,
         dry_run=dry_run
     )
-    
+
     return APIResponse.success(message, response_data).as_response()
+
+
+def stream_bulk_upload_words(db, lines: Iterable[str], dry_run: bool) -> Iterator[dict]:
+    """
+    Streaming counterpart of bulk_upload_words for ``text/csv`` bodies.
+    Rows are read lazily and processed BULK_CHUNK_SIZE at a time, a live
+    run committing each chunk, so memory does not grow with the upload.
+    Yields a ``failure`` record per rejected row and a ``progress`` record
+    per chunk, then ``done``; if reading or storing stops the upload, an
+    ``error`` record instead (chunks already committed stay).
+    """
+    counts = {"processed_rows": 0, "successful_count": 0, "failed_count": 0, "translations_created": 0}
+    try:
+        for chunk in chunked(parse_bulk_lines(lines), BULK_CHUNK_SIZE):
+            pairs, failures, created = process_rows(db, chunk, dry_run)
+            if not dry_run:
+                db.session.commit()
+            counts["processed_rows"] += len(chunk)
+            counts["successful_count"] += len(pairs)
+            counts["failed_count"] += len(failures)
+            counts["translations_created"] += created
+            for failure in failures:
+                yield {"type": "failure", "row": failure.index, **failure.as_dict()}
+            yield {"type": "progress", **counts}
+    except (UnicodeDecodeError, EOFError, OSError, csv.Error) as e:
+        # Undecodable text, a corrupt gzip body or a malformed CSV row.
+        db.session.rollback()
+        yield {"type": "error", "message": f"Could not read the upload: {e}", **counts}
+        return
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f"Error during streaming bulk upload: {e}")
+        yield {"type": "error", "message": "An error occurred during bulk upload.", **counts}
+        return
+
+    if not dry_run:
+        logger.info(
+            f"Streaming bulk upload stored {counts['successful_count']} pairs, "
+            f"{counts['translations_created']} new translations"
+        )
+    yield {"type": "done", "dry_run": dry_run, **counts}
@@ -0,0 +1,336 @@
+# word_suggestions.py
+"""Prefix autocomplete over Word.text for /api/suggest, and "did you mean"
+suggestions for translate() misses.
+
+Per language, WordSuggester keeps the normalized word texts in one sorted
+list with a parallel array of scores, so the completions of a prefix are
+the contiguous slice found by two binary searches. A word's score is its
+translation count plus log1p of how often users have asked for it and
+missed (MissingTranslation hit_count), so well-covered and in-demand words
+come first.
+
+Short prefixes match most of the lexicon, so the top completions of every
+prefix up to ``PRECOMPUTED_PREFIX_LENGTH`` characters are precomputed at
+build time; longer prefixes select from their (small) slice. Either way a
+request does no I/O.
+
+The index goes stale when this worker commits a word (via
+lexicon_changes). Every ``SUGGEST_CHECK_SECONDS`` a request also compares
+lexicon_fingerprint() against the build, which catches writes from other
+workers, and an index older than ``SUGGEST_MAX_AGE_SECONDS`` is rebuilt to
+pick up new demand counts. Rebuilds after the first run on a background
+thread (unless ``SUGGEST_BACKGROUND_BUILD=0``); requests keep completing
+from the previous index until the new one is swapped in.
+
+FuzzyWordMatcher finds words within a small edit distance of a missed
+query, SymSpell-style: every word's diacritic-folded prefix is indexed
+under each string obtainable from it by deleting up to
+``FUZZY_MAX_DISTANCE`` characters. A query generates its own deletes and
+looks each one up, so candidates come from dict hits rather than a scan of
+the lexicon. Only the candidates are checked with a real (optimal string
+alignment) distance, and that check stops once ``FUZZY_BUDGET_MS`` is
+spent. Queries of up to ``SHORT_QUERY_LENGTH`` characters allow a single
+edit. It is kept fresh the same way as WordSuggester, except that even
+the first build runs in the background. Matching happens in Python on
+every dialect, so pg_trgm is not needed.
+"""
+
+import heapq
+import math
+import os
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Callable, NamedTuple
+
+from sqlalchemy import func
+
+from alarino_backend.db_models import MissingTranslation, Translation, Word
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener
+from alarino_backend.lexicon_snapshot import LexiconDerivedIndex
+from alarino_backend.normalization import fold_diacritics
+
+SUGGEST_CHECK_SECONDS = float(os.getenv("SUGGEST_CHECK_SECONDS", "30"))
+SUGGEST_MAX_AGE_SECONDS = float(os.getenv("SUGGEST_MAX_AGE_SECONDS", "900"))
+SUGGEST_MAX_LIMIT = 20
+SUGGEST_BACKGROUND_BUILD = os.getenv("SUGGEST_BACKGROUND_BUILD", "1") == "1"
+PRECOMPUTED_PREFIX_LENGTH = 2
+FUZZY_MAX_DISTANCE = int(os.getenv("FUZZY_MAX_DISTANCE", "2"))
+FUZZY_PREFIX_LENGTH = int(os.getenv("FUZZY_PREFIX_LENGTH", "7"))
+FUZZY_BUDGET_MS = float(os.getenv("FUZZY_BUDGET_MS", "5"))
+# Building the deletion index takes seconds for a large lexicon, so by
+# default it happens on a background thread while the previous index (or,
+# before the first build, no suggestions) keeps serving.
+FUZZY_BACKGROUND_BUILD = os.getenv("FUZZY_BACKGROUND_BUILD", "1") == "1"
+FUZZY_MAX_LIMIT = 5
+SHORT_QUERY_LENGTH = 4
+
+
+class Suggestion(NamedTuple):
+    text: str
+    translations: int
+    demand: int
+
+
+class _LanguageIndex(NamedTuple):
+    texts: list[str]
+    translations: array
+    demand: array
+    scores: array
+    top: dict[str, list[int]]
+
+    def rank_key(self, i: int) -> tuple:
+        return -self.scores[i], len(self.texts[i]), self.texts[i]
+
+    def suggestion(self, i: int) -> Suggestion:
+        return Suggestion(self.texts[i], self.translations[i], self.demand[i])
+
+
+def _build_language_index(words: list[tuple[str, int, int]]) -> _LanguageIndex:
+    words.sort()
+    index = _LanguageIndex(
+        texts=[text for text, _, _ in words],
+        translations=array("i", (count for _, count, _ in words)),
+        demand=array("q", (hits for _, _, hits in words)),
+        scores=array("d", (count + math.log1p(hits) for _, count, hits in words)),
+        top={},
+    )
+    by_prefix: dict[str, list[int]] = defaultdict(list)
+    for i, text in enumerate(index.texts):
+        for length in range(1, min(len(text), PRECOMPUTED_PREFIX_LENGTH) + 1):
+            by_prefix[text[:length]].append(i)
+    for prefix, rows in by_prefix.items():
+        index.top[prefix] = heapq.nsmallest(SUGGEST_MAX_LIMIT, rows, key=index.rank_key)
+    return index
+
+
+def _translation_counts(db) -> dict[int, int]:
+    """Number of translations touching each word, on either side."""
+    counts: dict[int, int] = defaultdict(int)
+    for column in (Translation.source_word_id, Translation.target_word_id):
+        for w_id, count in db.session.query(column, func.count()).group_by(column):
+            counts[w_id] += count
+    return counts
+
+
+class WordSuggester(LexiconDerivedIndex):
+    thread_name = "word-suggester"
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        background: bool = SUGGEST_BACKGROUND_BUILD,
+    ):
+        super().__init__(SUGGEST_CHECK_SECONDS, SUGGEST_MAX_AGE_SECONDS, clock, background)
+        self._indexes: dict[str, _LanguageIndex] = {}
+
+    def _ensure_fresh(self, db) -> None:
+        # Nothing to serve before the first build, so that one is inline.
+        if self.builds == 0:
+            self._refresh(db)
+        else:
+            super()._ensure_fresh(db)
+
+    def _build(self, db) -> None:
+        translation_counts = _translation_counts(db)
+        demand = {
+            (language, text): hits
+            for text, language, hits in db.session.query(
+                MissingTranslation.text,
+                MissingTranslation.source_language,
+                func.sum(MissingTranslation.hit_count),
+            ).group_by(MissingTranslation.text, MissingTranslation.source_language)
+        }
+        words: dict[str, list[tuple[str, int, int]]] = defaultdict(list)
+        for w_id, language, text in db.session.query(Word.w_id, Word.language, Word.text):
+            hits = int(demand.get((language, text), 0))
+            words[language].append((text, translation_counts[w_id], hits))
+        self._indexes = {language: _build_language_index(rows) for language, rows in words.items()}
+        self.builds += 1
+
+    def suggest(self, db, prefix: str, language: Language, limit: int) -> list[Suggestion]:
+        """Up to ``limit`` words of ``language`` starting with ``prefix``
+        (already normalized), best first."""
+        self._ensure_fresh(db)
+        index = self._indexes.get(language.value)
+        if index is None or not prefix:
+            return []
+        rows = index.top.get(prefix) if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH else None
+        if rows is None:
+            lo = bisect_left(index.texts, prefix)
+            hi = bisect_left(index.texts, prefix + "\U0010ffff", lo)
+            rows = heapq.nsmallest(limit, range(lo, hi), key=index.rank_key)
+        return [index.suggestion(i) for i in rows[:limit]]
+
+    def stats(self) -> dict:
+        return {
+            "words": {language: len(index.texts) for language, index in self._indexes.items()},
+            "precomputed_prefixes": sum(len(index.top) for index in self._indexes.values()),
+            "builds": self.builds,
+        }
+
+
+class _FuzzyIndex(NamedTuple):
+    texts: list[str]
+    folded: list[str]
+    translations: array
+    deletes: dict[str, list[int]]
+
+
+def _deletes(text: str, max_distance: int) -> set[str]:
+    """``text`` and every string obtained from it by deleting up to
+    ``max_distance`` characters."""
+    found = {text}
+    frontier = {text}
+    for _ in range(max_distance):
+        frontier = {
+            variant[:i] + variant[i + 1:]
+            for variant in frontier
+            for i in range(len(variant))
+        } - found
+        found |= frontier
+    return found
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions) between ``a`` and ``b``, or ``max_distance + 1`` as soon
+    as it is known to exceed ``max_distance``."""
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: list[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class FuzzyWordMatcher(LexiconDerivedIndex):
+    thread_name = "fuzzy-word-matcher"
+
+    def __init__(
+        self,
+        max_distance: int = FUZZY_MAX_DISTANCE,
+        prefix_length: int = FUZZY_PREFIX_LENGTH,
+        budget_ms: float = FUZZY_BUDGET_MS,
+        background: bool = FUZZY_BACKGROUND_BUILD,
+        clock: Callable[[], float] = time.monotonic,
+        timer: Callable[[], float] = time.perf_counter,
+    ):
+        super().__init__(SUGGEST_CHECK_SECONDS, SUGGEST_MAX_AGE_SECONDS, clock, background)
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.budget_ms = budget_ms
+        self._timer = timer
+        self._indexes: dict[str, _FuzzyIndex] = {}
+        self.lookups = 0
+        self.over_budget = 0
+
+    def _build(self, db) -> None:
+        translation_counts = _translation_counts(db)
+        words: dict[str, list[tuple[str, int]]] = defaultdict(list)
+        for w_id, language, text in db.session.query(Word.w_id, Word.language, Word.text):
+            # Words nobody can be pointed at usefully are left out.
+            if translation_counts[w_id]:
+                words[language].append((text, translation_counts[w_id]))
+
+        indexes = {}
+        for language, rows in words.items():
+            rows.sort()
+            index = _FuzzyIndex(
+                texts=[text for text, _ in rows],
+                folded=[fold_diacritics(text) for text, _ in rows],
+                translations=array("i", (count for _, count in rows)),
+                deletes=defaultdict(list),
+            )
+            for i, folded in enumerate(index.folded):
+                for variant in _deletes(folded[:self.prefix_length], self.max_distance):
+                    index.deletes[variant].append(i)
+            indexes[language] = index._replace(deletes=dict(index.deletes))
+        self._indexes = indexes
+        self.builds += 1
+
+    def lookup(
+        self, db, text: str, language: Language, limit: int = FUZZY_MAX_LIMIT
+    ) -> list[dict]:
+        """Up to ``limit`` translated words of ``language`` within
+        ``max_distance`` edits of ``text`` (compared diacritic-folded),
+        closest first, then most translated. May return fewer than exist if
+        the time budget runs out."""
+        self._ensure_fresh(db)
+        return self._match(text, language, limit)
+
+    def lookup_many(
+        self, db, queries: list[tuple[str, Language]], limit: int = FUZZY_MAX_LIMIT
+    ) -> list[list[dict]]:
+        """lookup() for each ``(text, language)``, with one freshness check
+        for them all."""
+        self._ensure_fresh(db)
+        return [self._match(text, language, limit) for text, language in queries]
+
+    def _match(self, text: str, language: Language, limit: int) -> list[dict]:
+        index = self._indexes.get(language.value)
+        if index is None:
+            return []
+        self.lookups += 1
+        deadline = self._timer() + self.budget_ms / 1000
+        query = fold_diacritics(text)
+        # Two edits turn almost any short word into another: allow one.
+        max_distance = (
+            self.max_distance if len(query) > SHORT_QUERY_LENGTH else min(1, self.max_distance)
+        )
+
+        # Fewer deletes from the query first: those candidates are likelier
+        # to be close, so they are checked before the budget can run out.
+        variants = sorted(
+            _deletes(query[:self.prefix_length], max_distance), key=len, reverse=True
+        )
+        seen: set[int] = set()
+        matches = []
+        for variant in variants:
+            for i in index.deletes.get(variant, ()):
+                if i in seen:
+                    continue
+                seen.add(i)
+                folded = index.folded[i]
+                if (
+                    min(len(folded), self.prefix_length) - len(variant) > max_distance
+                    or abs(len(folded) - len(query)) > max_distance
+                ):
+                    continue
+                distance = edit_distance(query, folded, max_distance)
+                if distance <= max_distance and index.texts[i] != text:
+                    matches.append((distance, -index.translations[i], index.texts[i]))
+            if self._timer() > deadline:
+                self.over_budget += 1
+                break
+
+        return [
+            {"text": word_text, "distance": distance, "translation_count": -negative_count}
+            for distance, negative_count, word_text in heapq.nsmallest(limit, matches)
+        ]
+
+    def stats(self) -> dict:
+        return {
+            "words": {language: len(index.texts) for language, index in self._indexes.items()},
+            "deletes": {language: len(index.deletes) for language, index in self._indexes.items()},
+            "lookups": self.lookups,
+            "over_budget": self.over_budget,
+            "builds": self.builds,
+        }
+
+
+word_suggester = WordSuggester()
+register_listener(word_suggester.mark_stale)
+fuzzy_word_matcher = FuzzyWordMatcher()
+register_listener(fuzzy_word_matcher.mark_stale)
@@ -1,5 +1,69 @@
 import os
 
+import pytest
+
 
 # Tests use create_app(), which requires a database URL unless a test overrides it.
 os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+# Record missing translations synchronously so tests can assert on rows right
+# after the request; the buffered writer has its own tests.
+os.environ.setdefault("MISSING_TRANSLATION_BUFFER_ENABLED", "0")
+# Build the fuzzy "did you mean" index inline so a miss sees it immediately.
+os.environ.setdefault("FUZZY_BACKGROUND_BUILD", "0")
+# Likewise rebuild autocomplete inline after a write.
+os.environ.setdefault("SUGGEST_BACKGROUND_BUILD", "0")
+# Run bulk upload jobs inline so a test can assert on the finished job.
+os.environ.setdefault("BULK_UPLOAD_BACKGROUND", "0")
+
+
+@pytest.fixture(autouse=True)
+def clear_translation_cache():
+    # The translation cache is process-wide; without this a hit cached by one
+    # test would answer the same lookup in the next test's fresh database.
+    from alarino_backend.llm_cache import llm_translation_cache
+    from alarino_backend.translation_cache import translation_cache
+
+    translation_cache.clear()
+    llm_translation_cache.clear()
+    yield
+    translation_cache.clear()
+    llm_translation_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_derived_indexes():
+    # Same for the in-memory indexes: each test's database reuses ids from
+    # 1, so an id-based freshness check can't tell two tests' rows apart.
+    from alarino_backend.phrase_segmentation import phrase_segmenter
+    from alarino_backend.proverbs import proverb_search_index
+    from alarino_backend.word_suggestions import fuzzy_word_matcher, word_suggester
+
+    proverb_search_index.mark_stale()
+    word_suggester.mark_stale()
+    phrase_segmenter.mark_stale()
+    fuzzy_word_matcher.mark_stale()
+    yield
+
+
+@pytest.fixture
+def count_queries():
+    # count_queries(fn) runs fn and returns (its result, the number of SQL
+    # statements it sent), for tests that pin a code path's round trips.
+    from sqlalchemy import event
+
+    from alarino_backend import db
+
+    def count(fn):
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            result = fn()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+        return result, len(statements)
+
+    return count
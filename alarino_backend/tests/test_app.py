@@ -42,9 +42,19 @@ def test_expected_routes_are_registered(app):
     assert {
         "/api/translate",
         "/api/translate/llm",
+        "/api/translate/batch",
+        "/api/translate/phrase",
+        "/api/suggest",
         "/api/daily-word",
         "/api/proverb",
+        "/api/proverb/hourly",
+        "/api/proverbs/search",
+        "/api/search",
         "/api/admin/bulk-upload",
+        "/api/admin/stats",
+        "/api/admin/missing-translations",
+        "/api/admin/review-queue",
+        "/api/admin/jobs/<job_id>",
         "/api/words",
         "/api/health",
     }.issubset(rules)
@@ -171,6 +181,47 @@ def test_translate_llm_returns_service_response(client, monkeypatch):
     assert response.get_json() == payload
 
 
+def test_translate_batch_rejects_missing_items(client):
+    response = client.post("/api/translate/batch", json={"text": "hello"})
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Invalid request body, 'items' must be a list."
+
+
+def test_translate_batch_rejects_array_body(client):
+    response = client.post("/api/translate/batch", json=[{"text": "hello"}])
+
+    assert response.status_code == 400
+    assert response.get_json()["message"] == "Invalid request body, 'items' must be a list."
+
+
+def test_translate_batch_returns_service_response(client, monkeypatch):
+    captured = {}
+    payload = {
+        "success": True,
+        "status": 200,
+        "message": "Batch translation completed.",
+        "data": {"results": []},
+    }
+
+    def fake_translate_batch(db_arg, items, user_agent):
+        captured.update(db_arg=db_arg, items=items, user_agent=user_agent)
+        return payload, 200
+
+    monkeypatch.setattr(app_module, "translate_batch", fake_translate_batch)
+
+    items = [{"text": "hello", "source_lang": "en", "target_lang": "yo"}]
+    response = client.post(
+        "/api/translate/batch",
+        json={"items": items},
+        headers={"User-Agent": "pytest-agent"},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == payload
+    assert captured == {"db_arg": db, "items": items, "user_agent": "pytest-agent"}
+
+
 def test_daily_word_returns_service_response(client, monkeypatch):
     payload = {
         "success": True,
@@ -194,6 +245,63 @@ def test_daily_word_returns_service_response(client, monkeypatch):
     assert captured == {"db_arg": db, "cache_arg": _daily_word_cache}
 
 
+@pytest.fixture
+def daily_word_cache(monkeypatch):
+    from datetime import datetime
+
+    from alarino_backend.cache_backends import InProcessCacheBackend
+    from alarino_backend.daily_word_cache import DailyWordCache, DailyWordEntry
+
+    cache = DailyWordCache(InProcessCacheBackend(), now=lambda: datetime(2026, 3, 1, 22, 0, 0))
+    payload = {
+        "success": True,
+        "status": 200,
+        "message": "Word of the day fetched from cache.",
+        "data": {"yoruba_word": "ore", "english_word": "friend"},
+    }
+
+    def fake_get_word_of_the_day(db_arg, cache_arg):
+        cache_arg.set(cache_arg.today(), DailyWordEntry("ore", "friend", 42))
+        return payload, 200
+
+    monkeypatch.setattr(app_module, "_daily_word_cache", cache)
+    monkeypatch.setattr(app_module, "get_word_of_the_day", fake_get_word_of_the_day)
+    return cache
+
+
+def test_daily_word_is_cacheable_until_midnight(client, daily_word_cache):
+    response = client.get("/api/daily-word")
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == '"2026-03-01-42"'
+    assert response.cache_control.public is True
+    assert response.cache_control.max_age == 2 * 60 * 60
+
+
+def test_daily_word_honors_if_none_match(client, daily_word_cache):
+    etag = client.get("/api/daily-word").headers["ETag"]
+
+    response = client.get("/api/daily-word", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+
+    stale = client.get("/api/daily-word", headers={"If-None-Match": '"2026-02-28-41"'})
+    assert stale.status_code == 200
+
+
+def test_daily_word_errors_are_not_cacheable(client, monkeypatch):
+    payload = {"success": False, "status": 500, "message": "boom", "data": None}
+    monkeypatch.setattr(app_module, "get_word_of_the_day", lambda db_arg, cache_arg: (payload, 500))
+
+    response = client.get("/api/daily-word")
+
+    assert response.status_code == 500
+    assert "ETag" not in response.headers
+    assert response.cache_control.max_age is None
+
+
 def test_proverb_returns_service_response(client, monkeypatch):
     payload = {
         "success": True,
@@ -297,6 +405,48 @@ def test_admin_bulk_upload_returns_service_response(client, monkeypatch):
     }
 
 
+def test_admin_stats_requires_authorization_header(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+
+    response = client.get("/api/admin/stats")
+
+    assert response.status_code == 401
+
+
+def test_admin_stats_reports_translation_cache_counters(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+
+    response = client.get(
+        "/api/admin/stats",
+        headers={"Authorization": "Bearer test-key"},
+    )
+
+    assert response.status_code == 200
+    stats = response.get_json()["data"]["translation_cache"]
+    assert {"size", "max_entries", "hits", "misses", "evictions"}.issubset(stats)
+
+
+def test_admin_missing_translations_passes_window_to_service(client, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    captured = {}
+    payload = {"success": True, "status": 200, "message": "ok", "data": {"since": "2026-01-01", "entries": []}}
+
+    def fake_report(db_arg, days, limit):
+        captured.update(db_arg=db_arg, days=days, limit=limit)
+        return payload, 200
+
+    monkeypatch.setattr(app_module, "get_missing_translations_report", fake_report)
+
+    response = client.get(
+        "/api/admin/missing-translations?days=30&limit=5",
+        headers={"Authorization": "Bearer test-key"},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json() == payload
+    assert captured == {"db_arg": db, "days": 30, "limit": 5}
+
+
 def test_words_returns_service_response(client, monkeypatch):
     payload = {
         "success": True,
@@ -5,12 +5,18 @@ against real Postgres. These tests cover the unit/integration boundary so
 regressions in input parsing, validation, and persistence are caught
 under pytest."""
 
+import gzip
+import json
+
 import pytest
 
 import alarino_backend.app as app_module
+import alarino_backend.bulk_upload as bulk_upload
 import alarino_backend.translation_service as translation_service
 from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word
 from alarino_backend.db_models import Sense, Translation, Word
+from alarino_backend.languages import Language
 
 
 @pytest.fixture
@@ -170,3 +176,173 @@ def test_empty_input_returns_empty_response(db_app):
     assert response["data"]["successful_pairs"] == []
     assert response["data"]["failed_pairs"] == []
     assert Word.query.count() == 0
+
+
+# ---- Set-based writes ----
+
+
+_LETTERS = "abdefgijklmnoprstuwy"  # valid in both languages
+
+
+def _letters(n: int) -> str:
+    word = ""
+    while True:
+        word = _LETTERS[n % len(_LETTERS)] + word
+        n //= len(_LETTERS)
+        if not n:
+            return word
+
+
+@pytest.mark.parametrize("size", [1, 50, 400])
+def test_live_run_statement_count_is_independent_of_size(db_app, size, count_queries):
+    lines = "\n".join(f"{_letters(i)},ba{_letters(i)}" for i in range(size))
+
+    (response, status), statements = count_queries(
+        lambda: translation_service.bulk_upload_words(db, lines, dry_run=False)
+    )
+
+    assert status == 200
+    assert len(response["data"]["successful_pairs"]) == size
+    assert Translation.query.count() == size
+    # words SELECT + INSERT, senses SELECT + INSERT, translations INSERT,
+    # plus the transaction's BEGIN/COMMIT bookkeeping.
+    assert statements <= 7
+
+
+def test_live_run_statement_count_is_bounded_per_chunk(db_app, monkeypatch, count_queries):
+    monkeypatch.setattr(bulk_upload, "BULK_CHUNK_SIZE", 10)
+    lines = "\n".join(f"{_letters(i)},ba{_letters(i)}" for i in range(35))
+
+    _, statements = count_queries(
+        lambda: translation_service.bulk_upload_words(db, lines, dry_run=False)
+    )
+
+    assert Translation.query.count() == 35
+    assert statements <= 4 * 5 + 2
+
+
+def test_live_run_reuses_existing_words_and_senses(db_app):
+    translation_service.bulk_upload_words(db, "hello,bawo", dry_run=False)
+
+    translation_service.bulk_upload_words(db, "hello,pele\nhi,bawo", dry_run=False)
+
+    assert Word.query.count() == 4
+    assert Sense.query.count() == 4
+    assert Translation.query.count() == 3
+    assert Word.query.filter_by(language="yo", text="pele").one().folded_text == "pele"
+
+
+def test_live_run_dedupes_repeated_pairs_within_one_upload(db_app):
+    response, _ = translation_service.bulk_upload_words(
+        db, "hello,bawo\nHELLO,bawo", dry_run=False
+    )
+
+    assert len(response["data"]["successful_pairs"]) == 2
+    assert Translation.query.count() == 1
+
+
+def test_live_run_reports_words_with_several_senses(db_app):
+    word = add_word(Language.ENGLISH, "bank")
+    db.session.flush()
+    db.session.add_all([Sense(word_id=word.w_id, sense_label="money"), Sense(word_id=word.w_id, sense_label="river")])
+    db.session.commit()
+
+    response, status = translation_service.bulk_upload_words(
+        db, "bank,banki\nhello,bawo", dry_run=False
+    )
+
+    assert status == 200
+    assert response["data"]["successful_pairs"] == [{"english": "hello", "yoruba": "bawo"}]
+    [failed] = response["data"]["failed_pairs"]
+    assert failed["line"] == "bank,banki"
+    assert "Ambiguous sense" in failed["reason"]
+    assert Translation.query.count() == 1
+
+
+def test_failed_pairs_are_reported_in_input_order(db_app):
+    response, _ = translation_service.bulk_upload_words(
+        db, "bad@@@,bawo\nhello,bawo\nonly_one", dry_run=False
+    )
+
+    assert [f["line"] for f in response["data"]["failed_pairs"]] == ["bad@@@,bawo", "only_one"]
+
+
+def _ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_streaming_upload_processes_chunks_lazily(db_app, monkeypatch):
+    monkeypatch.setattr(translation_service, "BULK_CHUNK_SIZE", 10)
+    consumed = []
+
+    def lines():
+        for i in range(25):
+            consumed.append(i)
+            yield f"{_letters(i)},ba{_letters(i)}\n"
+
+    records = translation_service.stream_bulk_upload_words(db, lines(), dry_run=False)
+    first = next(records)
+
+    assert first == {
+        "type": "progress", "processed_rows": 10, "successful_count": 10,
+        "failed_count": 0, "translations_created": 10,
+    }
+    assert len(consumed) <= 11
+    assert [r["type"] for r in records] == ["progress", "progress", "done"]
+    assert Translation.query.count() == 25
+
+
+def test_streaming_upload_route_returns_ndjson(db_app, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    response = db_app.test_client().post(
+        "/api/admin/bulk-upload?dry_run=false",
+        data="\ufeffhello,bawo\nonly_one\nhouse,ilé\n".encode(),
+        headers={"Authorization": "Bearer test-key", "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    failure, progress, done = _ndjson(response)
+    assert failure["type"] == "failure"
+    assert (failure["row"], failure["line"]) == (1, "only_one")
+    assert progress["type"] == "progress"
+    assert done == {
+        "type": "done", "dry_run": False, "processed_rows": 3, "successful_count": 2,
+        "failed_count": 1, "translations_created": 2,
+    }
+    assert Word.query.filter_by(text="ilé").count() == 1
+
+
+def test_streaming_upload_accepts_gzip_and_defaults_to_dry_run(db_app, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    response = db_app.test_client().post(
+        "/api/admin/bulk-upload",
+        data=gzip.compress("hello,bawo\n".encode()),
+        headers={
+            "Authorization": "Bearer test-key",
+            "Content-Type": "text/csv; charset=utf-8",
+            "Content-Encoding": "gzip",
+        },
+    )
+
+    assert _ndjson(response)[-1]["type"] == "done"
+    assert _ndjson(response)[-1]["successful_count"] == 1
+    assert Translation.query.count() == 0
+
+
+def test_streaming_upload_reports_unreadable_body(db_app, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    headers = {"Authorization": "Bearer test-key", "Content-Type": "text/csv"}
+    client = db_app.test_client()
+
+    response = client.post(
+        "/api/admin/bulk-upload", data=b"not gzip", headers={**headers, "Content-Encoding": "gzip"}
+    )
+    [error] = _ndjson(response)
+    assert error["type"] == "error"
+    assert error["message"].startswith("Could not read the upload")
+
+    response = client.post(
+        "/api/admin/bulk-upload", data=b"x", headers={**headers, "Content-Encoding": "br"}
+    )
+    assert response.status_code == 415
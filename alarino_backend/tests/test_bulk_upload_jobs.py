@@ -0,0 +1,176 @@
+"""Tests for background bulk upload jobs."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.bulk_upload_jobs as bulk_upload_jobs_module
+from alarino_backend import db
+from alarino_backend.bulk_upload_jobs import BulkUploadJobRunner, run_job
+from alarino_backend.db_models import JOB_FAILED, JOB_SUCCEEDED, BulkUploadJob, Translation, Word
+
+
+@pytest.fixture
+def db_app(tmp_path, monkeypatch):
+    # A file database, so pool threads see the rows the test committed.
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'jobs.db'}")
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _payload(count):
+    letters = "abdefgijklmnoprstuwy"
+    words = []
+    for i in range(count):
+        word = ""
+        while True:
+            word = letters[i % len(letters)] + word
+            i //= len(letters)
+            if not i:
+                break
+        words.append(f"w{word}")
+    return "\n".join(f"{word},{word}" for word in words)
+
+
+def test_inline_job_reports_counts_and_failures(db_app):
+    job = BulkUploadJobRunner(background=False).submit(
+        db, "house,ilé\nbad line\ncar,ọkọ̀\nhouse,ilé", dry_run=False
+    )
+
+    assert job.status == JOB_SUCCEEDED
+    assert (job.total_rows, job.processed_rows) == (4, 4)
+    assert (job.successful_count, job.failed_count, job.translations_created) == (3, 1, 2)
+    assert job.failed_pairs == [
+        {"line": "bad line", "reason": "Invalid format: each line must contain exactly two values"}
+    ]
+    assert job.payload == ""
+    assert job.finished_at is not None
+    assert Translation.query.count() == 2
+
+
+def test_job_commits_progress_per_chunk(db_app, monkeypatch):
+    monkeypatch.setattr(bulk_upload_jobs_module, "BULK_CHUNK_SIZE", 10)
+    commits = []
+    monkeypatch.setattr(db.session, "commit", _recording(db.session.commit, commits))
+
+    job = BulkUploadJobRunner(background=False).submit(db, _payload(35), dry_run=False)
+
+    assert job.status == JOB_SUCCEEDED
+    assert job.translations_created == 35
+    # Claim, total_rows, four chunks and the final status, after the insert.
+    assert len(commits) == 1 + 1 + 1 + 4 + 1
+
+
+def _recording(commit, calls):
+    def wrapper():
+        calls.append(1)
+        commit()
+
+    return wrapper
+
+
+def test_failed_job_keeps_committed_chunks(db_app, monkeypatch):
+    monkeypatch.setattr(bulk_upload_jobs_module, "BULK_CHUNK_SIZE", 10)
+    real_process_rows = bulk_upload_jobs_module.process_rows
+    calls = []
+
+    def flaky_process_rows(db, rows, dry_run):
+        calls.append(len(rows))
+        if len(calls) == 2:
+            raise RuntimeError("database went away")
+        return real_process_rows(db, rows, dry_run)
+
+    monkeypatch.setattr(bulk_upload_jobs_module, "process_rows", flaky_process_rows)
+    job = BulkUploadJobRunner(background=False).submit(db, _payload(25), dry_run=False)
+
+    assert job.status == JOB_FAILED
+    assert job.error == "database went away"
+    assert (job.processed_rows, job.translations_created) == (10, 10)
+    assert Translation.query.count() == 10
+
+
+def test_dry_run_job_writes_nothing(db_app):
+    job = BulkUploadJobRunner(background=False).submit(db, "house,ilé\nbad,bad,row", dry_run=True)
+
+    assert job.status == JOB_SUCCEEDED
+    assert (job.successful_count, job.failed_count, job.translations_created) == (1, 1, 0)
+    assert Word.query.count() == 0
+
+
+def test_job_runs_only_once(db_app):
+    job = BulkUploadJob(job_id="abc", dry_run=False, payload="house,ilé", failed_pairs=[])
+    db.session.add(job)
+    db.session.commit()
+
+    assert run_job(db, "abc") is True
+    assert run_job(db, "abc") is False
+    assert run_job(db, "missing") is False
+    assert Translation.query.count() == 1
+
+
+def test_failed_pairs_are_capped(db_app, monkeypatch):
+    monkeypatch.setattr(bulk_upload_jobs_module, "BULK_UPLOAD_MAX_REPORTED_FAILURES", 3)
+    job = BulkUploadJobRunner(background=False).submit(db, "\n".join(["bad"] * 5), dry_run=False)
+
+    assert job.failed_count == 5
+    assert len(job.failed_pairs) == 3
+
+
+def test_background_pool_runs_and_resumes_jobs(db_app):
+    queued = BulkUploadJob(job_id="left-over", dry_run=False, payload="car,ọkọ̀", failed_pairs=[])
+    db.session.add(queued)
+    db.session.commit()
+
+    runner = BulkUploadJobRunner(workers=2, background=True)
+    runner.start(db_app)
+    try:
+        job_id = runner.submit(db, "house,ilé", dry_run=False).job_id
+    finally:
+        runner.stop()
+
+    db.session.expire_all()
+    assert db.session.get(BulkUploadJob, job_id).status == JOB_SUCCEEDED
+    assert db.session.get(BulkUploadJob, "left-over").status == JOB_SUCCEEDED
+    assert Translation.query.count() == 2
+
+
+def test_job_routes(db_app, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    headers = {"Authorization": "Bearer test-key"}
+    client = db_app.test_client()
+
+    response = client.post(
+        "/api/admin/bulk-upload",
+        json={"text_input": "house,ilé\nbad line", "dry_run": False, "async": True},
+        headers=headers,
+    )
+    assert response.status_code == 202
+    job_id = response.get_json()["data"]["job_id"]
+
+    assert client.get(f"/api/admin/jobs/{job_id}").status_code == 401
+    response = client.get(f"/api/admin/jobs/{job_id}", headers=headers)
+    assert response.status_code == 200
+    data = response.get_json()["data"]
+    assert data["status"] == JOB_SUCCEEDED
+    assert (data["processed_rows"], data["successful_count"], data["failed_count"]) == (2, 1, 1)
+    assert data["failed_pairs"][0]["line"] == "bad line"
+
+    assert client.get("/api/admin/jobs/unknown", headers=headers).status_code == 404
+
+
+def test_sync_upload_is_still_the_default(db_app, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    response = db_app.test_client().post(
+        "/api/admin/bulk-upload",
+        json={"text_input": "house,ilé", "dry_run": False},
+        headers={"Authorization": "Bearer test-key"},
+    )
+    assert response.status_code == 200
+    assert response.get_json()["data"]["successful_pairs"] == [{"english": "house", "yoruba": "ilé"}]
+    assert BulkUploadJob.query.count() == 0
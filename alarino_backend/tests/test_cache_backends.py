@@ -0,0 +1,237 @@
+"""Tests for the pluggable cache backends. The Redis backend is exercised
+against a small in-test server that speaks the subset of RESP the backend
+uses, so no Redis install is needed."""
+
+import fnmatch
+import socketserver
+import threading
+import time
+
+import pytest
+
+import alarino_backend.cache_backends as cache_backends
+from alarino_backend.cache_backends import (
+    InProcessCacheBackend,
+    RedisCacheBackend,
+    SharedFileCacheBackend,
+    create_cache_backend,
+)
+from alarino_backend.languages import Language
+from alarino_backend.response import SenseGroup, TranslationInSenseGroup, TranslationResponseData
+from alarino_backend.translation_cache import TranslationCache
+
+
+class _RespStandIn(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _RespHandler)
+        self.store: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[bytes] = []
+        self.lock = threading.Lock()
+
+
+class _RespHandler(socketserver.StreamRequestHandler):
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        return b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def handle(self):
+        server = self.server
+        while True:
+            args = self._read_command()
+            if args is None:
+                return
+            name = args[0].upper()
+            with server.lock:
+                server.commands.append(name)
+                now = time.time()
+                for key, (_, expires_at) in list(server.store.items()):
+                    if expires_at is not None and expires_at <= now:
+                        del server.store[key]
+                if name == b"GET":
+                    entry = server.store.get(args[1])
+                    reply = self._bulk(entry[0] if entry else None)
+                elif name == b"SET":
+                    expires_at = None
+                    if len(args) == 5 and args[3].upper() == b"PX":
+                        expires_at = now + int(args[4]) / 1000
+                    server.store[args[1]] = (args[2], expires_at)
+                    reply = b"+OK\r\n"
+                elif name == b"DEL":
+                    removed = sum(1 for key in args[1:] if server.store.pop(key, None) is not None)
+                    reply = b":%d\r\n" % removed
+                elif name == b"SCAN":
+                    pattern = args[args.index(b"MATCH") + 1].decode()
+                    keys = [k for k in server.store if fnmatch.fnmatchcase(k.decode(), pattern)]
+                    reply = b"*2\r\n" + self._bulk(b"0") + b"*%d\r\n" % len(keys)
+                    reply += b"".join(self._bulk(k) for k in keys)
+                elif name == b"SELECT":
+                    reply = b"+OK\r\n"
+                else:
+                    reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def resp_server():
+    server = _RespStandIn()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _redis_backend(server, namespace="test"):
+    host, port = server.server_address
+    return RedisCacheBackend(host=host, port=port, namespace=namespace)
+
+
+@pytest.fixture(params=["memory", "file", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InProcessCacheBackend(namespace="test")
+    if request.param == "file":
+        return SharedFileCacheBackend(tmp_path, namespace="test")
+    return _redis_backend(request.getfixturevalue("resp_server"))
+
+
+# ---- Backend contract, run against every backend ----
+
+
+def test_backend_round_trips_json_values(backend):
+    backend.set("k", ["ọmọ", "child"])
+    assert backend.get("k") == ["ọmọ", "child"]
+    assert backend.get("missing") is None
+
+
+def test_backend_delete_reports_removed_count(backend):
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.delete(["a", "b", "c"]) == 2
+    assert backend.get("a") is None
+
+
+def test_backend_clear_empties_namespace(backend):
+    backend.set("a", 1)
+    backend.clear()
+    assert backend.get("a") is None
+
+
+def test_backend_expires_entries(backend):
+    backend.set("short", 1, ttl_seconds=0.05)
+    backend.set("long", 2, ttl_seconds=60)
+    time.sleep(0.1)
+    assert backend.get("short") is None
+    assert backend.get("long") == 2
+
+
+# ---- Shared backends are visible across "workers" ----
+
+
+def test_file_backend_is_shared_between_instances(tmp_path):
+    worker_a = SharedFileCacheBackend(tmp_path, namespace="daily-word")
+    worker_b = SharedFileCacheBackend(tmp_path, namespace="daily-word")
+    worker_a.set("2026-01-01", ["ọmọ", "child"])
+    assert worker_b.get("2026-01-01") == ["ọmọ", "child"]
+
+
+def test_file_backend_namespaces_are_isolated(tmp_path):
+    SharedFileCacheBackend(tmp_path, namespace="a").set("k", 1)
+    assert SharedFileCacheBackend(tmp_path, namespace="b").get("k") is None
+
+
+def test_redis_backend_is_shared_between_instances(resp_server):
+    worker_a = _redis_backend(resp_server)
+    worker_b = _redis_backend(resp_server)
+    worker_a.set("k", {"v": 1})
+    assert worker_b.get("k") == {"v": 1}
+
+
+def test_redis_clear_only_touches_own_namespace(resp_server):
+    mine = _redis_backend(resp_server, namespace="mine")
+    other = _redis_backend(resp_server, namespace="other")
+    mine.set("k", 1)
+    other.set("k", 2)
+    mine.clear()
+    assert mine.get("k") is None
+    assert other.get("k") == 2
+
+
+def test_redis_backend_treats_unreachable_server_as_miss():
+    backend = RedisCacheBackend(host="127.0.0.1", port=1, timeout=0.1)
+    backend.set("k", 1)  # must not raise
+    assert backend.get("k") is None
+
+
+def test_redis_backend_drops_connection_when_auth_fails(resp_server):
+    host, port = resp_server.server_address
+    backend = RedisCacheBackend(host=host, port=port, password="secret", namespace="test")
+
+    backend.set("k", 1)
+    assert backend.get("k") is None
+
+    # Every command retried the handshake; none ran unauthenticated.
+    assert resp_server.commands == [b"AUTH", b"AUTH"]
+    assert backend._sock is None
+
+
+def test_translation_cache_serves_value_computed_by_another_worker(resp_server):
+    data = TranslationResponseData(
+        translation=["bawo"],
+        source_word="hello",
+        to_language=Language.YORUBA,
+        senses=[SenseGroup(label="greeting", translations=[TranslationInSenseGroup(word="bawo")])],
+    )
+    key = TranslationCache.key("hello", Language.ENGLISH, Language.YORUBA)
+    worker_a = TranslationCache(backend=_redis_backend(resp_server, namespace="translate"))
+    worker_b = TranslationCache(backend=_redis_backend(resp_server, namespace="translate"))
+
+    worker_a.put(key, data)
+
+    assert worker_b.get(key) == data
+    worker_b.invalidate_words({(Language.ENGLISH, "hello")})
+    assert worker_a.get(key) is None
+
+
+# ---- Factory ----
+
+
+def test_create_cache_backend_defaults_to_in_process(monkeypatch):
+    monkeypatch.delenv("ALARINO_CACHE_URL", raising=False)
+    assert isinstance(create_cache_backend("ns"), InProcessCacheBackend)
+
+
+def test_create_cache_backend_parses_file_url(tmp_path):
+    backend = create_cache_backend("ns", url=f"file://{tmp_path}")
+    assert isinstance(backend, SharedFileCacheBackend)
+    assert backend.directory == tmp_path / "ns"
+
+
+def test_create_cache_backend_parses_redis_url():
+    backend = create_cache_backend("ns", url="redis://:secret@cache.internal:6380/2")
+    assert isinstance(backend, RedisCacheBackend)
+    assert (backend.host, backend.port, backend.db, backend.password) == (
+        "cache.internal", 6380, 2, "secret"
+    )
+
+
+def test_create_cache_backend_rejects_unknown_scheme():
+    with pytest.raises(ValueError):
+        cache_backends.create_cache_backend("ns", url="memcached://localhost")
@@ -8,6 +8,8 @@ import pytest
 import alarino_backend.app as app_module
 import alarino_backend.translation_service as translation_service
 from alarino_backend import db
+from alarino_backend.cache_backends import InProcessCacheBackend
+from alarino_backend.daily_word_cache import DailyWordCache
 from alarino_backend.db_models import DailyWord, Translation, Word
 
 
@@ -62,7 +64,7 @@ def test_daily_word_translation_id_is_not_unique():
 
 def test_get_word_of_the_day_picks_unused_translation_when_db_empty(db_app):
     t = _seed_translation("hello", "bawo")
-    cache = {}
+    cache = DailyWordCache(InProcessCacheBackend())
 
     response, status = translation_service.get_word_of_the_day(db, cache)
 
@@ -82,7 +84,7 @@ def test_get_word_of_the_day_works_when_translation_was_curated_yo_to_en(db_app)
     # (yoruba is source_word_id, english is target_word_id) and verify the
     # response still shows the Yoruba side as yoruba_word.
     _seed_translation("hello", "bawo", en_to_yo=False)
-    cache = {}
+    cache = DailyWordCache(InProcessCacheBackend())
 
     response, status = translation_service.get_word_of_the_day(db, cache)
 
@@ -95,7 +97,7 @@ def test_get_word_of_the_day_returns_existing_daily_word_when_present(db_app):
     t = _seed_translation("hello", "bawo")
     db.session.add(DailyWord(translation_id=t.t_id, date=date.today()))
     db.session.commit()
-    cache = {}
+    cache = DailyWordCache(InProcessCacheBackend())
 
     response, status = translation_service.get_word_of_the_day(db, cache)
 
@@ -144,7 +146,7 @@ def test_get_word_of_the_day_succeeds_when_only_translation_was_already_used(db_
     t = _seed_translation("hello", "bawo")
     db.session.add(DailyWord(translation_id=t.t_id, date=date(2024, 1, 1)))
     db.session.commit()
-    cache = {}
+    cache = DailyWordCache(InProcessCacheBackend())
 
     response, status = translation_service.get_word_of_the_day(db, cache)
     assert status == 200
@@ -161,3 +163,163 @@ def test_translation_id_uniqueness_is_not_enforced_at_db_level(db_app):
     db.session.add(DailyWord(translation_id=t.t_id, date=date(2024, 1, 1)))
     db.session.add(DailyWord(translation_id=t.t_id, date=date(2024, 1, 2)))
     db.session.commit()  # must not raise IntegrityError
+
+
+def test_get_word_of_the_day_is_served_to_other_workers_from_shared_cache(db_app, tmp_path):
+    from alarino_backend.cache_backends import SharedFileCacheBackend
+
+    _seed_translation("hello", "bawo")
+    worker_a = DailyWordCache(SharedFileCacheBackend(tmp_path, namespace="daily-word"))
+    worker_b = DailyWordCache(SharedFileCacheBackend(tmp_path, namespace="daily-word"))
+
+    first, _ = translation_service.get_word_of_the_day(db, worker_a)
+    second, status = translation_service.get_word_of_the_day(db, worker_b)
+
+    assert status == 200
+    assert second["message"] == "Word of the day fetched from cache."
+    assert second["data"] == first["data"]
+
+
+# ---- Candidate pool ----
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    from alarino_backend.daily_word import DailyWordCandidatePool
+    from alarino_backend.lexicon_changes import register_listener, unregister_listener
+
+    pool = DailyWordCandidatePool()
+    monkeypatch.setattr(translation_service, "daily_word_pool", pool)
+    register_listener(pool.mark_stale)
+    yield pool
+    unregister_listener(pool.mark_stale)
+
+
+@pytest.mark.parametrize("translations", [2, 40])
+def test_pool_pick_cost_does_not_depend_on_table_size(db_app, pool, translations, count_queries):
+    for i in range(translations):
+        _seed_translation(f"word{'a' * i}", f"ile{'e' * i}")
+    translation_service.find_random_unused_translation(db)
+
+    selected, query_count = count_queries(
+        lambda: translation_service.find_random_unused_translation(db)
+    )
+
+    assert selected is not None
+    # max(t_id) freshness check + one primary-key read with both words.
+    assert query_count == 2
+    assert pool.builds == 1
+
+
+def test_pool_excludes_words_marked_used_by_get_word_of_the_day(db_app, pool):
+    _seed_translation("hello", "bawo")
+    t2 = _seed_translation("house", "ile")
+    hello = Translation.query.filter(Translation.t_id != t2.t_id).one()
+    pool.pick(db)
+    pool.mark_used(hello.t_id)
+
+    assert pool.pick(db, can_reuse=False).t_id == t2.t_id
+    assert pool.stats()["unused"] == 1
+
+
+def test_pool_picks_up_translations_added_by_another_worker(db_app, pool):
+    _seed_translation("hello", "bawo")
+    pool.pick(db)
+    # Simulate another worker: rows written without this process's commit hook.
+    from alarino_backend.lexicon_changes import unregister_listener
+
+    unregister_listener(pool.mark_stale)
+    _seed_translation("house", "ile")
+
+    pool.pick(db)
+    assert pool.builds == 2
+    assert pool.stats()["candidates"] == 2
+
+
+def test_pool_discards_translation_deleted_since_build(db_app, pool):
+    t1 = _seed_translation("hello", "bawo")
+    t2 = _seed_translation("house", "ile")
+    pool.pick(db)
+    db.session.execute(db.text("DELETE FROM translations WHERE t_id = :t_id"), {"t_id": t1.t_id})
+    db.session.commit()
+
+    picks = {pool.pick(db).t_id for _ in range(10)}
+
+    assert picks == {t2.t_id}
+    assert pool.stats()["candidates"] == 1
+
+
+def test_pool_skips_translation_used_by_another_worker(db_app, pool):
+    t1 = _seed_translation("hello", "bawo")
+    pool.pick(db)
+    db.session.add(DailyWord(translation_id=t1.t_id, date=date(2024, 1, 1)))
+    db.session.commit()
+
+    assert pool.pick(db, can_reuse=False) is None
+    assert pool.pick(db, can_reuse=True).t_id == t1.t_id
+
+
+# ---- Precomputed schedule ----
+
+
+def test_schedule_materializes_days_ahead_without_repeats(db_app):
+    from alarino_backend.daily_word import schedule_daily_words
+
+    for en, yo in [("hello", "bawo"), ("house", "ile"), ("water", "omi")]:
+        _seed_translation(en, yo)
+    start = date(2026, 1, 1)
+
+    scheduled = schedule_daily_words(db, 3, start=start)
+
+    assert scheduled == [date(2026, 1, 1), date(2026, 1, 2), date(2026, 1, 3)]
+    assert len({d.translation_id for d in DailyWord.query.all()}) == 3
+
+
+def test_schedule_skips_dates_that_already_have_a_word(db_app):
+    from alarino_backend.daily_word import schedule_daily_words
+
+    t = _seed_translation("hello", "bawo")
+    db.session.add(DailyWord(translation_id=t.t_id, date=date(2026, 1, 2)))
+    db.session.commit()
+
+    scheduled = schedule_daily_words(db, 3, start=date(2026, 1, 1))
+
+    assert scheduled == [date(2026, 1, 1), date(2026, 1, 3)]
+    assert schedule_daily_words(db, 3, start=date(2026, 1, 1)) == []
+    assert DailyWord.query.count() == 3
+
+
+def test_scheduled_daily_word_is_a_single_query_read(db_app, count_queries):
+    from alarino_backend.daily_word import schedule_daily_words
+
+    _seed_translation("hello", "bawo")
+    schedule_daily_words(db, 1)
+    db.session.expire_all()
+
+    (response, status), query_count = count_queries(
+        lambda: translation_service.get_word_of_the_day(db, DailyWordCache(InProcessCacheBackend()))
+    )
+
+    assert status == 200
+    assert response["message"] == "Word of the day fetched from database."
+    assert query_count == 1
+    assert DailyWord.query.count() == 1
+
+
+def test_fallback_serves_the_row_that_won_a_concurrent_insert(db_app, monkeypatch):
+    winner = _seed_translation("hello", "bawo")
+    loser = _seed_translation("house", "ile")
+
+    def pick_while_another_worker_inserts(db_arg, can_reuse=True):
+        # Another worker commits today's word between our read and our insert.
+        db.session.add(DailyWord(translation_id=winner.t_id, date=date.today()))
+        db.session.commit()
+        return db.session.get(Translation, loser.t_id)
+
+    monkeypatch.setattr(translation_service, "find_random_unused_translation", pick_while_another_worker_inserts)
+
+    response, status = translation_service.get_word_of_the_day(db, DailyWordCache(InProcessCacheBackend()))
+
+    assert status == 200
+    assert response["data"] == {"yoruba_word": "bawo", "english_word": "hello"}
+    assert DailyWord.query.one().translation_id == winner.t_id
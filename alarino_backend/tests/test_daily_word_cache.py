@@ -0,0 +1,60 @@
+"""Tests for the date-bounded daily word cache and its HTTP validators."""
+
+from datetime import date, datetime
+
+from alarino_backend.cache_backends import InProcessCacheBackend
+from alarino_backend.daily_word_cache import DailyWordCache, DailyWordEntry, seconds_until_midnight
+
+ENTRY = DailyWordEntry("bawo", "hello", 7)
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def test_round_trips_entry_for_today():
+    cache = DailyWordCache(InProcessCacheBackend(), now=_Clock(datetime(2026, 3, 1, 9, 0)))
+    cache.set(date(2026, 3, 1), ENTRY)
+    assert cache.get(date(2026, 3, 1)) == ENTRY
+
+
+def test_only_today_and_tomorrow_are_cached():
+    backend = InProcessCacheBackend()
+    cache = DailyWordCache(backend, now=_Clock(datetime(2026, 3, 1, 9, 0)))
+
+    cache.set(date(2026, 2, 28), ENTRY)
+    cache.set(date(2026, 3, 2), ENTRY)
+    cache.set(date(2026, 3, 3), ENTRY)
+
+    assert backend.stats()["size"] == 1
+    assert cache.get(date(2026, 3, 2)) == ENTRY
+
+
+def test_entry_expires_at_end_of_its_day():
+    clock = _Clock(datetime(2026, 3, 1, 23, 59, 0))
+    backend = InProcessCacheBackend(clock=lambda: clock.now.timestamp())
+    cache = DailyWordCache(backend, now=clock)
+    cache.set(date(2026, 3, 1), ENTRY)
+
+    clock.now = datetime(2026, 3, 1, 23, 59, 59)
+    assert backend.get("2026-03-01") is not None
+    clock.now = datetime(2026, 3, 2, 0, 0, 1)
+    assert backend.get("2026-03-01") is None
+    # Yesterday is outside the window regardless of what the backend holds.
+    assert cache.get(date(2026, 3, 1)) is None
+
+
+def test_max_age_counts_down_to_local_midnight():
+    cache = DailyWordCache(InProcessCacheBackend(), now=_Clock(datetime(2026, 3, 1, 23, 0, 0)))
+    assert cache.max_age() == 3600
+    assert seconds_until_midnight(datetime(2026, 3, 1, 23, 59, 59, 500000)) == 1
+
+
+def test_etag_changes_with_date_and_translation():
+    day = date(2026, 3, 1)
+    assert DailyWordCache.etag(day, ENTRY) != DailyWordCache.etag(date(2026, 3, 2), ENTRY)
+    assert DailyWordCache.etag(day, ENTRY) != DailyWordCache.etag(day, ENTRY._replace(translation_id=8))
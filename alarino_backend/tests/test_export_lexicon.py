@@ -0,0 +1,131 @@
+"""Tests for the memory-mapped lexicon artifact."""
+
+import struct
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.export_lexicon import (
+    FORMAT_VERSION,
+    MAGIC,
+    export_lexicon,
+    load_snapshot,
+    write_snapshot,
+)
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_snapshot import LexiconSnapshotManager, build_snapshot
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _seed():
+    hello = add_word(Language.ENGLISH, "hello")
+    bawo = add_word(Language.YORUBA, "bawo")
+    child = add_word(Language.ENGLISH, "child")
+    omo = add_word(Language.YORUBA, "ọmọ")
+    egbon = add_word(Language.YORUBA, "ẹgbọn")
+    db.session.flush()
+    create_translation(hello, bawo)
+    create_translation(child, omo)
+    create_translation(egbon, child)
+    db.session.commit()
+
+
+def _translate(text, source, target):
+    return translation_service.translate(db, text, source, target, "pytest-agent")
+
+
+def test_artifact_round_trips_snapshot(db_app, tmp_path):
+    _seed()
+    built = build_snapshot(db)
+    path = tmp_path / "lexicon.bin"
+    write_snapshot(built, path)
+
+    loaded = load_snapshot(path)
+
+    assert loaded.fingerprint == built.fingerprint
+    assert loaded.word_count == built.word_count
+    assert loaded.edge_count == built.edge_count
+    assert list(loaded.strings) == list(built.strings)
+    for text, source, target in [
+        ("child", Language.ENGLISH, Language.YORUBA),
+        ("ọmọ", Language.YORUBA, Language.ENGLISH),
+        ("missing", Language.ENGLISH, Language.YORUBA),
+    ]:
+        assert loaded.lookup(text, source, target) == built.lookup(text, source, target)
+
+
+def test_translate_from_artifact_matches_sql(db_app, tmp_path, monkeypatch):
+    _seed()
+    monkeypatch.setattr(
+        translation_service, "lexicon_snapshot", LexiconSnapshotManager(enabled=False)
+    )
+    expected = _translate("child", Language.ENGLISH, Language.YORUBA)
+
+    path = tmp_path / "lexicon.bin"
+    export_lexicon(path)
+    manager = LexiconSnapshotManager(enabled=True)
+    assert manager.load_artifact(str(path)) is True
+    monkeypatch.setattr(translation_service, "lexicon_snapshot", manager)
+    translation_service.translation_cache.clear()
+
+    assert _translate("child", Language.ENGLISH, Language.YORUBA) == expected
+    assert manager.builds == 0
+
+
+def test_stale_artifact_is_rebuilt_from_sql(db_app, tmp_path):
+    _seed()
+    path = tmp_path / "lexicon.bin"
+    export_lexicon(path)
+    add_word(Language.ENGLISH, "lonely")
+    db.session.commit()
+
+    manager = LexiconSnapshotManager(enabled=True)
+    manager.load_artifact(str(path))
+
+    assert manager.refresh(db) is True
+    assert manager.builds == 1
+
+
+def test_load_rejects_foreign_file(tmp_path):
+    path = tmp_path / "lexicon.bin"
+    path.write_bytes(b"not a lexicon" * 10)
+    with pytest.raises(ValueError):
+        load_snapshot(path)
+
+
+def test_load_rejects_other_format_version(db_app, tmp_path):
+    path = tmp_path / "lexicon.bin"
+    export_lexicon(path)
+    raw = bytearray(path.read_bytes())
+    struct.pack_into("<I", raw, len(MAGIC), FORMAT_VERSION + 1)
+    path.write_bytes(bytes(raw))
+    with pytest.raises(ValueError):
+        load_snapshot(path)
+
+
+def test_manager_falls_back_to_sql_build_when_artifact_is_missing(db_app, tmp_path):
+    _seed()
+    manager = LexiconSnapshotManager(
+        enabled=True, check_seconds=60, artifact_path=str(tmp_path / "absent.bin")
+    )
+    try:
+        manager.start(db_app)
+        assert manager.builds == 1
+        assert manager.current() is not None
+    finally:
+        manager.stop()
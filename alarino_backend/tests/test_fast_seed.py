@@ -0,0 +1,120 @@
+"""Tests for the set-based seed loader (data/fast_seed.py)."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.fast_seed import load_translation_pairs
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.data.word_translations_loader import prepare_entries
+from alarino_backend.db_models import REVIEW_APPROVED, Sense, Translation, Word
+from alarino_backend.languages import Language
+from alarino_backend.normalization import fold_diacritics
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _lexicon():
+    return sorted(
+        (t.source_word.text, t.target_word.text, t.source_sense_id is not None, t.review_status)
+        for t in Translation.query.all()
+    )
+
+
+def test_prepare_entries_normalizes_and_dedupes():
+    prepared = prepare_entries([
+        {"english_word": "Abandon ", "parts_of_speech": ["v"], "yoruba_translations": "fi sílẹ̀, kọ̀ sílẹ̀ (kọ̀)"},
+        {"english_word": "abandon", "parts_of_speech": ["n"], "yoruba_translations": "fi sílẹ̀"},
+        {"english_word": "about", "parts_of_speech": [], "yoruba_translations": "ní pasê"},
+        {"english_word": "x1", "parts_of_speech": [], "yoruba_translations": "ilé"},
+        {"english_word": "", "yoruba_translations": "ilé"},
+    ])
+
+    assert prepared.pairs == {("abandon", "fi sílẹ̀"), ("abandon", "kọ̀ sílẹ̀")}
+    assert [entry["reason"] for entry in prepared.invalid_entries] == ["Invalid Yoruba word", "Invalid English word"]
+
+
+def test_matches_per_entry_path(db_app):
+    pairs = {("house", "ilé"), ("home", "ilé"), ("car", "ọkọ̀")}
+    for english, yoruba in sorted(pairs):
+        create_translation(add_word(Language.ENGLISH, english), add_word(Language.YORUBA, yoruba))
+    db.session.commit()
+    expected = _lexicon()
+    db.drop_all()
+    db.create_all()
+
+    result = load_translation_pairs(db, pairs)
+    db.session.commit()
+
+    assert _lexicon() == expected
+    assert (result.words_created, result.senses_created, result.translations_created) == (5, 5, 3)
+    assert {t.review_status for t in Translation.query} == {REVIEW_APPROVED}
+    assert all(word.folded_text == fold_diacritics(word.text) for word in Word.query)
+
+
+def test_rerun_and_existing_rows_are_reused(db_app):
+    create_translation(add_word(Language.ENGLISH, "house"), add_word(Language.YORUBA, "ilé"))
+    db.session.commit()
+
+    result = load_translation_pairs(db, [("house", "ilé"), ("house", "ibùgbé")])
+    db.session.commit()
+    assert (result.words_created, result.senses_created, result.translations_created) == (1, 1, 1)
+
+    result = load_translation_pairs(db, [("house", "ilé"), ("house", "ibùgbé")])
+    db.session.commit()
+    assert (result.words_created, result.senses_created, result.translations_created) == (0, 0, 0)
+    assert Sense.query.count() == 3
+    assert Translation.query.count() == 2
+
+
+def test_commit_refreshes_cached_translations(db_app):
+    create_translation(add_word(Language.ENGLISH, "house"), add_word(Language.YORUBA, "ilé"))
+    db.session.commit()
+
+    def translate():
+        return translation_service.translate(db, "house", Language.ENGLISH, Language.YORUBA, "pytest")
+
+    assert translate()[0]["data"]["translation"] == ["ilé"]
+
+    load_translation_pairs(db, [("house", "ibùgbé")])
+    db.session.commit()
+
+    assert sorted(translate()[0]["data"]["translation"]) == sorted(["ilé", "ibùgbé"])
+
+
+def test_reports_words_with_several_senses(db_app):
+    bank = add_word(Language.ENGLISH, "bank")
+    db.session.flush()
+    db.session.add_all([Sense(word_id=bank.w_id, sense_label="river"), Sense(word_id=bank.w_id, sense_label="money")])
+    db.session.commit()
+
+    result = load_translation_pairs(db, [("bank", "bèbè"), ("hello", "bawo")])
+    db.session.commit()
+
+    assert result.ambiguous_pairs == [("bank", "bèbè")]
+    assert result.translations_created == 1
+
+
+def test_statement_count_is_independent_of_size(db_app, count_queries):
+    letters = "abdefgijkl"
+    pairs = [(f"w{letters[i // 10]}{letters[i % 10]}", f"b{letters[i // 10]}{letters[i % 10]}") for i in range(100)]
+
+    result, statements = count_queries(lambda: load_translation_pairs(db, pairs))
+
+    assert result.translations_created == 100
+    assert result.rows_per_second > 0
+    # Drop/create both staging tables, two stage fills, four merges or
+    # selects, two drops, plus SQLite's table checks.
+    assert statements <= 16
@@ -0,0 +1,110 @@
+"""Tests for diacritic-insensitive Word lookup (words.folded_text)."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.backfill_folded_words import backfill
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import MissingTranslation, Word
+from alarino_backend.languages import Language
+from alarino_backend.normalization import fold_diacritics
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _translate(yoruba: str, *english: str) -> None:
+    yo = add_word(Language.YORUBA, yoruba)
+    for text in english:
+        en = add_word(Language.ENGLISH, text)
+        db.session.flush()
+        create_translation(yo, en)
+
+
+def _translate_yo(text: str):
+    return translation_service.translate(db, text, Language.YORUBA, Language.ENGLISH, "pytest")
+
+
+def test_fold_diacritics_strips_tones_and_under_dots():
+    assert fold_diacritics("Ọ̀kọ̀") == "oko"
+    assert fold_diacritics("ṣé") == "se"
+    assert fold_diacritics("house") == "house"
+
+
+def test_folded_text_is_maintained_on_every_write_path(db_app):
+    word = add_word(Language.YORUBA, "ọmọ")
+    db.session.execute(Word.__table__.insert().values(language="yo", text="ẹ̀kọ́"))
+    db.session.flush()
+    assert word.folded_text == "omo"
+    assert Word.query.filter_by(text="ẹ̀kọ́").one().folded_text == "eko"
+
+    word.text = "ọmọdé"
+    db.session.flush()
+    assert word.folded_text == "omode"
+
+
+def test_backfill_refolds_raw_sql_inserts(db_app):
+    db.session.execute(db.text("INSERT INTO words (language, text) VALUES ('yo', 'ọmọ')"))
+    db.session.commit()
+    assert Word.query.one().folded_text == ""
+
+    assert backfill() == 1
+    assert Word.query.one().folded_text == "omo"
+    assert backfill() == 0
+
+
+def test_miss_returns_ranked_diacritized_candidates_without_a_write(db_app, count_queries):
+    _translate("ọkọ", "husband", "spouse")
+    _translate("ọkọ̀", "vehicle")
+    add_word(Language.YORUBA, "òkò")  # no English translation: not offered
+    db.session.commit()
+
+    (response, status), queries = count_queries(lambda: _translate_yo("oko"))
+
+    assert status == 404
+    assert response["message"] == "Word not found."
+    assert response["data"] == {
+        "source_word": "oko",
+        "to_language": "en",
+        "candidates": [
+            {"text": "ọkọ", "translation_count": 2},
+            {"text": "ọkọ̀", "translation_count": 1},
+        ],
+        "suggestions": [],
+    }
+    # Exact lookup plus one folded read; no missing_translations upsert.
+    assert queries == 2
+    assert MissingTranslation.query.count() == 0
+
+
+def test_wrong_diacritics_also_find_the_real_form(db_app):
+    _translate("ọmọ", "child")
+    db.session.commit()
+
+    response, status = _translate_yo("ómọ")
+
+    assert status == 404
+    assert [c["text"] for c in response["data"]["candidates"]] == ["ọmọ"]
+
+
+def test_miss_without_candidates_is_still_recorded(db_app):
+    _translate("ọmọ", "child")
+    db.session.commit()
+
+    response, status = _translate_yo("baba")
+
+    assert status == 404
+    assert response["data"] is None  # nothing within edit distance either
+    assert MissingTranslation.query.one().text == "baba"
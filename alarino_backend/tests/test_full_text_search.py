@@ -0,0 +1,181 @@
+"""Tests for full-text search over proverbs and examples (SQLite FTS5)."""
+
+import unicodedata
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_proverb, add_word, create_translation
+from alarino_backend.db_models import Example, Proverb, ProverbWord, Translation
+from alarino_backend.full_text_search import (
+    Clause,
+    make_snippet,
+    parse_search_query,
+    rebuild_search_index,
+    search,
+)
+from alarino_backend.languages import Language
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _seed():
+    add_proverb("Ọ̀rọ̀ púpọ̀ kì í kún agbọ̀n", "Many words do not fill a basket")
+    add_proverb("Ilé ọba tó jó, ẹwà ló bù kún un", "The king's palace that burned gained beauty")
+    add_proverb("Oro ni oro", "Wealth is wealth")
+    db.session.commit()
+
+
+def _seed_example():
+    hello = add_word(Language.ENGLISH, "hello")
+    bawo = add_word(Language.YORUBA, "bawo")
+    db.session.flush()
+    create_translation(hello, bawo)
+    db.session.flush()
+    t = Translation.query.one()
+    db.session.add(
+        Example(
+            source_sense_id=t.source_sense_id, target_sense_id=t.target_sense_id,
+            example_source="Hello, how is the house?", example_target="Báwo ni ilé?",
+        )
+    )
+    db.session.commit()
+
+
+def _texts(hits):
+    return sorted(hit["text"] for hit in hits)
+
+
+def _search(q, language=None, doc_type=None, page=1, per_page=20):
+    return translation_service.search_text(db, q, language, doc_type, page, per_page)
+
+
+def test_parse_search_query_routes_words_by_diacritics():
+    clauses = parse_search_query('ọ̀rọ̀ Oro "ilé oba" "kún agbọ̀n"')
+
+    assert clauses == [
+        Clause("folded", ("ile", "oba")),
+        Clause("body", ("ilé",)),
+        Clause("body", ("kún", "agbọ̀n")),
+        Clause("body", ("ọ̀rọ̀",)),
+        Clause("folded", ("oro",)),
+    ]
+
+
+def test_unaccented_query_matches_every_diacritic_variant(db_app):
+    _seed()
+
+    response, status = _search("oro", language=Language.YORUBA)
+    assert status == 200
+    assert _texts(response["data"]["results"]) == ["Oro ni oro", "Ọ̀rọ̀ púpọ̀ kì í kún agbọ̀n"]
+
+
+def test_accented_query_matches_exactly(db_app):
+    _seed()
+
+    response, _ = _search("ọ̀rọ̀")
+    assert _texts(response["data"]["results"]) == ["Ọ̀rọ̀ púpọ̀ kì í kún agbọ̀n"]
+
+    # Decomposed input is the same query.
+    response, _ = _search(unicodedata.normalize("NFD", "Ọ̀RỌ̀"))
+    assert response["data"]["total"] == 1
+
+
+def test_terms_are_anded_and_phrases_ordered(db_app):
+    _seed()
+
+    assert _search("words basket")[0]["data"]["total"] == 1
+    assert _search("words palace")[0]["data"]["total"] == 0
+    assert _search('"fill a basket"')[0]["data"]["total"] == 1
+    assert _search('"basket a fill"')[0]["data"]["total"] == 0
+
+
+def test_results_are_ranked_and_carry_snippets(db_app):
+    _seed()
+
+    results = _search("oro")[0]["data"]["results"]
+    # Two occurrences in a three-word proverb outrank one in a longer one.
+    assert results[0]["text"] == "Oro ni oro"
+    assert results[0]["score"] > results[1]["score"]
+    assert results[0]["translation"] == "Wealth is wealth"
+    assert results[0]["snippet"] == "<mark>Oro</mark> ni <mark>oro</mark>"
+    assert results[1]["snippet"].startswith("<mark>Ọ̀rọ̀</mark> púpọ̀")
+
+
+def test_examples_are_searchable_after_rebuild(db_app):
+    _seed()
+    _seed_example()
+    assert _search("bawo")[0]["data"]["total"] == 0
+
+    assert rebuild_search_index(db) == 8
+
+    response, _ = _search("bawo ile", language=Language.YORUBA)
+    [result] = response["data"]["results"]
+    assert result["type"] == "example"
+    assert result["language"] == "yo"
+    assert result["text"] == "Báwo ni ilé?"
+    assert result["translation"] == "Hello, how is the house?"
+    assert result["snippet"] == "<mark>Báwo</mark> ni <mark>ilé</mark>?"
+
+    assert _search("house", doc_type="proverb")[0]["data"]["total"] == 0
+    assert _search("house", doc_type="example")[0]["data"]["total"] == 1
+
+
+def test_pagination_and_deleted_rows(db_app):
+    for i in range(5):
+        add_proverb(f"Owe {i}", f"Proverb number {i}")
+    db.session.commit()
+
+    _, total, first = search(db, "proverb", limit=2, offset=0)
+    _, _, rest = search(db, "proverb", limit=10, offset=2)
+    assert total == 5
+    assert len(first) == 2
+    assert len({hit.doc_id for hit in first + rest}) == 5
+
+    ProverbWord.query.filter_by(proverb_id=first[0].doc_id).delete()
+    Proverb.query.filter_by(p_id=first[0].doc_id).delete()
+    db.session.commit()
+    response, _ = _search("proverb", per_page=2)
+    assert len(response["data"]["results"]) == 1
+
+
+def test_make_snippet_windows_long_text():
+    text = " ".join(f"w{i}" for i in range(30)) + " target <b> end"
+    snippet = make_snippet(text, [Clause("folded", ("target",))], max_tokens=6)
+
+    assert snippet.startswith("…")
+    assert "<mark>target</mark> &lt;b&gt;" in snippet
+    assert not snippet.endswith("…")
+
+
+def test_invalid_requests_are_rejected(db_app):
+    assert _search("")[1] == 400
+    assert _search("?!")[1] == 400
+    assert _search("oro", doc_type="word")[1] == 400
+    assert _search("oro", page=0)[1] == 400
+
+
+def test_search_route(db_app):
+    _seed()
+    client = db_app.test_client()
+
+    response = client.get("/api/search", query_string={"q": "basket", "lang": "en"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["data"]["total"] == 1
+    assert body["data"]["results"][0]["translation"] == "Ọ̀rọ̀ púpọ̀ kì í kún agbọ̀n"
+
+    assert client.get("/api/search", query_string={"q": "basket", "lang": "fr"}).status_code == 400
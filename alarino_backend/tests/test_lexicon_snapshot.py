@@ -0,0 +1,211 @@
+"""Tests for the in-memory lexicon snapshot that serves translate() without
+the database."""
+
+import time
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import Example, Sense, Translation, Word
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener, unregister_listener
+from alarino_backend.lexicon_snapshot import LexiconSnapshotManager, build_snapshot
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+@pytest.fixture
+def snapshot_manager(monkeypatch):
+    manager = LexiconSnapshotManager(enabled=True, check_seconds=60)
+    monkeypatch.setattr(translation_service, "lexicon_snapshot", manager)
+    register_listener(manager.mark_stale)
+    yield manager
+    unregister_listener(manager.mark_stale)
+    manager.stop()
+
+
+def _seed_lexicon():
+    # Plain pair curated en→yo, with an example on the forward sense pair.
+    hello = add_word(Language.ENGLISH, "hello")
+    bawo = add_word(Language.YORUBA, "bawo")
+    # Synonyms: one curated en→yo, one curated yo→en.
+    child = add_word(Language.ENGLISH, "child")
+    omo = add_word(Language.YORUBA, "ọmọ")
+    egbon = add_word(Language.YORUBA, "ẹgbọn")
+    add_word(Language.ENGLISH, "lonely")
+    db.session.flush()
+    create_translation(hello, bawo)
+    create_translation(child, omo)
+    create_translation(egbon, child)
+    # Both directions curated: must be deduped.
+    create_translation(omo, child)
+    db.session.flush()
+
+    t = Translation.query.filter_by(source_word_id=hello.w_id).one()
+    db.session.add_all([
+        Example(
+            source_sense_id=t.source_sense_id, target_sense_id=t.target_sense_id,
+            example_source="Hello there", example_target="Bawo nibe",
+        ),
+        Example(
+            source_sense_id=t.target_sense_id, target_sense_id=t.source_sense_id,
+            example_source="Bawo ni", example_target="How are you",
+        ),
+    ])
+
+    # Polysemy with curated sense metadata and translation notes.
+    bank = add_word(Language.ENGLISH, "bank")
+    ifowopamo = add_word(Language.YORUBA, "ifowopamo")
+    bebe = add_word(Language.YORUBA, "bebe")
+    db.session.flush()
+    financial = Sense(word_id=bank.w_id, sense_label="financial", definition="A financial institution", part_of_speech="n")
+    river = Sense(word_id=bank.w_id, sense_label="river", register="formal", domain="geography")
+    ifo_sense = Sense(word_id=ifowopamo.w_id)
+    bebe_sense = Sense(word_id=bebe.w_id)
+    db.session.add_all([financial, river, ifo_sense, bebe_sense])
+    db.session.flush()
+    db.session.add_all([
+        Translation(
+            source_word_id=bank.w_id, target_word_id=ifowopamo.w_id,
+            source_sense_id=financial.sense_id, target_sense_id=ifo_sense.sense_id,
+            note="financial sense", provenance="curated",
+        ),
+        Translation(
+            source_word_id=bebe.w_id, target_word_id=bank.w_id,
+            source_sense_id=bebe_sense.sense_id, target_sense_id=river.sense_id,
+            note="river sense",
+        ),
+    ])
+    db.session.commit()
+
+
+LOOKUPS = [
+    ("hello", Language.ENGLISH, Language.YORUBA),
+    ("bawo", Language.YORUBA, Language.ENGLISH),
+    ("child", Language.ENGLISH, Language.YORUBA),
+    ("ọmọ", Language.YORUBA, Language.ENGLISH),
+    ("ẹgbọn", Language.YORUBA, Language.ENGLISH),
+    ("bank", Language.ENGLISH, Language.YORUBA),
+    ("bebe", Language.YORUBA, Language.ENGLISH),
+    ("lonely", Language.ENGLISH, Language.YORUBA),
+    ("missing", Language.ENGLISH, Language.YORUBA),
+    ("hello", Language.ENGLISH, Language.ENGLISH),
+]
+
+
+def _translate(text, source, target):
+    return translation_service.translate(db, text, source, target, "pytest-agent")
+
+
+@pytest.mark.parametrize("text, source, target", LOOKUPS)
+def test_snapshot_answers_match_sql_answers(db_app, monkeypatch, text, source, target):
+    _seed_lexicon()
+    monkeypatch.setattr(
+        translation_service, "lexicon_snapshot", LexiconSnapshotManager(enabled=False)
+    )
+    expected = _translate(text, source, target)
+
+    manager = LexiconSnapshotManager(enabled=True)
+    manager.refresh(db, force=True)
+    monkeypatch.setattr(translation_service, "lexicon_snapshot", manager)
+    translation_service.translation_cache.clear()
+
+    assert _translate(text, source, target) == expected
+
+
+def test_snapshot_translate_issues_no_queries(db_app, snapshot_manager, count_queries):
+    _seed_lexicon()
+    snapshot_manager.refresh(db, force=True)
+
+    (response, status), query_count = count_queries(
+        lambda: _translate("bank", Language.ENGLISH, Language.YORUBA)
+    )
+
+    assert status == 200
+    assert sorted(response["data"]["translation"]) == ["bebe", "ifowopamo"]
+    assert query_count == 0
+
+
+def test_local_commit_marks_snapshot_stale_and_falls_back_to_sql(db_app, snapshot_manager):
+    _seed_lexicon()
+    snapshot_manager.refresh(db, force=True)
+    assert snapshot_manager.current() is not None
+
+    hello = Word.query.filter_by(language="en", text="hello").one()
+    pele = add_word(Language.YORUBA, "pele")
+    db.session.flush()
+    create_translation(hello, pele)
+    db.session.commit()
+
+    assert snapshot_manager.current() is None
+    response, status = _translate("hello", Language.ENGLISH, Language.YORUBA)
+    assert sorted(response["data"]["translation"]) == ["bawo", "pele"]
+
+    assert snapshot_manager.refresh(db) is True
+    assert snapshot_manager.current() is not None
+
+
+def test_refresh_is_a_no_op_when_fingerprint_is_unchanged(db_app, snapshot_manager):
+    _seed_lexicon()
+    snapshot_manager.refresh(db, force=True)
+    assert snapshot_manager.refresh(db) is False
+    assert snapshot_manager.builds == 1
+
+
+def test_disabled_manager_never_serves_a_snapshot(db_app):
+    _seed_lexicon()
+    manager = LexiconSnapshotManager(enabled=False)
+    manager.refresh(db, force=True)
+    assert manager.current() is None
+
+
+def test_background_thread_rebuilds_on_version_bump(db_app, snapshot_manager):
+    _seed_lexicon()
+    snapshot_manager.check_seconds = 0.01
+    snapshot_manager.start(db_app)
+    assert snapshot_manager.builds == 1
+
+    # A write from "another worker": raw insert, no local commit hook.
+    db.session.execute(db.text("INSERT INTO words (language, text) VALUES ('en', 'other')"))
+    db.session.commit()
+
+    deadline = time.time() + 5
+    while snapshot_manager.builds < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert snapshot_manager.builds == 2
+    assert snapshot_manager.current().find_word(Language.ENGLISH, "other") is not None
+
+
+def test_snapshot_word_lookup_is_exact(db_app):
+    _seed_lexicon()
+    snapshot = build_snapshot(db)
+    assert snapshot.find_word(Language.YORUBA, "ọmọ") is not None
+    assert snapshot.find_word(Language.ENGLISH, "ọmọ") is None
+    assert snapshot.find_word(Language.ENGLISH, "hell") is None
+    assert snapshot.find_word(Language.ENGLISH, "zzz") is None
+
+
+def test_snapshot_words_carry_their_database_ids(db_app):
+    _seed_lexicon()
+    snapshot = build_snapshot(db)
+
+    _, edges, _ = snapshot.lookup("child", Language.ENGLISH, Language.YORUBA)
+
+    expected = {w.text: w.w_id for w in Word.query.filter_by(language=Language.YORUBA.value)}
+    assert {other.text: other.w_id for _, other, _, _ in edges} == {
+        text: expected[text] for text in ("ọmọ", "ẹgbọn")
+    }
@@ -0,0 +1,175 @@
+"""Tests for the /api/translate/llm result cache and single-flight."""
+
+import threading
+import time
+
+import pytest
+
+import alarino_backend.translation_service as translation_service
+from alarino_backend.cache_backends import InProcessCacheBackend
+from alarino_backend.languages import Language
+from alarino_backend.llm_cache import LLMTranslationCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class StubLLMService:
+    model = "stub-model"
+    prompt_version = "1"
+
+    def __init__(self, answer=("bawo",)):
+        self.answer = answer
+        self.calls = []
+
+    def get_translation(self, text, source_lang, target_lang):
+        self.calls.append((text, source_lang, target_lang))
+        if isinstance(self.answer, Exception):
+            raise self.answer
+        return list(self.answer) if self.answer is not None else None
+
+
+def _cache(clock=None, **kwargs):
+    backend = InProcessCacheBackend(namespace="llm", clock=clock or _Clock())
+    return LLMTranslationCache(backend=backend, **kwargs)
+
+
+def test_repeated_lookup_is_served_from_cache():
+    cache = _cache()
+    service = StubLLMService()
+
+    assert cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA) == ["bawo"]
+    assert cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA) == ["bawo"]
+
+    assert service.calls == [("hello", "en", "yo")]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["upstream_calls"] == 1
+
+
+def test_key_includes_direction_model_and_prompt_version():
+    cache = _cache()
+    service = StubLLMService()
+
+    cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA)
+    cache.translate(service, "hello", Language.YORUBA, Language.ENGLISH)
+    service.model = "other-model"
+    cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA)
+    service.prompt_version = "2"
+    cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA)
+
+    assert len(service.calls) == 4
+
+
+def test_empty_answer_is_cached_for_the_negative_ttl():
+    clock = _Clock()
+    cache = _cache(clock, ttl_seconds=1000, negative_ttl_seconds=10)
+    service = StubLLMService(answer=())
+
+    assert cache.translate(service, "xyz", Language.ENGLISH, Language.YORUBA) == []
+    assert cache.translate(service, "xyz", Language.ENGLISH, Language.YORUBA) == []
+    assert len(service.calls) == 1
+    assert cache.stats()["negative_hits"] == 1
+
+    clock.now += 11
+    cache.translate(service, "xyz", Language.ENGLISH, Language.YORUBA)
+    assert len(service.calls) == 2
+
+
+def test_failures_are_not_cached():
+    cache = _cache()
+    service = StubLLMService(answer=None)
+
+    assert cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA) is None
+    service.answer = RuntimeError("provider down")
+    with pytest.raises(RuntimeError):
+        cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA)
+    service.answer = ("bawo",)
+    assert cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA) == ["bawo"]
+
+    assert len(service.calls) == 3
+
+
+def _run_concurrently(cache, service, n):
+    results = [None] * n
+
+    def worker(i):
+        try:
+            results[i] = cache.translate(service, "hello", Language.ENGLISH, Language.YORUBA)
+        except Exception as e:
+            results[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class _BlockingService(StubLLMService):
+    """Holds the upstream call open until released, so every request
+    arrives while it is in flight."""
+
+    def __init__(self, answer=("bawo",)):
+        super().__init__(answer)
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def get_translation(self, text, source_lang, target_lang):
+        self.started.set()
+        self.release.wait(5)
+        return super().get_translation(text, source_lang, target_lang)
+
+
+def _wait_for_waiters(cache, n):
+    for _ in range(500):
+        if cache.stats()["coalesced"] == n:
+            return
+        time.sleep(0.01)
+
+
+def test_concurrent_identical_requests_share_one_call():
+    cache = _cache()
+    service = _BlockingService()
+
+    threads, results = _run_concurrently(cache, service, 8)
+    assert service.started.wait(5)
+    _wait_for_waiters(cache, 7)
+    service.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert results == [["bawo"]] * 8
+    assert len(service.calls) == 1
+    assert cache.stats()["coalesced"] == 7
+    assert cache.stats()["in_flight"] == 0
+
+
+def test_waiters_see_the_leaders_exception():
+    cache = _cache()
+    service = _BlockingService(answer=RuntimeError("provider down"))
+
+    threads, results = _run_concurrently(cache, service, 4)
+    assert service.started.wait(5)
+    _wait_for_waiters(cache, 3)
+    service.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(service.calls) == 1
+
+
+def test_translate_llm_uses_the_cache(monkeypatch):
+    service = StubLLMService()
+    monkeypatch.setattr(translation_service, "get_llm_service", lambda: service)
+
+    first, _ = translation_service.translate_llm(" Hello ", Language.ENGLISH, Language.YORUBA)
+    second, status = translation_service.translate_llm("hello", Language.ENGLISH, Language.YORUBA)
+
+    assert status == 200
+    assert second == first
+    assert service.calls == [("hello", "en", "yo")]
@@ -0,0 +1,172 @@
+"""Tests for storing LLM answers as pending translations and reviewing them."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.daily_word import daily_word_pool
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import REVIEW_APPROVED, REVIEW_PENDING, Sense, Translation, Word
+from alarino_backend.languages import Language
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+class StubLLMService:
+    model = "stub-model"
+    prompt_version = "1"
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.calls = 0
+
+    def get_translation(self, text, source_lang, target_lang):
+        self.calls += 1
+        return list(self.answer)
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    service = StubLLMService(["ilé", "ibùgbé"])
+    monkeypatch.setattr(translation_service, "get_llm_service", lambda: service)
+    return service
+
+
+def _pending():
+    return Translation.query.filter_by(review_status=REVIEW_PENDING).order_by(Translation.t_id).all()
+
+
+def test_llm_answer_is_stored_as_pending_translations(db_app, llm):
+    response, status = translation_service.translate_llm("House", Language.ENGLISH, Language.YORUBA)
+
+    assert status == 200
+    rows = _pending()
+    assert [(row.source_word.text, row.target_word.text) for row in rows] == [("house", "ilé"), ("house", "ibùgbé")]
+    assert {row.provenance for row in rows} == {"llm:stub-model"}
+    assert [row.confidence for row in rows] == [0.5, 0.25]
+
+
+def test_translate_serves_pending_translation_without_the_llm(db_app, llm):
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    response, status = translation_service.translate(db, "house", Language.ENGLISH, Language.YORUBA, "pytest")
+
+    assert status == 200
+    assert response["data"]["translation"] == ["ilé", "ibùgbé"]
+    provenance = {t["provenance"] for group in response["data"]["senses"] for t in group["translations"]}
+    assert provenance == {"llm:stub-model"}
+
+
+def test_cached_answer_is_not_stored_again(db_app, llm):
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+    translation_service.review_llm_translations(db, [row.t_id for row in _pending()], "reject")
+
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    assert llm.calls == 1
+    assert _pending() == []
+
+
+def test_existing_curated_translation_is_left_alone(db_app, llm):
+    en = add_word(Language.ENGLISH, "house")
+    yo = add_word(Language.YORUBA, "ilé")
+    db.session.flush()
+    create_translation(en, yo)
+    db.session.commit()
+
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    curated = Translation.query.filter_by(review_status=REVIEW_APPROVED).one()
+    assert curated.provenance is None
+    assert [row.target_word.text for row in _pending()] == ["ibùgbé"]
+
+
+def test_pending_translations_stay_out_of_sitemap_and_daily_word(db_app, llm):
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    response, _ = translation_service.get_sitemap_words(db)
+    assert response["data"]["words"] == []
+    daily_word_pool.mark_stale()
+    assert daily_word_pool.pick(db) is None
+
+
+def test_promote_and_reject_in_bulk(db_app, llm):
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+    first, second = [row.t_id for row in _pending()]
+
+    response, status = translation_service.review_llm_translations(db, [first, 999], "promote")
+    assert status == 200
+    assert response["data"]["ids"] == [first]
+    assert db.session.get(Translation, first).review_status == REVIEW_APPROVED
+
+    response, _ = translation_service.review_llm_translations(db, [first, second], "reject")
+    # The promoted row is curated now and can't be rejected here.
+    assert response["data"]["ids"] == [second]
+    assert db.session.get(Translation, second) is None
+
+    response, _ = translation_service.translate(db, "house", Language.ENGLISH, Language.YORUBA, "pytest")
+    assert response["data"]["translation"] == ["ilé"]
+
+
+def test_review_rejects_bad_input(db_app):
+    _, status = translation_service.review_llm_translations(db, [1], "delete")
+    assert status == 400
+    _, status = translation_service.review_llm_translations(db, "1,2", "promote")
+    assert status == 400
+    _, status = translation_service.review_llm_translations(db, [True], "promote")
+    assert status == 400
+
+
+def test_reject_deletes_words_nothing_else_uses(db_app, llm):
+    en = add_word(Language.ENGLISH, "home")
+    yo = add_word(Language.YORUBA, "ilé")
+    db.session.flush()
+    create_translation(en, yo)
+    db.session.commit()
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    translation_service.review_llm_translations(db, [row.t_id for row in _pending()], "reject")
+
+    # "ilé" is still translated from "home"; "house" and "ibùgbé" are gone.
+    assert sorted(word.text for word in Word.query) == ["home", "ilé"]
+    assert Sense.query.count() == 2
+    response, status = translation_service.translate(db, "house", Language.ENGLISH, Language.YORUBA, "pytest")
+    assert status == 404
+    assert response["message"] != "Word found but translation not available."
+
+
+def test_review_queue_routes(db_app, llm, monkeypatch):
+    monkeypatch.setenv("ADMIN_API_KEY", "test-key")
+    headers = {"Authorization": "Bearer test-key"}
+    client = db_app.test_client()
+    translation_service.translate_llm("house", Language.ENGLISH, Language.YORUBA)
+
+    assert client.get("/api/admin/review-queue").status_code == 401
+
+    response = client.get("/api/admin/review-queue?per_page=1", headers=headers)
+    data = response.get_json()["data"]
+    assert data["total"] == 2
+    assert [(e["source_word"], e["target_word"]) for e in data["entries"]] == [("house", "ilé")]
+
+    response = client.post(
+        "/api/admin/review-queue",
+        json={"action": "promote", "ids": [data["entries"][0]["id"]]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert client.get("/api/admin/review-queue", headers=headers).get_json()["data"]["total"] == 1
+
+    response = client.post("/api/admin/review-queue", json="action ids", headers=headers)
+    assert response.status_code == 400
@@ -0,0 +1,273 @@
+"""Tests for the buffered missing-translation writer and the events sink."""
+
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+
+import alarino_backend.app as app_module
+import alarino_backend.missing_translations as missing_translations
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.db_models import (
+    MissingTranslation,
+    MissingTranslationDailyCount,
+    MissingTranslationEvent,
+)
+from alarino_backend.languages import Language
+from alarino_backend.missing_translations import (
+    MissingTranslationBuffer,
+    MissingTranslationEventWriter,
+    rollup_missing_translation_events,
+    top_missing_translations,
+)
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+@pytest.fixture
+def buffer(db_app, monkeypatch):
+    # A long interval so only explicit flushes / the threshold write rows.
+    buffer = MissingTranslationBuffer(enabled=True, flush_seconds=60, flush_threshold=1000)
+    monkeypatch.setattr(translation_service, "missing_translation_buffer", buffer)
+    buffer.start(db_app)
+    yield buffer
+    buffer.stop()
+
+
+def _count_writes(fn):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if "missing_translations" in statement:
+            statements.append(statement)
+
+    event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", before_cursor_execute)
+    return result, len(statements)
+
+
+def _miss(text, source=Language.ENGLISH, target=Language.YORUBA):
+    return translation_service.translate(db, text, source, target, "pytest-agent")
+
+
+def _hit_counts():
+    return {
+        (row.text, row.source_language, row.target_language): row.hit_count
+        for row in MissingTranslation.query.all()
+    }
+
+
+def test_misses_are_buffered_not_written_per_request(buffer):
+    (_, status), writes = _count_writes(lambda: [_miss("zzz") for _ in range(5)][-1])
+
+    assert status == 404
+    assert writes == 0
+    assert MissingTranslation.query.count() == 0
+    assert buffer.stats()["depth"] == 1
+    assert buffer.stats()["pending_hits"] == 5
+
+
+def test_flush_writes_all_pending_tuples_in_one_upsert(buffer):
+    for text in ["zzz", "zzz", "qqq"]:
+        _miss(text)
+    _miss("zzz", Language.YORUBA, Language.ENGLISH)
+
+    rows, writes = _count_writes(lambda: buffer.flush(db))
+
+    assert rows == 3
+    assert writes == 1
+    assert _hit_counts() == {("zzz", "en", "yo"): 2, ("qqq", "en", "yo"): 1, ("zzz", "yo", "en"): 1}
+    assert buffer.stats()["depth"] == 0
+
+
+def test_flush_adds_to_existing_counts_and_keeps_first_user_agent(buffer):
+    translation_service.upsert_missing_translations(db, [{
+        "text": "zzz", "source_language": "en", "target_language": "yo",
+        "user_agent": "first-agent", "hit_count": 3,
+    }])
+    _miss("zzz")
+    _miss("zzz")
+    buffer.flush(db)
+
+    row = MissingTranslation.query.one()
+    assert row.hit_count == 5
+    assert row.user_agent == "first-agent"
+
+
+def test_threshold_wakes_the_flusher(db_app, monkeypatch):
+    buffer = MissingTranslationBuffer(enabled=True, flush_seconds=60, flush_threshold=2)
+    monkeypatch.setattr(translation_service, "missing_translation_buffer", buffer)
+    buffer.start(db_app)
+    try:
+        _miss("aaa")
+        _miss("bbb")
+        for _ in range(200):
+            if buffer.flushes:
+                break
+            time.sleep(0.01)
+        assert buffer.flushes == 1
+    finally:
+        buffer.stop()
+    db.session.remove()
+    assert _hit_counts() == {("aaa", "en", "yo"): 1, ("bbb", "en", "yo"): 1}
+
+
+def test_stop_flushes_what_is_left(db_app, buffer):
+    _miss("zzz")
+    buffer.stop()
+
+    assert _hit_counts() == {("zzz", "en", "yo"): 1}
+    assert buffer.running is False
+
+
+def test_failed_flush_keeps_hits_for_next_attempt(buffer, monkeypatch):
+    _miss("zzz")
+    upsert = missing_translations.upsert_missing_translations
+
+    def failing_upsert(db_arg, rows):
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(missing_translations, "upsert_missing_translations", failing_upsert)
+    assert buffer.flush(db) == 0
+    assert buffer.stats()["failed_flushes"] == 1
+    assert buffer.stats()["pending_hits"] == 1
+
+    monkeypatch.setattr(missing_translations, "upsert_missing_translations", upsert)
+    buffer.flush(db)
+    assert _hit_counts() == {("zzz", "en", "yo"): 1}
+
+
+def test_full_buffer_drops_new_tuples_but_counts_known_ones():
+    buffer = MissingTranslationBuffer(enabled=True, max_pending=1)
+    buffer.add("aaa", Language.ENGLISH, Language.YORUBA, "ua")
+    buffer.add("bbb", Language.ENGLISH, Language.YORUBA, "ua")
+    buffer.add("aaa", Language.ENGLISH, Language.YORUBA, "ua")
+
+    stats = buffer.stats()
+    assert stats["depth"] == 1
+    assert stats["pending_hits"] == 2
+    assert stats["dropped_hits"] == 1
+
+
+def test_unstarted_buffer_writes_synchronously(db_app):
+    _miss("zzz")
+    assert _hit_counts() == {("zzz", "en", "yo"): 1}
+
+
+# ---- Events sink ----
+
+
+@pytest.fixture
+def event_writer(db_app, monkeypatch):
+    writer = MissingTranslationEventWriter(enabled=True, flush_seconds=60, batch_size=1000)
+    monkeypatch.setattr(translation_service, "missing_translation_events", writer)
+    writer.start(db_app)
+    yield writer
+    writer.stop()
+
+
+def _add_event(text, requested_at, source="en", target="yo", user_agent="pytest-agent"):
+    db.session.add(MissingTranslationEvent(
+        text=text, source_language=source, target_language=target,
+        user_agent=user_agent, requested_at=requested_at,
+    ))
+
+
+def test_event_sink_queues_without_touching_the_database(event_writer):
+    (_, status), writes = _count_writes(lambda: _miss("zzz"))
+
+    assert status == 404
+    assert writes == 0
+    assert event_writer.stats()["depth"] == 1
+
+
+def test_event_writer_appends_one_row_per_miss(event_writer):
+    _miss("zzz")
+    _miss("zzz")
+    _miss("qqq", Language.YORUBA, Language.ENGLISH)
+
+    assert event_writer.flush(db) == 3
+
+    events = MissingTranslationEvent.query.order_by(MissingTranslationEvent.ev_id).all()
+    assert [(e.text, e.source_language) for e in events] == [("zzz", "en"), ("zzz", "en"), ("qqq", "yo")]
+    # Misses reach missing_translations only through the rollup.
+    assert MissingTranslation.query.count() == 0
+
+
+def test_event_writer_drops_when_queue_is_full():
+    writer = MissingTranslationEventWriter(enabled=True, max_queue=1)
+    writer.add("aaa", Language.ENGLISH, Language.YORUBA, "ua")
+    writer.add("bbb", Language.ENGLISH, Language.YORUBA, "ua")
+
+    assert writer.stats()["depth"] == 1
+    assert writer.stats()["dropped"] == 1
+
+
+def test_rollup_folds_events_into_daily_counts_and_totals(db_app):
+    today = datetime(2026, 5, 4, 12, 0)
+    yesterday = today - timedelta(days=1)
+    _add_event("zzz", yesterday, user_agent="first-agent")
+    _add_event("zzz", today)
+    _add_event("zzz", today)
+    _add_event("qqq", today, source="yo", target="en")
+    db.session.commit()
+
+    assert rollup_missing_translation_events(db, batch_size=3) == 4
+
+    assert MissingTranslationEvent.query.count() == 0
+    daily = {
+        (row.day, row.text, row.source_language): row.hit_count
+        for row in MissingTranslationDailyCount.query.all()
+    }
+    assert daily == {
+        (yesterday.date(), "zzz", "en"): 1,
+        (today.date(), "zzz", "en"): 2,
+        (today.date(), "qqq", "yo"): 1,
+    }
+    assert _hit_counts() == {("zzz", "en", "yo"): 3, ("qqq", "yo", "en"): 1}
+    assert MissingTranslation.query.filter_by(text="zzz").one().user_agent == "first-agent"
+
+
+def test_rollup_adds_to_existing_counts(db_app):
+    day = datetime(2026, 5, 4, 9, 0)
+    _add_event("zzz", day)
+    db.session.commit()
+    rollup_missing_translation_events(db)
+    _add_event("zzz", day)
+    db.session.commit()
+    rollup_missing_translation_events(db)
+
+    assert MissingTranslationDailyCount.query.one().hit_count == 2
+    assert _hit_counts() == {("zzz", "en", "yo"): 2}
+    assert rollup_missing_translation_events(db) == 0
+
+
+def test_top_missing_translations_sums_days_in_window(db_app):
+    today = date.today()
+    db.session.add_all([
+        MissingTranslationDailyCount(day=today, text="aaa", source_language="en", target_language="yo", hit_count=2),
+        MissingTranslationDailyCount(day=today - timedelta(days=3), text="aaa", source_language="en", target_language="yo", hit_count=2),
+        MissingTranslationDailyCount(day=today, text="bbb", source_language="en", target_language="yo", hit_count=3),
+        MissingTranslationDailyCount(day=today - timedelta(days=30), text="ccc", source_language="en", target_language="yo", hit_count=50),
+    ])
+    db.session.commit()
+
+    entries = top_missing_translations(db, today - timedelta(days=6), limit=10)
+
+    assert [(e["text"], e["hit_count"]) for e in entries] == [("aaa", 4), ("bbb", 3)]
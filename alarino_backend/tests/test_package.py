@@ -9,9 +9,15 @@ def test_package_import_succeeds():
 
 def test_data_script_modules_import():
     modules = [
+        "alarino_backend.data.backfill_folded_words",
         "alarino_backend.data.create_tables",
+        "alarino_backend.data.export_lexicon",
+        "alarino_backend.data.fast_seed",
         "alarino_backend.data.generate_sitemap",
         "alarino_backend.data.proverbs_loader",
+        "alarino_backend.data.rebuild_search_index",
+        "alarino_backend.data.rollup_missing_translations",
+        "alarino_backend.data.schedule_daily_words",
         "alarino_backend.data.word_translations_loader",
     ]
 
@@ -0,0 +1,147 @@
+"""Tests for phrase segmentation and /api/translate/phrase."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import MissingTranslation
+from alarino_backend.languages import Language
+from alarino_backend.phrase_segmentation import PhraseSegmenter, Segment, tokenize_phrase
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _translate(yoruba: str, english: str) -> None:
+    yo = add_word(Language.YORUBA, yoruba)
+    en = add_word(Language.ENGLISH, english)
+    db.session.flush()
+    create_translation(yo, en)
+
+
+def _seed():
+    _translate("fi", "put")
+    _translate("fi sílẹ̀", "leave")
+    _translate("ilé", "house")
+    _translate("ilé ìwé", "school")
+    add_word(Language.YORUBA, "ọ̀rẹ́")  # known, but no English translation
+    db.session.commit()
+
+
+def test_tokenize_phrase_normalizes_and_keeps_offsets():
+    assert tokenize_phrase("  Fi SÍLẸ̀, now! ") == [
+        ("fi", 2, 4),
+        ("sílẹ̀", 5, 10),
+        ("now", 12, 15),
+    ]
+    assert tokenize_phrase(" ?! ") == []
+
+
+def test_segment_prefers_longest_known_entry(db_app):
+    _seed()
+    segmenter = PhraseSegmenter()
+
+    tokens = tokenize_phrase("fi ilé ìwé sílẹ̀ lọ")
+    segments = segmenter.segment(db, tokens, Language.YORUBA)
+
+    assert [(s.text, s.known) for s in segments] == [
+        ("fi", True),
+        ("ilé ìwé", True),
+        ("sílẹ̀", False),
+        ("lọ", False),
+    ]
+    assert segments[1] == Segment("ilé ìwé", 3, 10, True)
+
+
+def test_segment_sees_committed_words(db_app):
+    _seed()
+    segmenter = PhraseSegmenter()
+    tokens = tokenize_phrase("ilé ńlá")
+    assert [s.known for s in segmenter.segment(db, tokens, Language.YORUBA)] == [True, False]
+
+    from alarino_backend.lexicon_changes import register_listener, unregister_listener
+    register_listener(segmenter.mark_stale)
+    try:
+        add_word(Language.YORUBA, "ilé ńlá")
+        db.session.commit()
+    finally:
+        unregister_listener(segmenter.mark_stale)
+
+    assert segmenter.segment(db, tokens, Language.YORUBA) == [Segment("ilé ńlá", 0, 7, True)]
+
+
+def test_translate_phrase_aligns_results_with_segments(db_app):
+    _seed()
+
+    response, status = translation_service.translate_phrase(
+        db, "Fi sílẹ̀ ní ilé ìwé, ọ̀rẹ́", Language.YORUBA, Language.ENGLISH, "pytest"
+    )
+
+    assert status == 200
+    segments = response["data"]["segments"]
+    assert [(s["text"], s["known"]) for s in segments] == [
+        ("fi sílẹ̀", True),
+        ("ní", False),
+        ("ilé ìwé", True),
+        ("ọ̀rẹ́", True),
+    ]
+    assert segments[0]["result"]["data"]["translation"] == ["leave"]
+    assert segments[1]["result"] is None
+    assert segments[2]["result"]["data"]["translation"] == ["school"]
+    assert segments[3]["result"]["status"] == 404
+    # Unknown tokens are not demand for a dictionary entry; only the known
+    # word without a translation is recorded.
+    assert [row.text for row in MissingTranslation.query.all()] == ["ọ̀rẹ́"]
+
+
+def test_translate_phrase_query_count_is_independent_of_length(db_app, count_queries):
+    _seed()
+    translation_service.translate_phrase(db, "ilé", Language.YORUBA, Language.ENGLISH, "pytest")
+    translation_service.translation_cache.clear()
+
+    _, short = count_queries(lambda: translation_service.translate_phrase(
+        db, "fi", Language.YORUBA, Language.ENGLISH, "pytest"
+    ))
+    translation_service.translation_cache.clear()
+    _, long = count_queries(lambda: translation_service.translate_phrase(
+        db, "fi ilé fi sílẹ̀ ilé ìwé fi", Language.YORUBA, Language.ENGLISH, "pytest"
+    ))
+
+    assert long == short
+
+
+def test_translate_phrase_rejects_empty_and_oversized_input(db_app, monkeypatch):
+    _, status = translation_service.translate_phrase(db, " . ", Language.YORUBA, Language.ENGLISH, "pytest")
+    assert status == 400
+
+    monkeypatch.setattr(translation_service, "PHRASE_MAX_TOKENS", 2)
+    response, status = translation_service.translate_phrase(
+        db, "fi ilé ìwé", Language.YORUBA, Language.ENGLISH, "pytest"
+    )
+    assert status == 400
+    assert "at most 2" in response["message"]
+
+
+def test_phrase_route_returns_segments(db_app):
+    _seed()
+    client = db_app.test_client()
+
+    response = client.post(
+        "/api/translate/phrase",
+        json={"text": "ilé ìwé", "source_lang": "yo", "target_lang": "en"},
+    )
+
+    assert response.status_code == 200
+    assert response.get_json()["data"]["segments"][0]["result"]["data"]["translation"] == ["school"]
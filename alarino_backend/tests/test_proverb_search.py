@@ -0,0 +1,155 @@
+"""Tests for the in-memory proverb search index and /api/proverbs/search."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_proverb
+from alarino_backend.languages import Language
+from alarino_backend.proverbs import parse_proverb_query, proverb_search_index
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _seed():
+    add_proverb("ile mi ni ile re", "my house is your house")
+    add_proverb("omi tutu ni ile", "cool water is at home")
+    add_proverb("owo ni ile aye", "money is the house of the world")
+    db.session.commit()
+
+
+def _search(q, lang=Language.ENGLISH, page=1, per_page=20):
+    response, status = translation_service.search_proverbs(db, q, lang, page, per_page)
+    return response, status
+
+
+def test_parse_proverb_query_splits_terms_and_phrases():
+    query = parse_proverb_query('Water "my  House" cool "water"')
+
+    assert query.terms == ("water", "cool")
+    assert query.phrases == (("my", "house"),)
+    assert query.required_terms == {"water", "cool", "my", "house"}
+
+
+def test_multi_word_query_requires_every_term(db_app):
+    _seed()
+
+    response, status = _search("house is")
+    assert status == 200
+    assert response["data"]["total"] == 2
+    assert {r["english_text"] for r in response["data"]["results"]} == {
+        "my house is your house",
+        "money is the house of the world",
+    }
+
+    response, _ = _search("house water")
+    assert response["data"]["total"] == 0
+    assert response["data"]["results"] == []
+
+
+def test_phrase_query_matches_consecutive_positions_only(db_app):
+    _seed()
+
+    response, _ = _search('"house is"')
+    assert [r["english_text"] for r in response["data"]["results"]] == ["my house is your house"]
+
+    response, _ = _search('"is house"')
+    assert response["data"]["total"] == 0
+
+
+def test_results_are_ranked_by_relevance(db_app):
+    _seed()
+
+    # "house" appears twice in the first proverb and once in the third.
+    response, _ = _search("house")
+    results = response["data"]["results"]
+    assert [r["english_text"] for r in results] == [
+        "my house is your house",
+        "money is the house of the world",
+    ]
+    assert results[0]["score"] > results[1]["score"]
+
+
+def test_search_is_per_language_and_normalizes_input(db_app):
+    add_proverb("ọmọ mi", "my child")
+    db.session.commit()
+
+    import unicodedata
+
+    response, _ = _search(unicodedata.normalize("NFD", "ỌMỌ"), lang=Language.YORUBA)
+    assert [r["yoruba_text"] for r in response["data"]["results"]] == ["ọmọ mi"]
+
+    response, _ = _search("ọmọ", lang=Language.ENGLISH)
+    assert response["data"]["total"] == 0
+
+
+def test_pagination(db_app):
+    for i in range(5):
+        add_proverb(f"ile {'mi ' * i}".strip(), f"house {'mine ' * i}".strip())
+    db.session.commit()
+
+    first, _ = _search("house", per_page=2)
+    second, _ = _search("house", page=2, per_page=2)
+    last, _ = _search("house", page=3, per_page=2)
+
+    assert first["data"]["total"] == 5
+    pages = [first, second, last]
+    texts = [r["english_text"] for page in pages for r in page["data"]["results"]]
+    assert len(texts) == 5
+    assert len(set(texts)) == 5
+    # Shorter proverbs rank higher at equal term frequency.
+    assert texts[0] == "house"
+
+
+def test_invalid_queries_are_rejected(db_app):
+    assert _search("")[1] == 400
+    assert _search('"" ?!')[1] == 400
+    assert _search("house", page=0)[1] == 400
+    assert _search("house", per_page=translation_service.SEARCH_MAX_PER_PAGE + 1)[1] == 400
+
+
+def test_search_is_served_from_the_index(db_app, count_queries):
+    _seed()
+    _search("house")  # build
+
+    _, queries = count_queries(lambda: _search('"my house" is your'))
+    # max(p_id) freshness check plus one IN query for the page.
+    assert queries == 2
+
+
+def test_index_rebuilds_after_a_committed_proverb(db_app):
+    _seed()
+    _search("house")
+    builds = proverb_search_index.builds
+
+    add_proverb("ile titun", "a new house")
+    db.session.commit()
+
+    response, _ = _search("new house")
+    assert proverb_search_index.builds == builds + 1
+    assert [r["english_text"] for r in response["data"]["results"]] == ["a new house"]
+
+
+def test_proverb_search_route(db_app):
+    _seed()
+    client = db_app.test_client()
+
+    response = client.get("/api/proverbs/search", query_string={"q": '"ile re"', "lang": "yo"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["data"]["total"] == 1
+    assert body["data"]["results"][0]["english_text"] == "my house is your house"
+
+    assert client.get("/api/proverbs/search", query_string={"q": "ile", "lang": "fr"}).status_code == 400
@@ -0,0 +1,128 @@
+"""Tests for random proverb sampling and the proverb of the hour."""
+
+from datetime import datetime
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.db_models import Proverb
+from alarino_backend.proverbs import ProverbSampler, seconds_until_next_hour
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+class _Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def sampler(monkeypatch):
+    sampler = ProverbSampler(now=_Clock(datetime(2026, 3, 1, 9, 15)))
+    monkeypatch.setattr(translation_service, "proverb_sampler", sampler)
+    monkeypatch.setattr(app_module, "proverb_sampler", sampler)
+    return sampler
+
+
+def _seed_proverbs(count: int, start: int = 0) -> list[int]:
+    proverbs = [
+        Proverb(yoruba_text=f"owe {i}", english_text=f"proverb {i}")
+        for i in range(start, start + count)
+    ]
+    db.session.add_all(proverbs)
+    db.session.commit()
+    return [p.p_id for p in proverbs]
+
+
+@pytest.mark.parametrize("count", [1, 50])
+def test_random_proverb_cost_does_not_depend_on_table_size(db_app, sampler, count, count_queries):
+    _seed_proverbs(count)
+    translation_service.get_random_proverb(db)
+    db.session.expire_all()
+
+    (response, status), query_count = count_queries(lambda: translation_service.get_random_proverb(db))
+
+    assert status == 200
+    assert response["data"]["yoruba_text"].startswith("owe ")
+    # max(p_id) freshness check + one primary-key read.
+    assert query_count == 2
+    assert sampler.builds == 1
+
+
+def test_random_proverb_returns_404_when_table_is_empty(db_app, sampler):
+    response, status = translation_service.get_random_proverb(db)
+    assert status == 404
+    assert response["message"] == "No proverbs found in the database."
+
+
+def test_sampler_picks_up_new_proverbs(db_app, sampler):
+    _seed_proverbs(1)
+    sampler.sample(db)
+    (new_id,) = _seed_proverbs(1, start=1)
+
+    sampler.sample(db)
+
+    assert sampler.builds == 2
+    assert new_id in sampler._ids
+
+
+def test_sampler_skips_deleted_proverbs(db_app, sampler):
+    first, second = _seed_proverbs(2)
+    sampler.sample(db)
+    db.session.execute(db.text("DELETE FROM proverbs WHERE p_id = :p_id"), {"p_id": first})
+    db.session.commit()
+    db.session.expire_all()
+
+    assert {sampler.sample(db).p_id for _ in range(10)} == {second}
+
+
+def test_proverb_of_the_hour_is_stable_within_the_hour_and_across_workers(db_app, sampler):
+    _seed_proverbs(20)
+    clock = sampler._now
+    other_worker = ProverbSampler(now=clock)
+
+    first = sampler.of_the_hour(db)
+    assert sampler.of_the_hour(db) == first
+    assert other_worker.of_the_hour(db) == first
+
+    clock.now = datetime(2026, 3, 1, 10, 0)
+    assert sampler.current() is None
+    assert sampler.of_the_hour(db).hour == "2026-03-01T10"
+
+
+def test_seconds_until_next_hour():
+    assert seconds_until_next_hour(datetime(2026, 3, 1, 9, 15)) == 45 * 60
+    assert seconds_until_next_hour(datetime(2026, 3, 1, 9, 59, 59, 900000)) == 1
+
+
+def test_hourly_route_sets_http_caching_headers(db_app, sampler):
+    _seed_proverbs(3)
+    client = db_app.test_client()
+
+    response = client.get("/api/proverb/hourly")
+
+    assert response.status_code == 200
+    assert response.get_json()["message"] == "Proverb of the hour fetched successfully."
+    assert response.cache_control.public is True
+    assert response.cache_control.max_age == 45 * 60
+    etag = response.headers["ETag"]
+    assert etag.startswith('"2026-03-01T09-')
+
+    revalidated = client.get("/api/proverb/hourly", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
@@ -0,0 +1,144 @@
+"""Tests for checkpointed, optionally parallel batch seeding
+(seed_data_utils.upload_data_in_batches)."""
+
+import json
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+import alarino_backend.app as app_module
+from alarino_backend import db
+from alarino_backend.data.proverbs_loader import prepare_proverbs, seed_proverbs_batch
+from alarino_backend.data.seed_data_utils import upload_data_in_batches
+from alarino_backend.data.word_translations_loader import prepare_entries, write_pairs_batch
+from alarino_backend.db_models import Proverb, Translation
+
+
+def _double_odd(batch: list) -> tuple[list, list]:
+    # Module level, so a process pool can run it.
+    return [value * 2 for value in batch if value % 2], [{"value": value} for value in batch if not value % 2]
+
+
+class Recorder:
+    def __init__(self, fail_on_batch=None):
+        self.fail_on_batch = fail_on_batch
+        self.batches = []
+
+    def __call__(self, batch, batch_id):
+        if batch_id == self.fail_on_batch:
+            raise RuntimeError("interrupted")
+        self.batches.append((batch_id, list(batch)))
+        return [{"batch": batch_id}] if batch_id == 1 else []
+
+
+def _upload(tmp_path, entries, upload_func, **kwargs):
+    upload_data_in_batches(
+        entries=entries,
+        upload_func=upload_func,
+        invalid_files_prefix=tmp_path / "invalid" / "batch",
+        batch_size=2,
+        checkpoint_path=tmp_path / "checkpoint.json",
+        **kwargs,
+    )
+
+
+def test_interrupted_run_resumes_after_last_committed_batch(tmp_path):
+    entries = list(range(7))
+    failing = Recorder(fail_on_batch=3)
+    with pytest.raises(RuntimeError):
+        _upload(tmp_path, entries, failing)
+
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert (checkpoint["last_committed_batch"], checkpoint["next_start"]) == (2, 4)
+
+    resumed = Recorder()
+    _upload(tmp_path, entries, resumed)
+
+    assert resumed.batches == [(3, [4, 5]), (4, [6])]
+    assert not (tmp_path / "checkpoint.json").exists()
+    # Batch 1's invalid entries, written before the interruption, are kept.
+    assert json.loads((tmp_path / "invalid" / "batch_all.json").read_text()) == [{"batch": 1}]
+
+
+def test_checkpoint_for_other_data_is_ignored(tmp_path):
+    with pytest.raises(RuntimeError):
+        _upload(tmp_path, list(range(7)), Recorder(fail_on_batch=3))
+
+    rerun = Recorder()
+    _upload(tmp_path, list(range(8)), rerun)
+
+    assert [batch_id for batch_id, _ in rerun.batches] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_prepare_func_runs_before_upload_in_order(tmp_path, workers):
+    recorder = Recorder()
+    _upload(tmp_path, list(range(1, 10)), recorder, prepare_func=_double_odd, workers=workers)
+
+    assert recorder.batches == [(1, [2]), (2, [6]), (3, [10]), (4, [14]), (5, [18])]
+    invalid = json.loads((tmp_path / "invalid" / "batch_all.json").read_text())
+    assert invalid == [{"value": 2}, {"batch": 1}, {"value": 4}, {"value": 6}, {"value": 8}]
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def test_loaders_split_validation_from_writing(db_app, tmp_path):
+    _upload(
+        tmp_path,
+        [
+            {"english_word": "house", "parts_of_speech": ["n"], "yoruba_translations": "ilé, ibùgbé"},
+            {"english_word": "house", "parts_of_speech": ["v"], "yoruba_translations": "ilé"},
+            {"english_word": "car", "parts_of_speech": [], "yoruba_translations": "mọ́tò (ọkọ̀)"},
+        ],
+        lambda pairs, batch_id: write_pairs_batch(pairs, batch_id, db_app),
+        prepare_func=prepare_entries,
+    )
+    assert sorted((t.source_word.text, t.target_word.text) for t in Translation.query) == [
+        ("car", "mọ́tò"), ("house", "ibùgbé"), ("house", "ilé"),
+    ]
+
+    proverbs, invalid = prepare_proverbs([
+        {"yoruba": "Ilé ọba tó jó, ẹwà ló bù kún un.", "english": "The palace that burned gained beauty."},
+        {"yoruba": "", "english": "Missing half."},
+    ])
+    assert [entry["reason"] for entry in invalid] == ["Missing yoruba or english text"]
+    seed_proverbs_batch(proverbs, 1, db_app)
+    assert Proverb.query.count() == 1
+
+
+def test_failed_commit_does_not_advance_checkpoint(db_app, tmp_path, monkeypatch):
+    entries = [
+        {"english_word": "house", "yoruba_translations": "ilé"},
+        {"english_word": "car", "yoruba_translations": "ọkọ̀"},
+        {"english_word": "water", "yoruba_translations": "omi"},
+    ]
+    commit = db.session.commit
+    commits = []
+
+    def flaky_commit():
+        commits.append(1)
+        if len(commits) == 2:
+            raise IntegrityError("INSERT", {}, Exception("duplicate"))
+        commit()
+
+    monkeypatch.setattr(db.session, "commit", flaky_commit)
+    with pytest.raises(IntegrityError):
+        _upload(
+            tmp_path, entries,
+            lambda pairs, batch_id: write_pairs_batch(pairs, batch_id, db_app),
+            prepare_func=prepare_entries,
+        )
+
+    checkpoint = json.loads((tmp_path / "checkpoint.json").read_text())
+    assert (checkpoint["last_committed_batch"], checkpoint["next_start"]) == (1, 2)
@@ -0,0 +1,168 @@
+"""Tests for translate_batch(), the set-based /api/translate/batch service."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import Example, MissingTranslation, Translation
+from alarino_backend.languages import Language
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+def _seed_pairs(pairs):
+    for en_text, yo_text in pairs:
+        en = add_word(Language.ENGLISH, en_text)
+        yo = add_word(Language.YORUBA, yo_text)
+        db.session.flush()
+        # Alternate curation direction so reverse edges are covered too.
+        if len(en_text) % 2:
+            create_translation(en, yo)
+        else:
+            create_translation(yo, en)
+        db.session.flush()
+        t = Translation.query.filter(
+            (Translation.source_word_id == en.w_id) | (Translation.target_word_id == en.w_id)
+        ).one()
+        if t.source_word_id == en.w_id:
+            en_sense, yo_sense = t.source_sense_id, t.target_sense_id
+        else:
+            en_sense, yo_sense = t.target_sense_id, t.source_sense_id
+        db.session.add(Example(
+            source_sense_id=en_sense, target_sense_id=yo_sense,
+            example_source=f"{en_text} example", example_target=f"{yo_text} example",
+        ))
+    db.session.commit()
+
+
+def _item(text, source="en", target="yo"):
+    return {"text": text, "source_lang": source, "target_lang": target}
+
+
+def _translate_batch(items):
+    return translation_service.translate_batch(db, items, "pytest-agent")
+
+
+PAIRS = [("hello", "bawo"), ("child", "ọmọ"), ("water", "omi"), ("house", "ile")]
+
+
+def test_batch_results_match_single_translate(db_app):
+    _seed_pairs(PAIRS)
+    items = [_item(en) for en, _ in PAIRS] + [_item("ọmọ", "yo", "en")]
+
+    expected = [
+        translation_service.translate(
+            db, item["text"], Language(item["source_lang"]), Language(item["target_lang"]), "pytest-agent"
+        )[0]
+        for item in items
+    ]
+    translation_service.translation_cache.clear()
+
+    response, status = _translate_batch(items)
+
+    assert status == 200
+    assert response["data"]["results"] == expected
+
+
+@pytest.mark.parametrize("size", [1, 4])
+def test_batch_query_count_is_independent_of_size(db_app, size, count_queries):
+    _seed_pairs(PAIRS)
+    items = [_item(en) for en, _ in PAIRS[:size]]
+
+    (response, status), query_count = count_queries(lambda: _translate_batch(items))
+
+    assert status == 200
+    assert all(result["status"] == 200 for result in response["data"]["results"])
+    assert all(
+        result["data"]["senses"][0]["translations"][0]["examples"]
+        for result in response["data"]["results"]
+    )
+    # Words + eager-joined edges + examples, for the whole batch.
+    assert query_count == 3
+
+
+def test_batch_reports_per_item_errors_in_order(db_app):
+    _seed_pairs(PAIRS[:1])
+    items = [
+        _item("hello"),
+        {"text": "hello"},
+        _item("hello", "xx", "yo"),
+        _item("   "),
+        _item("missing"),
+    ]
+
+    response, status = _translate_batch(items)
+
+    assert status == 200
+    results = response["data"]["results"]
+    assert [r["status"] for r in results] == [200, 400, 400, 400, 404]
+    assert [r["message"] for r in results[1:]] == [
+        "Invalid request body.",
+        "Unsupported language.",
+        "Text must not be empty.",
+        "Word not found.",
+    ]
+    assert MissingTranslation.query.filter_by(text="missing").one().hit_count == 1
+
+
+def test_batch_resolves_duplicate_items_once(db_app):
+    _seed_pairs(PAIRS[:1])
+
+    response, _ = _translate_batch([_item("hello"), _item(" Hello "), _item("nope"), _item("nope")])
+
+    results = response["data"]["results"]
+    assert results[0] == results[1]
+    assert results[2] == results[3]
+    assert MissingTranslation.query.filter_by(text="nope").one().hit_count == 1
+
+
+@pytest.mark.parametrize("misses", [1, 5])
+def test_batch_miss_query_count_is_independent_of_misses(db_app, misses, count_queries):
+    _seed_pairs(PAIRS)
+    # "omo" (no diacritics) gets a candidate; the rest are recorded as missing.
+    items = [_item("omo", "yo", "en")] + [_item(f"unknown{i}") for i in range(misses)]
+    translation_service.fuzzy_word_matcher.lookup(db, "warmup", Language.ENGLISH)
+
+    (response, status), query_count = count_queries(lambda: _translate_batch(items))
+
+    results = response["data"]["results"]
+    assert results[0]["data"]["candidates"] == [{"text": "ọmọ", "translation_count": 1}]
+    assert [r["status"] for r in results[1:]] == [404] * misses
+    # Words, then one diacritic candidate query and one missing upsert.
+    assert query_count == 3
+    assert {row.text: row.hit_count for row in MissingTranslation.query} == {
+        f"unknown{i}": 1 for i in range(misses)
+    }
+
+
+def test_batch_serves_cached_items_without_queries(db_app, count_queries):
+    _seed_pairs(PAIRS)
+    items = [_item(en) for en, _ in PAIRS]
+    _translate_batch(items)
+
+    (response, _), query_count = count_queries(lambda: _translate_batch(items))
+
+    assert all(result["status"] == 200 for result in response["data"]["results"])
+    assert query_count == 0
+
+
+def test_batch_rejects_oversized_request(db_app, monkeypatch):
+    monkeypatch.setattr(translation_service, "TRANSLATE_BATCH_MAX_ITEMS", 2)
+
+    response, status = _translate_batch([_item("a"), _item("b"), _item("c")])
+
+    assert status == 400
+    assert response["message"] == "A batch may contain at most 2 items."
@@ -0,0 +1,192 @@
+"""Tests for the read-through /api/translate cache and its commit-driven
+invalidation."""
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.languages import Language
+from alarino_backend.response import TranslationResponseData
+from alarino_backend.translation_cache import TranslationCache, translation_cache
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _data(word: str) -> TranslationResponseData:
+    return TranslationResponseData(translation=[word], source_word="x", to_language=Language.YORUBA)
+
+
+def _key(text: str) -> tuple:
+    return TranslationCache.key(text, Language.ENGLISH, Language.YORUBA)
+
+
+# ---- TranslationCache unit behavior ----
+
+
+def test_cache_evicts_least_recently_used_entry():
+    cache = TranslationCache(max_entries=2, ttl_seconds=60)
+    cache.put(_key("a"), _data("a"))
+    cache.put(_key("b"), _data("b"))
+    assert cache.get(_key("a")) is not None  # "a" is now most recently used
+    cache.put(_key("c"), _data("c"))
+
+    assert cache.get(_key("b")) is None
+    assert cache.get(_key("a")) is not None
+    assert cache.get(_key("c")) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = TranslationCache(max_entries=10, ttl_seconds=5, clock=clock)
+    cache.put(_key("a"), _data("a"))
+
+    clock.now = 4.9
+    assert cache.get(_key("a")) is not None
+    clock.now = 5.0
+    assert cache.get(_key("a")) is None
+    assert cache.stats()["size"] == 0
+
+
+def test_cache_counts_hits_and_misses():
+    cache = TranslationCache(max_entries=10, ttl_seconds=60)
+    cache.get(_key("a"))
+    cache.put(_key("a"), _data("a"))
+    cache.get(_key("a"))
+    cache.get(_key("a"))
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+
+
+def test_cache_disabled_when_max_entries_is_zero():
+    cache = TranslationCache(max_entries=0, ttl_seconds=60)
+    cache.put(_key("a"), _data("a"))
+    assert cache.get(_key("a")) is None
+
+
+def test_invalidate_words_drops_every_target_for_the_source_text():
+    cache = TranslationCache(max_entries=10, ttl_seconds=60)
+    cache.put(_key("hello"), _data("bawo"))
+    cache.put(TranslationCache.key("hello", Language.ENGLISH, Language.ENGLISH), _data("hi"))
+    cache.put(_key("house"), _data("ile"))
+
+    cache.invalidate_words({(Language.ENGLISH, "hello")})
+
+    assert cache.get(_key("hello")) is None
+    assert cache.get(_key("house")) is not None
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_put_with_stale_generation_is_ignored():
+    cache = TranslationCache(max_entries=10, ttl_seconds=60)
+    generation = cache.generation
+    cache.invalidate_words({(Language.ENGLISH, "hello")})
+
+    cache.put(_key("hello"), _data("bawo"), generation)
+
+    assert cache.get(_key("hello")) is None
+
+
+# ---- translate() integration ----
+
+
+def _translate(text: str, source=Language.ENGLISH, target=Language.YORUBA):
+    return translation_service.translate(db, text, source, target, "pytest-agent")
+
+
+def _seed_pair(en_text: str, yo_text: str):
+    en = add_word(Language.ENGLISH, en_text)
+    yo = add_word(Language.YORUBA, yo_text)
+    db.session.flush()
+    create_translation(en, yo)
+    db.session.commit()
+    return en, yo
+
+
+def test_repeated_translate_is_served_from_cache_without_queries(db_app, count_queries):
+    _seed_pair("hello", "bawo")
+    first, status = _translate("hello")
+    assert status == 200
+
+    (second, status), query_count = count_queries(lambda: _translate(" HELLO "))
+
+    assert status == 200
+    assert second == first
+    assert query_count == 0
+
+
+def test_misses_are_not_cached(db_app):
+    _translate("hello")
+    _seed_pair("hello", "bawo")
+
+    response, status = _translate("hello")
+    assert status == 200
+    assert response["data"]["translation"] == ["bawo"]
+
+
+def test_create_translation_commit_invalidates_both_words(db_app):
+    en, _ = _seed_pair("child", "ọmọ")
+    _translate("child")
+    _translate("ọmọ", Language.YORUBA, Language.ENGLISH)
+    assert translation_cache.stats()["size"] == 2
+
+    egbon = add_word(Language.YORUBA, "ẹgbọn")
+    db.session.flush()
+    create_translation(en, egbon)
+    db.session.commit()
+
+    response, status = _translate("child")
+    assert sorted(response["data"]["translation"]) == sorted(["ọmọ", "ẹgbọn"])
+    # The unrelated reverse lookup stays cached.
+    assert translation_cache.get(
+        TranslationCache.key("ọmọ", Language.YORUBA, Language.ENGLISH)
+    ) is not None
+
+
+def test_rolled_back_write_does_not_invalidate(db_app):
+    en, _ = _seed_pair("child", "ọmọ")
+    _translate("child")
+    invalidations = translation_cache.stats()["invalidations"]
+
+    egbon = add_word(Language.YORUBA, "ẹgbọn")
+    db.session.flush()
+    create_translation(en, egbon)
+    db.session.rollback()
+
+    assert translation_cache.stats()["invalidations"] == invalidations
+    assert translation_cache.get(
+        TranslationCache.key("child", Language.ENGLISH, Language.YORUBA)
+    ) is not None
+
+
+def test_bulk_upload_invalidates_affected_words(db_app):
+    _seed_pair("hello", "bawo")
+    _translate("hello")
+
+    translation_service.bulk_upload_words(db, "hello,pele", dry_run=False)
+
+    response, status = _translate("hello")
+    assert sorted(response["data"]["translation"]) == sorted(["bawo", "pele"])
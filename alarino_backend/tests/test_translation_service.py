@@ -63,8 +63,11 @@ def test_translate_logs_missing_word_when_source_word_does_not_exist(monkeypatch
     )
     monkeypatch.setattr(
         translation_service,
-        "log_missing_translation",
-        lambda *args: missing_logs.append(args),
+        "log_missing_translations",
+        lambda db, keys, user_agent: missing_logs.extend((db, *key, user_agent) for key in keys),
+    )
+    monkeypatch.setattr(
+        translation_service, "find_diacritic_candidates", lambda db, keys: {key: [] for key in keys}
     )
 
     response, status = translation_service.translate(
@@ -442,3 +445,99 @@ def test_get_sitemap_words_dedupes_words_with_multiple_translations(db_app):
 
     assert status == 200
     assert response["data"]["words"] == ["child"]
+
+
+# ---- Query budget: translate() is a fixed number of round trips ----
+
+
+def _seed_word_with_translations(en_text: str, yo_texts: list[str], examples_per_pair: int):
+    from alarino_backend.data.seed_data_utils import create_translation
+    from alarino_backend.db_models import Example, Translation
+
+    en = Word(language="en", text=en_text)
+    db.session.add(en)
+    for yo_text in yo_texts:
+        yo = Word(language="yo", text=yo_text)
+        db.session.add(yo)
+        db.session.flush()
+        # Alternate curation direction so both sides of the bidirectional
+        # lookup are exercised.
+        if len(yo_text) % 2:
+            create_translation(en, yo)
+        else:
+            create_translation(yo, en)
+    db.session.flush()
+    for t in Translation.query.all():
+        # Examples are keyed from the looked-up (English) side.
+        if t.source_word_id == en.w_id:
+            pair = (t.source_sense_id, t.target_sense_id)
+        else:
+            pair = (t.target_sense_id, t.source_sense_id)
+        for i in range(examples_per_pair):
+            db.session.add(
+                Example(
+                    source_sense_id=pair[0],
+                    target_sense_id=pair[1],
+                    example_source=f"source {t.t_id} {i}",
+                    example_target=f"target {t.t_id} {i}",
+                )
+            )
+    db.session.commit()
+    db.session.expire_all()
+
+
+@pytest.mark.parametrize(
+    "yo_texts, examples_per_pair",
+    [
+        (["bawo"], 0),
+        (["bawo"], 1),
+        (["bawo", "pele", "ekaabo", "eku", "ewo", "ise", "ile", "omi", "oja", "ona"], 5),
+    ],
+)
+def test_translate_query_count_is_constant(db_app, yo_texts, examples_per_pair, count_queries):
+    _seed_word_with_translations("hello", yo_texts, examples_per_pair)
+
+    (response, status), query_count = count_queries(
+        lambda: translation_service.translate(
+            db, "hello", Language.ENGLISH, Language.YORUBA, "pytest-agent"
+        )
+    )
+
+    assert status == 200
+    assert sorted(response["data"]["translation"]) == sorted(yo_texts)
+    translations = response["data"]["senses"][0]["translations"]
+    assert all(len(t["examples"]) == examples_per_pair for t in translations)
+    # Word lookup + eager-joined edges + one examples query.
+    assert query_count == 3
+
+
+def test_translate_surfaces_examples_for_reverse_direction_sense_pair(db_app):
+    # Examples are keyed by (looked-up sense, other sense). A yo→en lookup of
+    # an en→yo curated edge matches examples stored under the reversed pair.
+    from alarino_backend.db_models import Example, Translation
+
+    _seed_one_directional_pair("hello", "bawo")
+    t = Translation.query.one()
+    db.session.add_all([
+        Example(
+            source_sense_id=t.source_sense_id,
+            target_sense_id=t.target_sense_id,
+            example_source="Hello there",
+            example_target="Bawo nibe",
+        ),
+        Example(
+            source_sense_id=t.target_sense_id,
+            target_sense_id=t.source_sense_id,
+            example_source="Bawo ni",
+            example_target="How are you",
+        ),
+    ])
+    db.session.commit()
+
+    response, status = translation_service.translate(
+        db, "bawo", Language.YORUBA, Language.ENGLISH, "pytest-agent"
+    )
+    assert status == 200
+    assert response["data"]["senses"][0]["translations"][0]["examples"] == [
+        {"source": "Bawo ni", "target": "How are you"}
+    ]
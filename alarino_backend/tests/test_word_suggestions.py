@@ -0,0 +1,240 @@
+"""Tests for prefix autocomplete (/api/suggest)."""
+
+import threading
+
+import pytest
+
+import alarino_backend.app as app_module
+import alarino_backend.translation_service as translation_service
+import alarino_backend.word_suggestions as word_suggestions
+from alarino_backend import db
+from alarino_backend.data.seed_data_utils import add_word, create_translation
+from alarino_backend.db_models import MissingTranslation, Word
+from alarino_backend.languages import Language
+from alarino_backend.lexicon_changes import register_listener, unregister_listener
+from alarino_backend.word_suggestions import FuzzyWordMatcher, Suggestion, WordSuggester, edit_distance
+
+
+@pytest.fixture
+def db_app():
+    app = app_module.create_app()
+    app.config["TESTING"] = True
+    with app.app_context():
+        db.create_all()
+        try:
+            yield app
+        finally:
+            db.session.remove()
+            db.drop_all()
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _translate(english: str, *yoruba: str) -> None:
+    en = add_word(Language.ENGLISH, english)
+    for text in yoruba:
+        yo = add_word(Language.YORUBA, text)
+        db.session.flush()
+        create_translation(en, yo)
+
+
+def _seed():
+    _translate("house", "ilé", "ibùgbé")
+    _translate("home", "ilé")
+    _translate("horse", "ẹṣin")
+    add_word(Language.ENGLISH, "hose")
+    add_word(Language.ENGLISH, "hot")
+    db.session.add(MissingTranslation(text="hot", source_language="en", target_language="yo", hit_count=30))
+    db.session.commit()
+
+
+def test_suggestions_rank_by_translations_then_demand(db_app):
+    _seed()
+
+    suggestions = word_suggestions.word_suggester.suggest(db, "ho", Language.ENGLISH, 10)
+
+    assert suggestions == [
+        Suggestion("hot", 0, 30),  # log1p(30) ≈ 3.4 beats two translations
+        Suggestion("house", 2, 0),
+        Suggestion("home", 1, 0),
+        Suggestion("horse", 1, 0),
+        Suggestion("hose", 0, 0),
+    ]
+
+
+def test_long_and_short_prefixes_agree(db_app):
+    _seed()
+    suggester = word_suggestions.word_suggester
+
+    assert [s.text for s in suggester.suggest(db, "hou", Language.ENGLISH, 10)] == ["house"]
+    assert [s.text for s in suggester.suggest(db, "hor", Language.ENGLISH, 10)] == ["horse"]
+    assert [s.text for s in suggester.suggest(db, "h", Language.ENGLISH, 2)] == ["hot", "house"]
+    assert suggester.suggest(db, "x", Language.ENGLISH, 10) == []
+    assert suggester.suggest(db, "ile", Language.ENGLISH, 10) == []
+    assert [s.text for s in suggester.suggest(db, "i", Language.YORUBA, 10)] == ["ilé", "ibùgbé"]
+
+
+def test_background_rebuild_keeps_serving_previous_index(db_app):
+    _seed()
+    suggester = WordSuggester(clock=_Clock(), background=True)
+    suggester.suggest(db, "ho", Language.ENGLISH, 5)
+    assert suggester.builds == 1  # the first build is inline
+
+    release = threading.Event()
+    build = suggester._build
+
+    def slow_build(db):
+        release.wait(timeout=5)
+        build(db)
+
+    suggester._build = slow_build
+    add_word(Language.ENGLISH, "hold")
+    db.session.commit()
+    suggester.mark_stale()
+
+    assert suggester.suggest(db, "hol", Language.ENGLISH, 5) == []
+    release.set()
+    suggester._builder.join(timeout=5)
+    assert [s.text for s in suggester.suggest(db, "hol", Language.ENGLISH, 5)] == ["hold"]
+    assert suggester.builds == 2
+
+
+def test_suggest_does_no_queries_when_fresh(db_app, count_queries):
+    _seed()
+    suggester = WordSuggester(clock=_Clock())
+    suggester.suggest(db, "ho", Language.ENGLISH, 5)
+
+    _, queries = count_queries(lambda: suggester.suggest(db, "hou", Language.ENGLISH, 5))
+    assert queries == 0
+
+
+def test_rebuilds_on_word_commit_fingerprint_and_age(db_app):
+    _seed()
+    clock = _Clock()
+    suggester = WordSuggester(clock=clock)
+    suggester.suggest(db, "ho", Language.ENGLISH, 5)
+    assert suggester.builds == 1
+
+    # A word committed by this worker: the lexicon_changes listener.
+    register_listener(suggester.mark_stale)
+    try:
+        add_word(Language.ENGLISH, "hold")
+        db.session.commit()
+    finally:
+        unregister_listener(suggester.mark_stale)
+    assert [s.text for s in suggester.suggest(db, "hol", Language.ENGLISH, 5)] == ["hold"]
+    assert suggester.builds == 2
+
+    # Another worker's write is only noticed once the check interval passes.
+    db.session.execute(Word.__table__.insert().values(language="en", text="holy"))
+    db.session.commit()
+    assert [s.text for s in suggester.suggest(db, "hol", Language.ENGLISH, 5)] == ["hold"]
+    clock.now += word_suggestions.SUGGEST_CHECK_SECONDS
+    assert [s.text for s in suggester.suggest(db, "hol", Language.ENGLISH, 5)] == ["hold", "holy"]
+    assert suggester.builds == 3
+
+    # Demand changes don't move the fingerprint; the age limit catches them.
+    MissingTranslation.query.filter_by(text="hot").update({"hit_count": 0})
+    db.session.commit()
+    clock.now += word_suggestions.SUGGEST_MAX_AGE_SECONDS
+    assert suggester.suggest(db, "hot", Language.ENGLISH, 5) == [Suggestion("hot", 0, 0)]
+    assert suggester.builds == 4
+
+
+def test_suggest_words_validates_input(db_app):
+    _seed()
+
+    response, status = translation_service.suggest_words(db, "  HOU ", Language.ENGLISH, 5)
+    assert status == 200
+    assert response["data"]["prefix"] == "hou"
+    assert response["data"]["suggestions"] == [{"text": "house", "translations": 2, "demand": 0}]
+
+    assert translation_service.suggest_words(db, " ", Language.ENGLISH, 5)[1] == 400
+    assert translation_service.suggest_words(db, "ho", Language.ENGLISH, 0)[1] == 400
+    assert translation_service.suggest_words(
+        db, "ho", Language.ENGLISH, word_suggestions.SUGGEST_MAX_LIMIT + 1
+    )[1] == 400
+
+
+def test_suggest_route(db_app):
+    _seed()
+    client = db_app.test_client()
+
+    response = client.get("/api/suggest", query_string={"prefix": "ib", "lang": "yo"})
+    assert response.status_code == 200
+    assert [s["text"] for s in response.get_json()["data"]["suggestions"]] == ["ibùgbé"]
+
+    assert client.get("/api/suggest", query_string={"prefix": "ho", "lang": "fr"}).status_code == 400
+
+
+def test_edit_distance_counts_transpositions_and_cuts_off():
+    assert edit_distance("house", "house", 2) == 0
+    assert edit_distance("house", "hous", 2) == 1
+    assert edit_distance("house", "hosue", 2) == 1
+    assert edit_distance("house", "mouse", 2) == 1
+    assert edit_distance("house", "hat", 2) == 3
+    assert edit_distance("a", "abcdef", 2) == 3
+
+
+def test_fuzzy_lookup_ranks_by_distance_then_translations(db_app):
+    _seed()
+    matcher = FuzzyWordMatcher()
+
+    assert matcher.lookup(db, "hoose", Language.ENGLISH) == [
+        {"text": "house", "distance": 1, "translation_count": 2},
+        {"text": "horse", "distance": 1, "translation_count": 1},
+        {"text": "home", "distance": 2, "translation_count": 1},
+    ]
+    # Untranslated words ("hose", "hot") are never suggested.
+    assert [m["text"] for m in matcher.lookup(db, "hme", Language.ENGLISH)] == ["home"]
+    assert matcher.lookup(db, "zzzzzz", Language.ENGLISH) == []
+
+
+def test_fuzzy_lookup_ignores_diacritics_and_long_suffixes(db_app):
+    _seed()
+    _translate("internationalization", "àgbáyé")
+    db.session.commit()
+    matcher = FuzzyWordMatcher(prefix_length=7)
+
+    assert [m["text"] for m in matcher.lookup(db, "ẹsn", Language.YORUBA)] == ["ẹṣin"]
+    assert [m["text"] for m in matcher.lookup(db, "internationalisation", Language.ENGLISH)] == [
+        "internationalization"
+    ]
+
+
+def test_fuzzy_lookup_stops_at_the_time_budget(db_app):
+    _seed()
+    ticks = iter(range(100))
+    matcher = FuzzyWordMatcher(budget_ms=0.5, timer=lambda: next(ticks) / 1000)
+
+    assert len(matcher.lookup(db, "hoose", Language.ENGLISH)) <= 1
+    assert matcher.stats()["over_budget"] == 1
+
+
+def test_translate_miss_includes_did_you_mean(db_app):
+    _seed()
+
+    response, status = translation_service.translate(db, "hoose", Language.ENGLISH, Language.YORUBA, "pytest")
+
+    assert status == 404
+    assert response["message"] == "Word not found."
+    assert [s["text"] for s in response["data"]["suggestions"]] == ["house", "horse", "home"]
+    assert response["data"]["candidates"] == []
+    # A fuzzy guess is not a known word: the miss is still recorded.
+    assert MissingTranslation.query.filter_by(text="hoose").one().hit_count == 1
+
+
+def test_fuzzy_background_build_serves_nothing_until_ready(db_app):
+    _seed()
+    matcher = FuzzyWordMatcher(background=True)
+
+    assert matcher.lookup(db, "hoose", Language.ENGLISH) == []
+    matcher._builder.join(timeout=5)
+    assert [m["text"] for m in matcher.lookup(db, "hoose", Language.ENGLISH)] == ["house", "horse", "home"]
+    assert matcher.builds == 1